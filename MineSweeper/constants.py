@@ -13,19 +13,26 @@ __author_name__    = "Mark Sattolo"
 __author_email__   = "epistemik@gmail.com"
 __python_version__ = "3.10+"
 __created__ = "2025-11-12"
-__updated__ = "2025-11-25"
+__updated__ = "2026-10-18"
 
 from enum import IntEnum
-from PySide6.QtGui import QImage, QColor
+from functools import cache
+from PySide6.QtGui import QPixmap, QColor
 
-IMG_MINE         = QImage("images/bug.png")
-IMG_FLAG         = QImage("images/bomb.png")
-IMG_BAD_FLAG     = QImage("images/mushroom.png")
-IMG_MISSING_FLAG = QImage("images/hamburger.png")
-IMG_START        = QImage("images/ice-cream-sprinkles.png")
-IMG_PLAY         = QImage("images/fruit.png")
-IMG_WIN          = QImage("images/cake.png")
-IMG_LOSE         = QImage("images/cactus.png")
+# image files are only read when first drawn, see get_pixmap()
+IMG_MINE         = "images/bug.png"
+IMG_FLAG         = "images/bomb.png"
+IMG_BAD_FLAG     = "images/mushroom.png"
+IMG_MISSING_FLAG = "images/hamburger.png"
+IMG_START        = "images/ice-cream-sprinkles.png"
+IMG_PLAY         = "images/fruit.png"
+IMG_WIN          = "images/cake.png"
+IMG_LOSE         = "images/cactus.png"
+
+@cache
+def get_pixmap(p_image:str) -> QPixmap:
+    """Load an image the first time it is needed, then share it."""
+    return QPixmap(p_image)
 
 # for number of adjacent mines
 SQUARE_COLORS = {
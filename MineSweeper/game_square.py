@@ -13,10 +13,10 @@ __author_name__    = "Mark Sattolo"
 __author_email__   = "epistemik@gmail.com"
 __python_version__ = "3.10+"
 __created__ = "2025-11-12"
-__updated__ = "2025-12-12"
+__updated__ = "2026-10-18"
 
 from PySide6.QtCore import QSize, Qt, Signal
-from PySide6.QtGui import QBrush, QPainter, QPalette, QPen, QPixmap
+from PySide6.QtGui import QBrush, QPainter, QPalette, QPen
 from PySide6.QtWidgets import QWidget, QMainWindow
 from constants import *
 
@@ -67,16 +67,16 @@ class GameSquare(QWidget):
 
         if self.is_revealed:
             if self.is_start:
-                pntr.drawPixmap(rect, QPixmap(IMG_START))
+                pntr.drawPixmap(rect, get_pixmap(IMG_START))
 
             elif self.bad_flag:
-                pntr.drawPixmap(rect, QPixmap(IMG_BAD_FLAG))
+                pntr.drawPixmap(rect, get_pixmap(IMG_BAD_FLAG))
 
             elif self.missing_flag:
-                pntr.drawPixmap(rect, QPixmap(IMG_MISSING_FLAG))
+                pntr.drawPixmap(rect, get_pixmap(IMG_MISSING_FLAG))
 
             elif self.is_mine:
-                pntr.drawPixmap(rect, QPixmap(IMG_MINE))
+                pntr.drawPixmap(rect, get_pixmap(IMG_MINE))
 
             elif self.num_adjacent > 0:
                 pen = QPen(SQUARE_COLORS[self.num_adjacent])
@@ -88,7 +88,7 @@ class GameSquare(QWidget):
                 pntr.drawText(rect, Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignVCenter, str(self.num_adjacent))
 
         elif self.is_flagged:
-            pntr.drawPixmap(rect, QPixmap(IMG_FLAG))
+            pntr.drawPixmap(rect, get_pixmap(IMG_FLAG))
 
     def flag(self):
         """Set a new flag or remove the existing flag from this square."""
@@ -10,10 +10,13 @@ __author_name__    = "Mark Sattolo"
 __author_email__   = "epistemik@gmail.com"
 __python_version__ = "3.10+"
 __created__ = "2025-11-13"
-__updated__ = "2025-12-11"
+__updated__ = "2026-10-18"
 
 import sys
-from main_window import log_control, DEFAULT_GRID_LEN, DEFAULT_NUM_MINES, QApplication, MineSweeperUI
+sys.path.append("/home/marksa/git/Python/Games/common")
+from startupProfile import mark, phase, profile_imports
+profile_imports()
+from main_window import log_control, DEFAULT_GRID_LEN, DEFAULT_NUM_MINES, QApplication, QTimer, MineSweeperUI
 
 if __name__ == "__main__":
     log_control.debug(f"sys.argv = {sys.argv}")
@@ -27,9 +30,12 @@ if __name__ == "__main__":
     app = None
     code = 0
     try:
-        app = QApplication(sys.argv)
-        window = MineSweeperUI(grid_len, num_mines)
-        app.exec()
+        with phase("create QApplication"):
+            app = QApplication(sys.argv)
+        with phase("create main window"):
+            window = MineSweeperUI(grid_len, num_mines)
+        QTimer.singleShot(0, lambda: mark("first paint"))
+        code = app.exec()
     except KeyboardInterrupt as mki:
         log_control.exception(mki)
         code = 13
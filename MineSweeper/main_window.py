@@ -13,7 +13,7 @@ __author_name__    = "Mark Sattolo"
 __author_email__   = "epistemik@gmail.com"
 __python_version__ = "3.10+"
 __created__ = "2025-11-12"
-__updated__ = "2026-02-24"
+__updated__ = "2026-10-18"
 
 import random
 import time
@@ -21,7 +21,7 @@ from sys import path, argv
 path.append("/home/marksa/git/Python/utils")
 from mhsLogging import *
 from PySide6.QtCore import QSize, Qt, QTimer
-from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QApplication, QGridLayout, QHBoxLayout, QLabel, QMainWindow, QPushButton, QVBoxLayout, QWidget
 from constants import *
 from game_square import GameSquare
@@ -74,7 +74,7 @@ class MineSweeperUI(QMainWindow):
         timer.start(1000) # update each 1 second
 
         mine_pic = QLabel()
-        mine_pic.setPixmap(QPixmap.fromImage(IMG_MINE))
+        mine_pic.setPixmap(get_pixmap(IMG_MINE))
         mine_pic.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
 
         self.result = QLabel()
@@ -120,7 +120,7 @@ class MineSweeperUI(QMainWindow):
         self.lgr.info(f"grid size = {self.grid_size}, num mines = {self.num_mines}, empty squares = {self.total_empty}")
         self.mine_counter.setText("{:^3}".format(self.num_mines))
         self.clock.setText("0")
-        self.result.setPixmap(QPixmap.fromImage(IMG_PLAY))
+        self.result.setPixmap(get_pixmap(IMG_PLAY))
 
     def init_map(self):
         """Add GameSquares to the map"""
@@ -239,13 +239,13 @@ class MineSweeperUI(QMainWindow):
 
     def game_loss(self):
         self.update_status(Status.FAILED)
-        self.result.setPixmap(QPixmap.fromImage(IMG_LOSE))
+        self.result.setPixmap(get_pixmap(IMG_LOSE))
         self.reveal_map()
         self.lgr.info("FAILED :( \n\n")
 
     def game_win(self):
         self.update_status(Status.SUCCESS)
-        self.result.setPixmap(QPixmap.fromImage(IMG_WIN))
+        self.result.setPixmap(get_pixmap(IMG_WIN))
         self.lgr.info("Victory!")
 # END class MineSweeperUI
 
@@ -10,22 +10,35 @@ __author_name__    = "Mark Sattolo"
 __author_email__   = "epistemik@gmail.com"
 __python_version__ = "3.10+"
 __created__ = "2025-11-08"
-__updated__ = "2026-05-26"
+__updated__ = "2026-10-18"
 
+from sys import path
+path.append("/home/marksa/git/Python/Games/common")
+from startupProfile import phase, profile_imports, PROFILE_OPTION
+profile_imports()
 from spellingbeePyside6_UI import *
 
 if __name__ == "__main__":
-    if len(argv) > 1:
-        print(f"Usage: python3 {get_filename(argv[0])}\nLaunch the SpellingBee game.")
+    if len(argv) > 2 or (len(argv) == 2 and not (argv[1].isalpha() or argv[1].isdigit())):
+        print(f"Usage: python3 {get_filename(argv[0])} [$letters | $hive_size] [{PROFILE_OPTION}]\nLaunch the SpellingBee game."
+              f"\n  $letters = {MIN_PANGRAM_LENGTH} to {MAX_PANGRAM_LENGTH} different letters to play:"
+              " the REQUIRED letter first, then the outer letters."
+              f"\n  $hive_size = number of letters in each puzzle, from {MIN_PANGRAM_LENGTH} to {MAX_PANGRAM_LENGTH}"
+              f" (default = {PANGRAM_LENGTH}).\n  {PROFILE_OPTION} = report the time taken by each import and start-up phase.")
         log_control.debug("Usage instructions.")
         exit(0)
     window = None
     app = None
     code = 0
     try:
-        app = QApplication(argv)
-        window = SpellingBeeUI()
-        app.exec()
+        with phase("create QApplication"):
+            app = QApplication(argv)
+        with phase("create main window"):
+            if len(argv) > 1 and argv[1].isdigit():
+                window = SpellingBeeUI(p_size = int(argv[1]))
+            else:
+                window = SpellingBeeUI(argv[1] if len(argv) > 1 else "")
+        code = app.exec()
     except KeyboardInterrupt as mki:
         log_control.exception(mki)
         code = 13
@@ -10,22 +10,49 @@ __author_name__    = "Mark Sattolo"
 __author_email__   = "epistemik@gmail.com"
 __python_version__ = "3.10+"
 __created__ = "2025-08-18"
-__updated__ = "2026-07-23"
+__updated__ = "2026-10-18"
 
 import random
 from sys import path
+from threading import Lock
 path.append("/home/marksa/git/Python/utils")
 from mhsUtils import *
 from mhsLogging import *
 from enum import Enum
-path.append("/home/marksa/git/Python/Games/input")
-from all_words import all_game_words as sb_words
+path.append("/home/marksa/git/Python/Games/common")
+from wordCorpus import WordTag
+from corpusBuilder import load_game_words
+from wordIndex import get_word_index
+from letterMasks import get_mask_index, letter_mask, OTHER_BIT
+from pangramCatalog import get_pangram_catalog
+from puzzleIndex import MIN_WORD_LENGTH, get_puzzle_index, get_word_points
+from targetPicker import get_target_picker, get_word_weights
+from morphology import get_morphology
 
-MIN_WORD_LENGTH = 4
 MAX_WORD_LENGTH = 21
+MIN_PANGRAM_LENGTH = 5
 PANGRAM_LENGTH = 7
+MAX_PANGRAM_LENGTH = 9
 SBGE_DEBUG = True
 
+# the words and their indexes are loaded on first use, possibly by a background thread
+sb_words = None
+sb_index = None
+sb_masks = None
+sb_morphology = None
+_load_lock = Lock()
+
+def load_word_data():
+    """Load the SpellingBee words and indexes once >> blocks until done if another thread is loading them."""
+    global sb_words, sb_index, sb_masks, sb_morphology
+    with _load_lock:
+        if sb_words is None:
+            words = load_game_words(WordTag.SB_ALLOWED)
+            sb_index = get_word_index(words)
+            sb_masks = get_mask_index(words)
+            sb_morphology = get_morphology(sb_index)
+            sb_words = words
+
 class PointLevel(Enum):
     Beginning   = 0.0
     Fine        = 0.125
@@ -41,15 +68,51 @@ class PointLevel(Enum):
 # noinspection PyAttributeOutsideInit
 class GameEngine:
     """The SpellingBee game internal data and procedures."""
-    def __init__(self, p_lgr:MhsLogger, p_letters:str=""):
+    def __init__(self, p_lgr:MhsLogger, p_letters:str="", p_size:int=PANGRAM_LENGTH):
         self.lgr = p_lgr
-        # TODO: check and use specified letters
-        if p_letters and len(p_letters) == PANGRAM_LENGTH:
-            # first letter = required; remaining 6 letters = outers
-            pass
-        self.lgr.info(f"Initialized Game Engine >> total number of words = {len(sb_words)}")
+        # number of letters in the hive = length of the pangrams
+        self.hive_size = len(p_letters) if p_letters else p_size
+        if not MIN_PANGRAM_LENGTH <= self.hive_size <= MAX_PANGRAM_LENGTH:
+            raise ValueError(f"A puzzle needs {MIN_PANGRAM_LENGTH} to {MAX_PANGRAM_LENGTH} letters, NOT {self.hive_size}!")
+        # first letter = required; remaining letters = outers
+        self.custom_letters = p_letters
+        self.puzzles = None
+        self.surround_letters = []
+        self.good_guesses = []
+        self.saved = False
+        # the loading thread and start() on the GUI thread must NOT both load the puzzles or check the custom letters
+        self._load_lock = Lock()
+        self.lgr.info(f"Initialized Game Engine >> hive size = {self.hive_size}")
+
+    def load(self):
+        """Load the words, indexes and puzzles, and check any custom letters.
+           Slow on first use, so the UI calls this on a background thread; start() calls it if still needed,
+           and then waits for any load already running."""
+        with self._load_lock:
+            if self.puzzles is not None:
+                return
+            load_word_data()
+            if self.custom_letters:
+                self.custom_letters = self.check_custom_letters(self.custom_letters)
+            self.puzzles = get_puzzle_index(sb_masks, self.hive_size)
+        self.lgr.info(f"Loaded Game Engine >> total number of words = {len(sb_words)}; number of puzzles = {len(self.puzzles)}")
+
+    @staticmethod
+    def check_custom_letters(p_letters:str) -> str:
+        """Make sure the specified letters can be a puzzle >> return them in upper case"""
+        load_word_data()
+        letters = p_letters.upper()
+        if len(set(letters)) != len(letters) or letter_mask(letters) >= OTHER_BIT:
+            raise ValueError(f"Need DIFFERENT letters A-Z for a puzzle, NOT '{p_letters}'!")
+        if not sb_masks.find_answers(letters[0], letters[1:]):
+            raise ValueError(f"NO words can be made from '{letters[1:]}' with required letter '{letters[0]}'!")
+        return letters
 
-    def start(self):
+    def start(self, p_constraints:dict=None):
+        """Start a game with a random puzzle that meets any constraints given as
+           {min_answers, max_answers, min_points, max_points, num_pangrams, excluded}."""
+        if self.puzzles is None:
+            self.load()
         self.current_guess = ""
         self.bad_letter = ''
         self.total_num_answers = 0
@@ -67,17 +130,61 @@ class GameEngine:
         self.surround_letters = []
         self.load_pangrams()
         self.lgr.info(f"number of pangrams = {len(self.pangrams)}")
-        self.current_target = self.pangrams[random.randrange(0, len(self.pangrams))]
+        if self.custom_letters:
+            # only for the first game
+            self.load_custom_puzzle(self.custom_letters)
+            self.custom_letters = ""
+            self.lgr.info("Started a Game.")
+            return
+        puzzle_id = self.puzzles.select(**p_constraints) if p_constraints else self.get_puzzle_picker().draw()
+        if puzzle_id < 0:
+            self.lgr.warning(f"NO puzzle meets the constraints {p_constraints}! Using a random puzzle.")
+            puzzle_id = self.get_puzzle_picker().draw()
+        self.load_puzzle(puzzle_id)
+        self.lgr.info("Started a Game.")
+
+    def get_puzzle_picker(self):
+        """Draws of the puzzles that do NOT repeat for the player until all have been played;
+           weighted by their most common pangram if there is a word frequency list."""
+        def get_weights():
+            weights = get_word_weights(self.catalog.words)
+            if weights is None:
+                return None
+            word_weights = dict(zip(self.catalog.words, weights))
+            return [max(map(word_weights.__getitem__, self.catalog.get_pangrams(self.puzzles.puzzle_masks[pid])))
+                    for pid in range(len(self.puzzles))]
+        return get_target_picker(f"spellingbee_puzzles.{self.hive_size}", self.puzzles.digest, len(self.puzzles), get_weights)
+
+    def load_puzzle(self, p_id:int):
+        """Get the letters, answers and maximum points of a puzzle from the precomputed puzzle index."""
+        self.puzzle_id = p_id
+        self.required_letter, self.surround_letters = self.puzzles.get_letters(p_id)
+        self.lgr.info(f"puzzle #{p_id}: required letter = {self.required_letter}; outer letters = {self.surround_letters}")
+        self.required_bit = letter_mask(self.required_letter)
+        self.puzzle_mask = self.puzzles.puzzle_masks[p_id]
+        self.current_target = random.choice(self.catalog.get_pangrams(self.puzzle_mask))
+        self.lgr.info(f"current target word = {self.current_target}")
+        # view of the corpus: words are only made into str objects when used
+        self.answer_list = self.puzzles.get_answers(p_id)
+        self.total_num_answers = len(self.answer_list)
+        self.maximum_points = self.puzzles.puzzle_points[p_id]
+        self.lgr.info(f"Total number of acceptable answers = {self.total_num_answers}; Maximum points = {self.maximum_points}.")
+
+    def load_custom_puzzle(self, p_letters:str):
+        """Get the answers and maximum points for the specified letters from the letter-mask index."""
+        self.puzzle_id = -1
+        self.required_letter = p_letters[0]
+        self.surround_letters = list(p_letters[1:])
+        self.lgr.info(f"CUSTOM puzzle: required letter = {self.required_letter}; outer letters = {self.surround_letters}")
+        self.required_bit = letter_mask(self.required_letter)
+        self.puzzle_mask = letter_mask(p_letters)
+        pangrams = self.catalog.get_pangrams(self.puzzle_mask)
+        if not pangrams:
+            self.lgr.warning(f"NO pangram available for letters '{p_letters}'!")
+        self.current_target = random.choice(pangrams) if pangrams else p_letters
         self.lgr.info(f"current target word = {self.current_target}")
-        self.required_letter = self.current_target[random.randrange(0, len(self.current_target))]
-        self.lgr.info(f"required letter = {self.required_letter}")
-        for lett in self.current_target:
-            if lett not in self.required_letter and lett not in self.surround_letters:
-                self.surround_letters.append(lett)
-        self.lgr.info(f"outer letters = {self.surround_letters}")
         self.make_answer_list()
         self.get_max_points()
-        self.lgr.info("Started a Game.")
 
     def save_record(self):
         # save all important information from this game
@@ -87,7 +194,7 @@ class GameEngine:
                            "MAX POSSIBLE POINTS":self.maximum_points, "FINAL RATING":self.get_current_level(),
                            "PANGRAM GUESSES":self.pangram_guesses, "GOOD GUESSES":self.good_guesses,
                            "MISSED ANSWERS":self.missed_answers(), "BAD LETTER GUESSES":self.bad_letter_guesses,
-                           "BAD WORD GUESSES":self.bad_word_guesses, "COMPLETE ANSWER LIST":self.answer_list}
+                           "BAD WORD GUESSES":self.bad_word_guesses, "COMPLETE ANSWER LIST":list(self.answer_list)}
             grfile = save_to_json(f"GameRecord_{self.required_letter}_{self.current_target}", game_record)
             self.lgr.info(f"Saved game record as: {grfile}")
             self.saved = True
@@ -96,7 +203,7 @@ class GameEngine:
         """Check all letters for a good response and also see if a pangram."""
         self.lgr.debug(f"check response '{resp}':")
         self.current_guess = get_clean_word(resp)
-        if self.current_guess in self.answer_list:
+        if self.is_answer():
             self.lgr.info(f"{self.current_guess} is a GOOD guess!")
             self.good_guesses.append(self.current_guess)
             self.current_points = (1 if len(resp) == MIN_WORD_LENGTH else len(resp))
@@ -128,44 +235,38 @@ class GameEngine:
     def check_letters(self, word:str = "") -> bool:
         if not word:
             word = self.current_guess
-        if self.required_letter not in word:
+        mask = letter_mask(word)
+        if not mask & self.required_bit:
             return False
-        if self.check_bad_letter(word):
+        if mask & ~self.puzzle_mask:
+            self.check_bad_letter(word)
             return False
         return True
 
     def check_word(self, word:str = "") -> bool:
         if not word:
             word = self.current_guess
-        if word in sb_words:
-            return True
-        return False
+        return word in sb_index
 
-    def check_pangram(self, word:str = "") -> bool:
+    def is_answer(self, word:str = "") -> bool:
+        """An answer is any corpus word that uses the required letter and NO letters outside the puzzle."""
         if not word:
             word = self.current_guess
-        if self.required_letter not in word:
+        pos = sb_index.position(word)
+        if pos < 0:
             return False
-        for lett in self.surround_letters:
-            if lett not in word:
-                return False
-        return True
+        mask = sb_masks.masks[pos]
+        return bool(mask & self.required_bit) and not mask & ~self.puzzle_mask
+
+    def check_pangram(self, word:str = "") -> bool:
+        if not word:
+            word = self.current_guess
+        return letter_mask(word) == self.puzzle_mask
 
     def load_pangrams(self):
-        for it in sb_words:
-            result = []
-            item = get_clean_word(it)
-            # don't use ING or ED forms
-            if item[-3:] == "ING" or item[-2:] == "ED":
-                continue
-            for lett in item:
-                if lett not in result:
-                    result.append(lett)
-            if len(result) == PANGRAM_LENGTH:
-                self.pangrams.append(item)
-        if SBGE_DEBUG:
-            fname = save_to_json("pangrams", self.pangrams)
-            self.lgr.info(f"Saved file: {fname}.")
+        """Pangrams come from the catalog cached with the corpus, rebuilt only when the word list changes."""
+        self.catalog = get_pangram_catalog(sb_masks, self.hive_size)
+        self.pangrams = self.catalog.words
 
     def get_current_level(self) -> str:
         current_point_percent = self.point_total / self.maximum_points
@@ -178,15 +279,13 @@ class GameEngine:
         if not sb_words:
             self.lgr.warning("Trying to find answers but NO word list!")
             return
-        for item in sb_words:
-            if self.check_letters(item) and self.check_word(item):
-                self.answer_list.append(item)
-        self.answer_list.sort()
+        # already in (sorted) corpus order
+        self.answer_list = sb_masks.get_answers(self.required_letter, self.surround_letters)
         self.total_num_answers = len(self.answer_list)
         self.lgr.info(f"Total number of acceptable answers for '{self.required_letter}' + {self.surround_letters}"
                        f" = {self.total_num_answers}")
         if SBGE_DEBUG:
-            fname = save_to_json("current_answer_list", self.answer_list)
+            fname = save_to_json("current_answer_list", list(self.answer_list))
             self.lgr.info(f"Saved file: {fname}.")
 
     def get_max_points(self) -> int:
@@ -195,11 +294,7 @@ class GameEngine:
             return 0
         if self.maximum_points > 0:
             return self.maximum_points
-        point_total = 0
-        for item in self.answer_list:
-            point_total += ( 1 if len(item) == MIN_WORD_LENGTH else len(item) )
-            if self.check_pangram(item):
-                point_total += len(item) # PANGRAM BONUS
+        point_total = sum(get_word_points(item, self.check_pangram(item)) for item in self.answer_list)
         self.maximum_points = point_total
         self.lgr.info(f"Maximum points = {self.maximum_points}.")
         return point_total
@@ -207,18 +302,13 @@ class GameEngine:
     def check_plurals(self, word:str = "") -> bool:
         if not word:
             word = self.current_guess
-        if word in self.answer_list:
+        if self.is_answer(word):
             return False
-        if (word[-1] == 'S' and word[-2] != 'S' and word[:-1] in sb_words) or (word[-2:] == "ES" and word[:-2] in sb_words):
-            return True
-        return False
+        return sb_morphology.is_plural(word)
 
     def missed_answers(self) -> list:
-        results = []
-        for word in self.answer_list:
-            if word not in self.good_guesses:
-                results.append(word)
-        return results
+        found = set(self.good_guesses)
+        return [word for word in self.answer_list if word not in found]
 # END class GameEngine
 
 
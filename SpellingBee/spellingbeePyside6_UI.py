@@ -10,7 +10,7 @@ __author_name__    = "Mark Sattolo"
 __author_email__   = "epistemik@gmail.com"
 __python_version__ = "3.10+"
 __created__ = "2025-08-18"
-__updated__ = "2026-06-15"
+__updated__ = "2026-10-18"
 
 import subprocess
 from enum import IntEnum
@@ -20,6 +20,8 @@ from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (QApplication, QWidget, QFormLayout, QVBoxLayout, QHBoxLayout, QFrame,
                                QLabel, QPushButton, QMainWindow, QMessageBox, QTextEdit,  QLineEdit)
 from spellingbeeGameEngine import *
+from backgroundLoader import BackgroundLoader
+from startupProfile import mark
 
 class SbFontSize(IntEnum):
     Xsmall  = 12
@@ -45,7 +47,7 @@ INFO_TEXT = ("   How to Play the Game:\n"
              "4) FYI, most simple plurals are just ignored... \n\n"
              "5) You can press the space bar to scramble the PLACEMENT of the outer letters.\n\n"
              "6) Your Valid or Invalid guesses are displayed in the appropriate boxes.\n\n"
-             "7) Pangrams are words that use ALL seven letters -- and earn DOUBLE points!\n\n"
+             "7) Pangrams are words that use ALL the displayed letters -- and earn DOUBLE points!\n\n"
              "8) Exit the game when you are ready and your game information will be saved to a JSON file.")
 SBUI_DEBUG = False
 
@@ -105,7 +107,7 @@ def check_screen_locked(lgr:logging.Logger=None) -> bool:
 # noinspection PyAttributeOutsideInit
 class SpellingBeeUI(QMainWindow):
     """UI to play the SpellingBee game."""
-    def __init__(self):
+    def __init__(self, p_letters:str="", p_size:int=PANGRAM_LENGTH):
         super().__init__()
         self.setWindowTitle("My SpellingBee Game")
         # pixels: dx from left, dx from top, width, height
@@ -114,7 +116,7 @@ class SpellingBeeUI(QMainWindow):
         self.lgr = log_control.get_logger()
         self.lgr.log(DEFAULT_LOG_LEVEL, f"{self.windowTitle()} runtime = {get_current_time()}")
 
-        self.ge = GameEngine(self.lgr)
+        self.ge = GameEngine(self.lgr, p_letters, p_size)
 
         self.status_info = QLabel()
         self.status_info.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -129,8 +131,32 @@ class SpellingBeeUI(QMainWindow):
         main_widget = QWidget()
         main_widget.setLayout(main_layout)
         self.setCentralWidget(main_widget)
-        self.reset()
+        # show the window right away, then load the words and puzzles and start the game in the background
+        self.run_secs = 0
+        self.pause_secs = 0
+        self.lock_count = 0
+        # NO new game until the words and puzzles are loaded and words_loaded has started the first one
+        self.loaded = False
+        self.response_box.setEnabled(False)
+        self.status_info.setText("Loading the words...")
         self.show()
+        QTimer.singleShot(0, lambda: mark("first paint"))
+        self.loader = BackgroundLoader("load SpellingBee words and puzzles", self.ge.load, self)
+        self.loader.loaded.connect(self.words_loaded)
+        self.loader.failed.connect(self.load_failed)
+        self.loader.start()
+
+    def words_loaded(self):
+        self.reset()
+        self.loaded = True
+        self.response_box.setEnabled(True)
+        self.response_box.setFocus()
+        mark("first game ready")
+
+    def load_failed(self, p_error:Exception):
+        self.lgr.error(f"Could NOT load the game: {repr(p_error)}")
+        QMessageBox.critical(self, self.windowTitle(), str(p_error))
+        QApplication.exit(27 if isinstance(p_error, ValueError) else 66)
 
     def reset(self):
         """Reset all the items needed to start a new game."""
@@ -212,70 +238,41 @@ class SpellingBeeUI(QMainWindow):
         points_row.addWidget(count_label)
         qf_layout.addRow(points_row)
 
-        # upper two letters
-        ulspacer = QLabel("")
-        set_label_bold(ulspacer)
-        self.upper_left_letter = QLabel("UL")
-        set_label_letter_style(self.upper_left_letter)
-        self.upper_right_letter = QLabel("UR")
-        set_label_letter_style(self.upper_right_letter)
-        urspacer = QLabel("")
-        set_label_bold(urspacer)
-        top_row = QHBoxLayout()
-        top_row.addWidget(ulspacer)
-        top_row.addWidget(self.upper_left_letter)
-        top_row.addWidget(self.upper_right_letter)
-        top_row.addWidget(urspacer)
-        top_row.setStretchFactor(ulspacer, 3)
-        top_row.setStretchFactor(self.upper_left_letter, 2)
-        top_row.setStretchFactor(self.upper_right_letter, 2)
-        top_row.setStretchFactor(urspacer, 3)
-        qf_layout.addRow(top_row)
-        # middle three letters
-        clspacer = QLabel("")
-        self.centre_left_letter = QLabel("CL")
-        set_label_letter_style(self.centre_left_letter)
+        # the outer letters go above, beside and below the central letter, depending on the size of the hive
+        num_outers = self.ge.hive_size - 1
+        num_upper = (num_outers - 1) // 2
+        self.outer_letters = []
+        for _ in range(num_outers):
+            outer_letter = QLabel()
+            set_label_letter_style(outer_letter)
+            self.outer_letters.append(outer_letter)
         self.central_letter = QLabel("Req")
         self.central_letter.setStyleSheet(f"{FONT_BOLD} {LARGE_FONT} color: purple; background: yellow")
         self.central_letter.setFrameStyle(QFrame.Shape.Box | QFrame.Shadow.Raised)
         self.central_letter.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignHCenter)
-        crspacer = QLabel("")
-        self.centre_right_letter = QLabel("CR")
-        set_label_letter_style(self.centre_right_letter)
-        middle_row = QHBoxLayout()
-        middle_row.addWidget(clspacer)
-        middle_row.addWidget(self.centre_left_letter)
-        middle_row.addWidget(self.central_letter)
-        middle_row.addWidget(self.centre_right_letter)
-        middle_row.addWidget(crspacer)
-        middle_row.setStretchFactor(clspacer, 2)
-        middle_row.setStretchFactor(self.centre_left_letter, 2)
-        middle_row.setStretchFactor(self.central_letter, 3)
-        middle_row.setStretchFactor(self.centre_right_letter, 2)
-        middle_row.setStretchFactor(crspacer, 2)
-        qf_layout.addRow(middle_row)
-        # lower two letters
-        llspacer = QLabel("")
-        set_label_bold(llspacer)
-        self.lower_left_letter = QLabel("LL")
-        set_label_letter_style(self.lower_left_letter)
-        self.lower_right_letter = QLabel("LR")
-        set_label_letter_style(self.lower_right_letter)
-        lrspacer = QLabel("")
-        set_label_bold(lrspacer)
-        bottom_row = QHBoxLayout()
-        bottom_row.addWidget(llspacer)
-        bottom_row.addWidget(self.lower_left_letter)
-        bottom_row.addWidget(self.lower_right_letter)
-        bottom_row.addWidget(lrspacer)
-        bottom_row.setStretchFactor(llspacer, 3)
-        bottom_row.setStretchFactor(self.lower_left_letter, 2)
-        bottom_row.setStretchFactor(self.lower_right_letter, 2)
-        bottom_row.setStretchFactor(lrspacer, 3)
-        qf_layout.addRow(bottom_row)
+        qf_layout.addRow(self.create_letter_row(self.outer_letters[:num_upper]))
+        qf_layout.addRow(self.create_letter_row([self.outer_letters[num_upper], self.central_letter,
+                                                 self.outer_letters[num_upper+1]], 2))
+        qf_layout.addRow(self.create_letter_row(self.outer_letters[num_upper+2:]))
 
         return qf_layout
 
+    def create_letter_row(self, p_letters:list, p_spacer_stretch:int=3):
+        """A row of letters between two spacers, with the central letter wider than the others."""
+        left_spacer = QLabel("")
+        set_label_bold(left_spacer)
+        right_spacer = QLabel("")
+        set_label_bold(right_spacer)
+        letter_row = QHBoxLayout()
+        letter_row.addWidget(left_spacer)
+        letter_row.setStretchFactor(left_spacer, p_spacer_stretch)
+        for letter in p_letters:
+            letter_row.addWidget(letter)
+            letter_row.setStretchFactor(letter, 3 if letter is self.central_letter else 2)
+        letter_row.addWidget(right_spacer)
+        letter_row.setStretchFactor(right_spacer, p_spacer_stretch)
+        return letter_row
+
     def create_response_section(self):
         """The response widgets section of the UI."""
         qvb_layout = QVBoxLayout()
@@ -361,6 +358,7 @@ class SpellingBeeUI(QMainWindow):
     def exit_inquiry(self):
         """Confirm that the user wants to exit the current game."""
         confirm_box, initiate_exit_button, continue_game_button, new_game_button = confirm_exit()
+        new_game_button.setEnabled(self.loaded)
         confirm_box.exec()
         if confirm_box.clickedButton() == initiate_exit_button:
             self.lgr.info("Proceed to EXIT!")
@@ -376,24 +374,9 @@ class SpellingBeeUI(QMainWindow):
     def scramble_letters(self):
         """Change the placement of the surround letters."""
         self.lgr.debug("scramble_letters()")
-        picked = self.ge.surround_letters.copy()
-        next_lett = picked[random.randrange(0, PANGRAM_LENGTH-1)]
-        self.upper_left_letter.setText(next_lett)
-        picked.remove(next_lett)
-        next_lett = picked[random.randrange(0, PANGRAM_LENGTH-2)]
-        self.upper_right_letter.setText(next_lett)
-        picked.remove(next_lett)
-        next_lett = picked[random.randrange(0, PANGRAM_LENGTH-3)]
-        self.centre_left_letter.setText(next_lett)
-        picked.remove(next_lett)
-        next_lett = picked[random.randrange(0, PANGRAM_LENGTH-4)]
-        self.centre_right_letter.setText(next_lett)
-        picked.remove(next_lett)
-        next_lett = picked[0]
-        self.lower_left_letter.setText(next_lett)
-        picked.remove(next_lett)
-        next_lett = picked[0]
-        self.lower_right_letter.setText(next_lett)
+        picked = random.sample(self.ge.surround_letters, len(self.outer_letters))
+        for outer_letter, lett in zip(self.outer_letters, picked):
+            outer_letter.setText(lett)
 
     def response_change(self, resp:str):
         self.lgr.debug(f"Response changed to: '{resp}'")
@@ -10,8 +10,12 @@ __author_name__    = "Mark Sattolo"
 __author_email__   = "epistemik@gmail.com"
 __python_version__ = "3.11+"
 __created__ = "2026-03-05"
-__updated__ = "2026-07-14"
+__updated__ = "2026-10-18"
 
+from sys import path
+path.append("/home/marksa/git/Python/Games/common")
+from startupProfile import profile_imports
+profile_imports()
 from wordleGame import *
 
 if __name__ == "__main__":
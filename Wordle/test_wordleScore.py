@@ -0,0 +1,64 @@
+##############################################################################################################################
+# coding=utf-8
+#
+# test_wordleScore.py
+#   -- checks of the batch Wordle scorer against the single-target scorer
+#
+# Copyright (c) 2026 Mark Sattolo <epistemik@gmail.com>
+
+__author_name__    = "Mark Sattolo"
+__author_email__   = "epistemik@gmail.com"
+__python_version__ = "3.10+"
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+import random
+import string
+import unittest
+from sys import path
+path.append("/home/marksa/git/Python/Games/common")
+from wordleScore import get_solved_score, score, score_batch
+from patternMatrix import MATRIX_LENGTHS
+
+# targets scored against each guess
+NUM_TARGETS = 300
+# guesses of each kind for each word length
+NUM_GUESSES = 20
+
+def get_words(p_rng:random.Random, p_letters:str, p_length:int, p_count:int) -> list:
+    return ["".join(p_rng.choices(p_letters, k=p_length)) for _ in range(p_count)]
+
+class TestScoreBatch(unittest.TestCase):
+    """score_batch packs every target in a lane of a big int and relies on lanes NOT carrying into each other,
+       so compare it with score() on words of every game length, with many repeated letters and with few."""
+    def check_guesses(self, p_guesses:list, p_targets:list):
+        for guess in p_guesses:
+            expected = [score(guess, target) for target in p_targets]
+            with self.subTest(guess=guess):
+                self.assertEqual(list(score_batch(guess, p_targets)), expected)
+
+    def test_random_words(self):
+        rng = random.Random(16)
+        for length in MATRIX_LENGTHS:
+            targets = get_words(rng, string.ascii_uppercase, length, NUM_TARGETS)
+            self.check_guesses(get_words(rng, string.ascii_uppercase, length, NUM_GUESSES) + targets[:NUM_GUESSES], targets)
+
+    def test_repeated_letters(self):
+        """From a 3-letter alphabet every word repeats letters, up to the whole word being one letter."""
+        rng = random.Random(17)
+        for length in MATRIX_LENGTHS:
+            targets = get_words(rng, "EST", length, NUM_TARGETS) + ["E" * length, "S" * length]
+            guesses = get_words(rng, "EST", length, NUM_GUESSES) + ["E" * length, "T" * length, "ES" * (length // 2) + "E" * (length % 2)]
+            self.check_guesses(guesses, targets)
+
+    def test_solved(self):
+        rng = random.Random(18)
+        for length in MATRIX_LENGTHS:
+            targets = get_words(rng, "AEIRST", length, NUM_TARGETS)
+            scores = score_batch(targets[0], targets)
+            self.assertEqual(scores[0], get_solved_score(length))
+# END class TestScoreBatch
+
+
+if __name__ == "__main__":
+    unittest.main()
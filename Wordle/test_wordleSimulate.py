@@ -0,0 +1,34 @@
+##############################################################################################################################
+# coding=utf-8
+#
+# test_wordleSimulate.py
+#   -- checks of the headless Wordle simulator
+#
+# Copyright (c) 2026 Mark Sattolo <epistemik@gmail.com>
+
+__author_name__    = "Mark Sattolo"
+__author_email__   = "epistemik@gmail.com"
+__python_version__ = "3.11+"
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+import unittest
+from wordleSimulate import simulate
+import wordleEngine
+
+class TestSimulate(unittest.TestCase):
+    def test_random_first_guess_wins_about_one_in_n(self):
+        """The 'random' strategy's first guess is any of the N words, so it should win in 1 guess about once in N games;
+           many more would mean a worker rng is replaying the rng that sampled the targets."""
+        num_games = 400
+        results = simulate(5, 6, False, "random", num_games)
+        num_words = len(wordleEngine.wordle_index.length_bucket(5))
+        expected = num_games / num_words
+        self.assertEqual(len(results), num_games)
+        # Poisson with a mean well below 1: 6 or more is about a 1-in-a-million event
+        self.assertLess(results.count(1), max(6, 4 * expected))
+# END class TestSimulate
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+##############################################################################################################################
+# coding=utf-8
+#
+# wordleDifficulty.py
+#   -- offline rating of how hard each Wordle target word is for a reference solver, saved as a compact table,
+#      and the targets of each difficulty tier for a number of rows
+#
+# Copyright (c) 2026 Mark Sattolo <epistemik@gmail.com>
+
+__author_name__    = "Mark Sattolo"
+__author_email__   = "epistemik@gmail.com"
+__python_version__ = "3.11+"
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+import glob
+import logging
+import os
+import os.path as osp
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from enum import IntEnum
+from itertools import repeat
+from sys import argv, path
+from time import perf_counter
+path.append("/home/marksa/git/Python/Games/common")
+from wordCorpus import GAMES_INPUT_FOLDER, WordTag, get_array_view, get_tmp_file, write_array
+from wordIndex import WordIndex, get_word_index
+from patternMatrix import DENSE_LENGTHS, MATRIX_LENGTHS, MATRIX_SUFFIX, get_matrix_key, get_npy_header, read_npy_header
+
+DIFFICULTY_PREFIX = "wordle_difficulty"
+# the solver keeps guessing for up to this many rows (the most a game can have),
+# so one rating of a target covers every number of rows
+RATING_ROWS = 10
+# targets rated by each task of the process pool
+TARGETS_PER_TASK = 32
+# columns of the table: guesses the solver needed (0 = NOT solved in RATING_ROWS), candidates left by its first guess
+RATING_COLUMNS = 2
+
+class Difficulty(IntEnum):
+    EASY   = 0
+    MEDIUM = 1
+    HARD   = 2
+
+
+def get_difficulty_file(p_key:str, p_length:int) -> str:
+    return osp.join(GAMES_INPUT_FOLDER, f"{DIFFICULTY_PREFIX}.{p_length}.{p_key}{MATRIX_SUFFIX}")
+
+def _rate_targets(p_length:int, p_targets:list) -> list:
+    """Process pool task: play the reference solver, i.e. always take the Hint, in regular mode for each target.
+       >> return the number of guesses (0 if NOT solved in RATING_ROWS) and the number of candidates
+          left after the first guess, for each target"""
+    from wordleEngine import WordleGameEngine, load_word_data
+    load_word_data()
+    lgr = logging.getLogger("wordleDifficulty")
+    lgr.setLevel(logging.WARNING)
+    engine = WordleGameEngine(lgr, p_length, RATING_ROWS)
+    ratings = []
+    for target in p_targets:
+        engine.start(p_target=target)
+        solved = 0
+        opening_left = 0
+        for row in range(RATING_ROWS):
+            guess = engine.get_hint_search()(None, None).guess
+            engine.check_guess(guess, row)
+            if row == 0:
+                opening_left = engine.count_candidates()
+            if guess == target:
+                solved = row + 1
+                break
+        ratings.extend((solved, opening_left))
+    return ratings
+
+def build_difficulty_table(p_answers, p_length:int, p_outfile:str, p_workers:int=None):
+    """Rate every target of p_answers, TARGETS_PER_TASK per task over a pool of processes,
+       and write the ratings in answer order as a (targets x RATING_COLUMNS) .npy table."""
+    answers = list(p_answers)
+    tasks = [answers[start:start+TARGETS_PER_TASK] for start in range(0, len(answers), TARGETS_PER_TASK)]
+    tmp_file = get_tmp_file(p_outfile)
+    with open(tmp_file, "wb") as outf, ProcessPoolExecutor(p_workers) as pool:
+        outf.write(get_npy_header('I', len(p_answers), RATING_COLUMNS))
+        for ratings in pool.map(_rate_targets, repeat(p_length), tasks):
+            write_array(outf, 'I', ratings)
+    os.replace(tmp_file, p_outfile)
+
+
+class DifficultyTable:
+    """The ratings of the targets of one word length, in the (sorted) order of the answer bucket they were made from;
+       p_key identifies the word lists they were made from."""
+    def __init__(self, p_key:str, p_file:str, p_answers):
+        self.key = p_key
+        self.file = p_file
+        self.answers = p_answers
+        with open(p_file, "rb") as dfile:
+            data = dfile.read()
+        typecode, (rows, cols), start = read_npy_header(data)
+        if rows != len(p_answers) or cols != RATING_COLUMNS:
+            raise ValueError(f"'{p_file}' does NOT match its word list!")
+        ratings, _ = get_array_view(data, start, typecode, rows * cols)
+        self.guesses = ratings[0::RATING_COLUMNS]
+        self.opening_left = ratings[1::RATING_COLUMNS]
+        self._tiers = {}
+
+    def get_guesses(self, p_idx:int, p_rows:int) -> int:
+        """Guesses the solver needed for target p_idx >> 0 if NOT solved in p_rows rows"""
+        guesses = self.guesses[p_idx]
+        return guesses if guesses <= p_rows else 0
+
+    def get_tier(self, p_rows:int, p_difficulty:Difficulty) -> array:
+        """Indexes of the targets of a difficulty tier, for games of p_rows rows: the targets sorted by the guesses
+           the solver needed, those it did NOT solve in p_rows last, then by the candidates left by its first guess,
+           and split in equal parts. Sorted once per number of rows, so a draw from a tier is O(1)."""
+        if p_rows not in self._tiers:
+            order = sorted(range(len(self.answers)),
+                           key=lambda idx: (self.get_guesses(idx, p_rows) or p_rows + 1, self.opening_left[idx]))
+            num_tiers = len(Difficulty)
+            self._tiers[p_rows] = [array('I', order[len(order) * tier // num_tiers:len(order) * (tier + 1) // num_tiers])
+                                   for tier in range(num_tiers)]
+        return self._tiers[p_rows][p_difficulty]
+# END class DifficultyTable
+
+
+# the loaded tables (or None if NOT built) in each process
+_tables = {}
+
+def get_difficulty_table(p_guesses:WordIndex, p_answers:WordIndex, p_length:int):
+    """Load the ratings for this word length on first use >> None if they have NOT been built
+       for these word lists; run this module to build them."""
+    key = get_matrix_key(p_guesses, p_answers, p_length)
+    if key not in _tables:
+        dfile = get_difficulty_file(key, p_length)
+        _tables[key] = DifficultyTable(key, dfile, p_answers.length_bucket(p_length)) if osp.exists(dfile) else None
+    return _tables[key]
+
+def report(p_table:DifficultyTable, p_rows:int):
+    """Print the solve rate and the mean guesses of the reference solver in each tier."""
+    for difficulty in Difficulty:
+        tier = p_table.get_tier(p_rows, difficulty)
+        guesses = [p_table.get_guesses(idx, p_rows) for idx in tier]
+        wins = [num for num in guesses if num]
+        print(f"\t{p_rows:>2} rows, {difficulty.name:<6}: {len(tier):6,} targets; solve rate = "
+              f"{len(wins) * 100 / len(tier) if tier else 0:6.2f}%; mean guesses = {sum(wins) / len(wins) if wins else 0:.2f}")
+
+def build_difficulty_tables(p_lengths=DENSE_LENGTHS, p_workers:int=None):
+    """Rate the targets of each word length for the current Wordle word lists, replacing any older ratings."""
+    from corpusBuilder import load_game_words
+    guesses = get_word_index(load_game_words(WordTag.WORDLE_ALLOWED))
+    answers = get_word_index(load_game_words(WordTag.WORDLE_ANSWER))
+    for length in p_lengths:
+        key = get_matrix_key(guesses, answers, length)
+        dfile = get_difficulty_file(key, length)
+        start = perf_counter()
+        build_difficulty_table(answers.length_bucket(length), length, dfile, p_workers)
+        for old_file in glob.glob(get_difficulty_file('*', length)):
+            if old_file != dfile:
+                os.remove(old_file)
+        print(f"{osp.basename(dfile)}: {len(answers.length_bucket(length)):,} targets in {perf_counter() - start:.1f} s")
+        _tables.pop(key, None)
+        table = get_difficulty_table(guesses, answers, length)
+        for rows in (3, 6, RATING_ROWS):
+            report(table, rows)
+
+
+if __name__ == "__main__":
+    if any(not arg.isdigit() or int(arg) not in MATRIX_LENGTHS for arg in argv[1:]):
+        print(f"Usage: python3 {osp.basename(argv[0])} [$word_length ...]\nRate the Wordle targets of each word length"
+              f" ({MATRIX_LENGTHS.start}..{MATRIX_LENGTHS.stop - 1}, default = {DENSE_LENGTHS.start}..{DENSE_LENGTHS.stop - 1})"
+              f" by playing the Hint solver on each of them, using all the CPUs.")
+        exit(0)
+    build_difficulty_tables([int(arg) for arg in argv[1:]] or DENSE_LENGTHS)
+    exit(0)
@@ -0,0 +1,367 @@
+##############################################################################################################################
+# coding=utf-8
+#
+# wordleEngine.py
+#   -- the Wordle game engine and word data, without any UI, so it can also be played headlessly
+#
+# Copyright (c) 2026 Mark Sattolo <epistemik@gmail.com>
+
+__author_name__    = "Mark Sattolo"
+__author_email__   = "epistemik@gmail.com"
+__python_version__ = "3.11+"
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+from array import array
+from collections import Counter
+from operator import itemgetter
+from sys import path
+from threading import Lock
+path.append("/home/marksa/git/Python/utils")
+from mhsUtils import *
+from mhsLogging import *
+path.append("/home/marksa/git/Python/Games/common")
+from wordCorpus import WordTag, WordSubset
+from corpusBuilder import load_game_words
+from wordIndex import get_word_index
+from morphology import get_morphology
+from patternIndex import Pattern, PatternIndex, narrow_bits, get_bit_indexes
+from wordleScore import Mark, score_batch, decode_score, get_solved_score
+from patternMatrix import get_pattern_matrix
+from patternRowCache import get_pattern_rows
+from wordleSolver import find_best_guess
+from targetPicker import get_target_picker, get_word_weights
+from wordleDifficulty import Difficulty, get_difficulty_table
+
+# the words and their indexes are loaded on first use, possibly by a background thread
+wordle_words = None # possible target words
+wordle_index = None
+wordle_morphology = None
+wordle_allowed = None # acceptable guesses
+_load_lock = Lock()
+
+def load_word_data():
+    """Load the Wordle words and indexes once >> blocks until done if another thread is loading them."""
+    global wordle_words, wordle_index, wordle_morphology, wordle_allowed
+    with _load_lock:
+        if wordle_words is None:
+            words = load_game_words(WordTag.WORDLE_ANSWER)
+            wordle_index = get_word_index(words)
+            wordle_index.load_length_buckets()
+            wordle_morphology = get_morphology(wordle_index)
+            wordle_allowed = get_word_index(load_game_words(WordTag.WORDLE_ALLOWED))
+            wordle_words = words
+
+# the first hint is the same in every game of a word length, so only search for it once
+opening_hints = {}
+# the allowed guesses of each word length, without the ignored plurals, with their pattern matrix rows and pattern indexes
+guess_words = {}
+guess_rows = {}
+guess_indexes = {}
+
+def is_ignored_plural(p_word:str) -> bool:
+    """Keep ignoring the simple plurals found only in the extra allowed word lists."""
+    return p_word not in wordle_index and wordle_morphology.is_plural(p_word)
+
+def get_guess_words(p_length:int) -> WordSubset:
+    if p_length not in guess_words:
+        bucket = wordle_allowed.length_bucket(p_length)
+        # index of each guess in the bucket = its row of the pattern matrix
+        guess_rows[p_length] = array('I', (idx for idx, wd in enumerate(bucket) if not is_ignored_plural(wd)))
+        guess_words[p_length] = WordSubset(bucket, guess_rows[p_length])
+    return guess_words[p_length]
+
+def get_guess_index(p_length:int) -> PatternIndex:
+    if p_length not in guess_indexes:
+        guess_indexes[p_length] = PatternIndex(get_guess_words(p_length), p_length)
+    return guess_indexes[p_length]
+
+# DEBUG_TARGET = "FELIS" # test words = MESSY, LEAFY, SILLY, AFFIX, SLIME, FLESH
+DEBUG_TARGET = "PUPPY" # test words = APPLE, PAPER, PLUMP, TAUPE, UPPER, GUPPY
+# DEBUG_TARGET = "GUPPY" # test words = PLUMP, PAPER, UPPER, UNDUE, PUPPY, BUGGY
+WORDLE_DEBUG = False
+
+MIN_WORD_LENGTH = 4
+DEFAULT_WORD_LENGTH = 5
+MAX_WORD_LENGTH = 13
+MIN_NUM_ROWS = 3
+DEFAULT_NUM_ROWS = 6
+MAX_NUM_ROWS = 10
+# Wordle, Dordle, Quordle, Octordle
+NUM_BOARDS = (1, 2, 4, 8)
+
+class WordleBoard:
+    """One target word and everything the guesses so far have shown about it;
+       a multi-board game plays the same guesses on every board."""
+    def __init__(self, p_target:str, p_length:int, p_num_words:int):
+        self.target = p_target
+        self.score = 0 # of the latest guess
+        # everything the feedback so far has shown about the target
+        self.pattern = Pattern(p_length)
+        # bit i set = current word i still fits the feedback
+        self.candidates = (1 << p_num_words) - 1
+        # number of the guess that found the target, 0 if NOT found yet
+        self.solved_at = 0
+
+    @property
+    def solved(self) -> bool:
+        return self.solved_at > 0
+
+    def get_letter_mark(self, p_letter:str):
+        """What the feedback on this board has shown about a letter, for its keyboard
+           >> EXACT or PRESENT if it is in the target (EXACT if found at a position), ABSENT if NOT, None if unknown"""
+        if p_letter in self.pattern.exact:
+            return Mark.EXACT
+        if p_letter in self.pattern.required:
+            return Mark.PRESENT
+        return Mark.ABSENT if p_letter in self.pattern.excluded else None
+# END class WordleBoard
+
+
+# noinspection PyAttributeOutsideInit
+class WordleGameEngine:
+    """The Wordle game internal data and procedures."""
+    def __init__(self, p_lgr:logging.Logger, p_len:int=DEFAULT_WORD_LENGTH, p_rows:int=DEFAULT_NUM_ROWS,
+                 p_boards:int=1):
+        self.lgr = p_lgr
+        if MIN_WORD_LENGTH <= p_len <= MAX_WORD_LENGTH:
+            self.word_length = p_len
+        if MIN_NUM_ROWS <= p_rows <= MAX_NUM_ROWS:
+            self.num_rows = p_rows
+        self.num_boards = p_boards if p_boards in NUM_BOARDS else 1
+        self.instructions = ("\tHow to Play Wordle:\n"
+                        "---------------------------------------------------------------------------------\n"
+                        f"1) Try to guess the secret {self.word_length}-letter word.\n\n"
+                        f"2) Type a {self.word_length}-letter word and press ENTER to evaluate it. "
+                        f" Your entry will be accepted if it is a VALID Wordle word.\n\n"
+                        "3) Each letter in the correct position will shade GREEN.\n\n"
+                        "4) Letters present in the secret word but in the WRONG POSITION in your guess will shade YELLOW.\n\n"
+                        "5) Any letter NOT present in the secret word will shade GREY.\n\n"
+                        "6) In STRICT mode any 'green' and 'yellow' letters found in a guess MUST be used in subsequent guesses.\n\n"
+                        f"7) You have {self.num_rows} attempts to find the secret word.\n\n"
+                        "8) >> Resetting the word length or number of rows will start a BRAND NEW game.\n\n"
+                        "9) If you Quit the app (Ctrl-Q) or start a New word (Ctrl-N) your current game results will be saved to a file.\n\n"
+                        "10) Ask for a Hint (Ctrl-H) to get the guess that should narrow down the secret word the most.\n\n"
+                        "11) In ABSURDLE mode (Ctrl-B) there is NO secret word up front: each guess gets the feedback"
+                        " that leaves the most possible words.\n\n"
+                        "12) With 2, 4 or 8 boards every guess is played on each board that is NOT solved yet, and you get"
+                        " one more attempt for each extra board: find ALL the secret words to win.\n\n"
+                        "13) Pick a Difficulty in Settings to get secret words that the Hint solver finds easy, medium or hard.")
+        self.good_guesses = None
+        self.strict_mode = False
+        self.adversarial = False
+        self.boards = []
+        self.lgr.info(f"Initialized Game Engine >> Word length = {self.word_length}; Number of rows = {self.num_rows};"
+                      f" Number of boards = {self.num_boards}.")
+
+    def start(self, p_strict:bool=False, p_target:str=None, p_adversarial:bool=False, p_difficulty:Difficulty=None):
+        """Set starting values for a new game; the targets are random, and all different, unless given
+           (p_target can also be a list with a target for each board); with p_difficulty they are drawn
+           from that tier of the prebuilt target ratings, if there are any for this word length.
+           In adversarial (Absurdle) mode, only played on one board, the target is just any word
+           that still fits the feedback."""
+        load_word_data()
+        self.previous_guesses = []
+        self.num_guesses = 0
+        self.good_guesses = []
+        self.bad_guesses = []
+        self.info_mesg = ""
+        self.strict_mode = p_strict
+        self.adversarial = p_adversarial and self.num_boards == 1
+        self.difficulty = None
+        self.saved = False
+        self.outcome = ""
+        self.get_current_words()
+        self.total_rows = self.num_rows + self.num_boards - 1
+        if p_target:
+            targets = [p_target] if isinstance(p_target, str) else list(p_target)
+        elif self.adversarial:
+            targets = [self.current_words[0]]
+        elif WORDLE_DEBUG and self.num_boards == 1:
+            targets = [DEBUG_TARGET]
+        elif p_difficulty is not None and self.get_difficulty_table():
+            self.difficulty = p_difficulty
+            tier = self.get_difficulty_table().get_tier(self.total_rows, p_difficulty)
+            targets = [self.current_words[tier[idx]] for idx in self.get_tier_picker(p_difficulty).draw_distinct(self.num_boards)]
+        else:
+            targets = [self.current_words[idx] for idx in self.get_target_picker().draw_distinct(self.num_boards)]
+        self.boards = [WordleBoard(target, self.word_length, len(self.current_words)) for target in targets]
+        self.lgr.info(f"current target words = {targets}; total number of words = {len(self.current_words)}")
+
+    # the first board is the whole game in single-board mode
+    @property
+    def current_target(self) -> str:
+        return self.boards[0].target
+
+    @current_target.setter
+    def current_target(self, p_target:str):
+        self.boards[0].target = p_target
+
+    @property
+    def current_score(self) -> int:
+        return self.boards[0].score
+
+    @property
+    def pattern(self) -> Pattern:
+        return self.boards[0].pattern
+
+    @property
+    def candidates(self) -> int:
+        return self.boards[0].candidates
+
+    def get_unsolved_boards(self) -> list:
+        return [board for board in self.boards if not board.solved]
+
+    def is_solved(self) -> bool:
+        """All the targets have been found."""
+        return all(board.solved for board in self.boards)
+
+    def get_difficulty_table(self):
+        """The ratings of the targets of this word length >> None if NOT built; run wordleDifficulty.py to build them."""
+        table = get_difficulty_table(wordle_allowed, wordle_index, self.word_length)
+        if table is None:
+            self.lgr.warning(f"NO difficulty ratings for {self.word_length}-letter words.")
+        return table
+
+    def get_target_picker(self):
+        """Weighted draws of this word length's targets that do NOT repeat for the player until all have been played."""
+        return get_target_picker(f"wordle_targets.{self.word_length}", wordle_index.digest, len(self.current_words),
+                                 lambda: get_word_weights(self.current_words))
+
+    def get_tier_picker(self, p_difficulty:Difficulty):
+        """Like get_target_picker(), for the targets of a difficulty tier at the current number of rows."""
+        table = self.get_difficulty_table()
+        tier = table.get_tier(self.total_rows, p_difficulty)
+        return get_target_picker(f"wordle_targets.{self.word_length}.{self.total_rows}.{p_difficulty.name.lower()}",
+                                 table.key, len(tier), lambda: get_word_weights([self.current_words[idx] for idx in tier]))
+
+    def get_current_words(self):
+        """Get all words that match the current word length."""
+        self.current_words = wordle_index.length_bucket(self.word_length)
+
+    def check_guess(self, p_resp:str, p_current_row:int) -> bool:
+        """Check for a valid response."""
+        self.lgr.debug(f"check response '{p_resp}'.")
+        if not self.adversarial and any(p_resp == board.target for board in self.get_unsolved_boards()):
+            self.lgr.info("Found the target word!")
+            result = True
+        elif len(p_resp) != self.word_length or p_resp not in wordle_allowed:
+            result = False
+        elif is_ignored_plural(p_resp):
+            result = False
+        elif p_current_row > 0 and self.strict_mode and self.num_boards == 1:
+            result = self.checkguess_strict(p_resp)
+        else:
+            self.lgr.info(f"'{p_resp}' is a valid word.")
+            result = True
+        if result:
+            self.previous_guesses.append(p_resp)
+            self.num_guesses += 1
+            self.good_guesses.append(p_resp)
+            self.score_boards(p_resp)
+            self.lgr.debug(f"{self.count_candidates():,} possible target words left.")
+            return True
+        self.bad_guesses.append(p_resp)
+        if wordle_morphology.is_plural(p_resp):
+            self.info_mesg = "Most simple plurals are just IGNORED..."
+        return False
+
+    def score_boards(self, p_resp:str):
+        """Score an accepted guess on every board NOT solved yet: the targets are scored all at once by the batch scorer,
+           and the guess's row of scores against every current word narrows the candidates of each board."""
+        row = self.get_guess_scores(p_resp)
+        boards = self.get_unsolved_boards()
+        scores = [self.choose_adversarial_score(row)] if self.adversarial \
+                 else score_batch(p_resp, [board.target for board in boards])
+        solved = get_solved_score(self.word_length)
+        for board, code in zip(boards, scores):
+            board.score = code
+            board.pattern.add_feedback(p_resp, decode_score(code, self.word_length))
+            board.candidates = narrow_bits(board.candidates, row, code)
+            if self.adversarial:
+                board.target = p_resp if code == solved else self.get_candidate()
+            if code == solved:
+                board.solved_at = self.num_guesses
+
+    def checkguess_strict(self, p_resp:str) -> bool:
+        """Make sure that previous green and yellow responses are carried over."""
+        self.lgr.debug(f"check response '{p_resp}' in STRICT mode.")
+        self.info_mesg = self.pattern.check(p_resp, p_hard=True)
+        if self.info_mesg:
+            self.lgr.info(self.info_mesg)
+            return False
+        return True
+
+    def get_guess_scores(self, p_guess:str):
+        """Score codes of p_guess against every current word: a row of the prebuilt pattern matrix
+           of this word length, or else of the on-demand row cache."""
+        row = get_pattern_rows(wordle_allowed, wordle_index, self.word_length).get_row(p_guess)
+        return score_batch(p_guess, self.current_words) if row is None else row
+
+    def get_hint_guesses(self) -> tuple:
+        """The allowed guesses of this word length; in strict mode (single board only) only those that keep
+           all the green and yellow letters.
+           >> return the guesses and their pattern matrix rows"""
+        guesses = get_guess_words(self.word_length)
+        rows = guess_rows[self.word_length]
+        if self.strict_mode and self.num_guesses and self.num_boards == 1:
+            indexes = get_bit_indexes(get_guess_index(self.word_length).match(self.pattern.get_hard()))
+            return [guesses[idx] for idx in indexes], [rows[idx] for idx in indexes]
+        return guesses, rows
+
+    def get_hint_search(self):
+        """Snapshot of the game so far as a function(p_progress, p_cancelled) that finds the most informative
+           next guess, for the first board NOT solved yet: it takes seconds, so run it on a worker thread."""
+        length = self.word_length
+        opening = self.num_guesses == 0
+        guesses, rows = self.get_hint_guesses()
+        answers = self.current_words
+        unsolved = self.get_unsolved_boards()
+        candidates = unsolved[0].candidates if unsolved else 0
+        def search(p_progress, p_cancelled):
+            if opening and length in opening_hints:
+                return opening_hints[length]
+            matrix = get_pattern_matrix(wordle_allowed, wordle_index, length)
+            hint = find_best_guess(guesses, answers, candidates, (lambda idx: matrix.get_row_at(rows[idx])) if matrix else None,
+                                   p_progress, p_cancelled)
+            if opening and hint:
+                opening_hints[length] = hint
+            return hint
+        return search
+
+    def choose_adversarial_score(self, p_row) -> int:
+        """Split the candidates by the score code each gives for the guess (p_row = the guess's score codes)
+           >> return the code of the largest part; of equal parts, the one with the fewest marks, then the lowest code"""
+        candidates = get_bit_indexes(self.candidates)
+        codes = p_row if len(candidates) == len(p_row) else itemgetter(*candidates)(p_row) if len(candidates) > 1 \
+                else [p_row[candidates[0]]]
+        sizes = Counter(codes)
+        largest = max(sizes.values())
+        return min((code for code in sizes if sizes[code] == largest),
+                   key=lambda code: (sum(mark != Mark.ABSENT for mark in decode_score(code, self.word_length)), code))
+
+    def get_candidate(self) -> str:
+        """The first word, alphabetically, that still fits all the feedback."""
+        return self.current_words[(self.candidates & -self.candidates).bit_length() - 1]
+
+    def count_candidates(self) -> int:
+        """Number of current words that still fit all the feedback so far."""
+        return self.candidates.bit_count()
+
+    def get_targets(self) -> list:
+        return [board.target for board in self.boards]
+
+    def save_word_record(self):
+        """Save all important information from the current game."""
+        if self.good_guesses and not self.saved:
+            game_record = {"Result":self.outcome, "Target Word":self.current_target,
+                           "Good Guesses":self.good_guesses, "Bad Guesses":self.bad_guesses}
+            if self.difficulty is not None:
+                game_record["Difficulty"] = self.difficulty.name
+            if self.num_boards > 1:
+                game_record["Target Word"] = self.get_targets()
+                game_record["Solved At"] = [board.solved_at for board in self.boards]
+            grfile = save_to_json(f"WordleGameRecord_{'_'.join(self.get_targets())}", game_record)
+            self.saved = True
+            self.lgr.info(f"Saved game record as: {grfile}\n\n\n======================================\n")
+# END class WordleGameEngine
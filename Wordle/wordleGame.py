@@ -10,32 +10,24 @@ __author_name__    = "Mark Sattolo"
 __author_email__   = "epistemik@gmail.com"
 __python_version__ = "3.11+"
 __created__ = "2026-07-05"
-__updated__ = "2026-07-23"
+__updated__ = "2026-10-18"
 
-import random
 from sys import argv, path
-from PySide6.QtCore import Qt, QTimer, QEvent
-from PySide6.QtGui import QAction, QColor
+from threading import Event
+from PySide6.QtCore import Qt, QTimer, QEvent, QObject, QThreadPool, Signal
+from PySide6.QtGui import QAction, QActionGroup, QColor
 from PySide6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                               QPushButton, QMainWindow, QMessageBox, QLineEdit, QFrame, QComboBox)
+                               QPushButton, QMainWindow, QMessageBox, QLineEdit, QFrame, QComboBox, QGridLayout)
 path.append("/home/marksa/git/Python/utils")
 from mhsUtils import *
 from mhsLogging import *
-path.append("/home/marksa/git/Python/Games/input")
-from all_words import all_game_words as wordle_words
-
-# DEBUG_TARGET = "FELIS" # test words = MESSY, LEAFY, SILLY, AFFIX, SLIME, FLESH
-DEBUG_TARGET = "PUPPY" # test words = APPLE, PAPER, PLUMP, TAUPE, UPPER, GUPPY
-# DEBUG_TARGET = "GUPPY" # test words = PLUMP, PAPER, UPPER, UNDUE, PUPPY, BUGGY
-WORDLE_DEBUG = False
+path.append("/home/marksa/git/Python/Games/common")
+from wordleScore import Mark, decode_score, format_score
+from backgroundLoader import BackgroundLoader
+from startupProfile import mark, phase, PROFILE_OPTION
+from wordleEngine import *
 
 ORDERED_LETTERS = "AEIOUYLNRSTCDHMPBFGKWJQVXZ"
-MIN_WORD_LENGTH = 4
-DEFAULT_WORD_LENGTH = 5
-MAX_WORD_LENGTH = 13
-MIN_NUM_ROWS = 3
-DEFAULT_NUM_ROWS = 6
-MAX_NUM_ROWS = 10
 
 MEDIUM_FONT_SIZE = 16
 SMALL_FONT  = "font-size: 12pt;"
@@ -49,14 +41,56 @@ GUESS_BASIC_STYLESHEET  = f"{XLARGE_FONT}; color: blue;  background: white"
 GUESS_EXACT_STYLESHEET  = f"{XLARGE_FONT}; color: black; background: green; {FONT_BOLD}"
 GUESS_OCCUR_STYLESHEET  = f"{XLARGE_FONT}; color: black; background: yellow"
 GUESS_ABSENT_STYLESHEET = f"{XLARGE_FONT}; color: white; background: gray"
+GUESS_MARK_STYLESHEETS  = {Mark.EXACT:GUESS_EXACT_STYLESHEET, Mark.PRESENT:GUESS_OCCUR_STYLESHEET,
+                           Mark.ABSENT:GUESS_ABSENT_STYLESHEET}
+# smaller guess boxes when there are several boards
+MULTI_FONT = "font-size: 18pt;"
+MULTI_BASIC_STYLESHEET = GUESS_BASIC_STYLESHEET.replace(XLARGE_FONT, MULTI_FONT)
+MULTI_MARK_STYLESHEETS = {letter_mark:sheet.replace(XLARGE_FONT, MULTI_FONT) for letter_mark, sheet in GUESS_MARK_STYLESHEETS.items()}
 RESULT_BASIC_STYLESHEET  = f"{FONT_BOLD} {LARGE_FONT} color: black"
 RESULT_OCCUR_STYLESHEET  = f"{FONT_BOLD} {LARGE_FONT} color: green"
 RESULT_ABSENT_STYLESHEET = f"{FONT_BOLD} {LARGE_FONT} color: red"
 INFOBOX_STYLESHEET = f"{MEDIUM_FONT} color:deeppink; background:cyan"
 MSGBOX_STYLESHEET  = f"{MEDIUM_FONT} color:purple; background:lemonchiffon"
+# colors of the per-board squares of a result letter: what each board has shown about the letter, or unknown
+KEY_MARK_COLORS = {Mark.EXACT:"green", Mark.PRESENT:"goldenrod", Mark.ABSENT:"gray", None:"lightgray"}
+# boards side by side in each row of the guess section
+BOARD_COLUMNS = 4
+BOARD_NAMES = {2:"Dordle", 4:"Quordle", 8:"Octordle"}
+
 INPUTBOX_STYLESHEET = f"{SMALL_FONT} color: red; background: white" if WORDLE_DEBUG \
                       else f"{SMALL_FONT} color: {INPUT_COLOR}; background: {INPUT_COLOR}"
 
+class HintSearch(QObject):
+    """Run a hint search on a worker thread of the Qt thread pool, so the clock and input keep going;
+       progress(done, total) and found(hint, or None if NO hint) are emitted on the GUI thread."""
+    progress = Signal(int, int)
+    found = Signal(object)
+    failed = Signal(object)
+
+    def __init__(self, p_search):
+        # NO parent: the thread pool keeps the search alive until it finishes, even after it is cancelled
+        super().__init__()
+        self.search = p_search
+        self._cancelled = Event()
+
+    def start(self):
+        QThreadPool.globalInstance().start(self.run)
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def run(self):
+        try:
+            hint = self.search(self.progress.emit, self._cancelled.is_set)
+        except Exception as hsx:
+            self.failed.emit(hsx)
+            return
+        if not self._cancelled.is_set():
+            self.found.emit(hint)
+# END class HintSearch
+
+
 # noinspection PyAttributeOutsideInit
 class WordleUI(QMainWindow):
     """UI to play the Wordle game."""
@@ -83,16 +117,45 @@ class WordleUI(QMainWindow):
         wtimer.start(1000) # in msec = 1 second
         wtimer.timeout.connect(self.update_clock)
 
+        self.hint_search = None
+        self.adversarial_mode = False
+        self.difficulty = None
         self.create_menu()
+        # NO game to change until the words are loaded
+        self.enable_game_actions(False)
         self.container = None
-        self.reset()
+        # show the window right away, then load the words and start the game in the background
+        self.active = False
+        self.run_secs = 0
+        self.pause_secs = 0
+        self.lock_count = 0
+        loading_label = QLabel("Loading the words...")
+        loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        loading_label.setStyleSheet(MSGBOX_STYLESHEET)
+        self.setCentralWidget(loading_label)
         self.show()
+        QTimer.singleShot(0, lambda: mark("first paint"))
+        self.loader = BackgroundLoader("load Wordle words", load_word_data, self)
+        self.loader.loaded.connect(self.words_loaded)
+        self.loader.failed.connect(self.load_failed)
+        self.loader.start()
+
+    def words_loaded(self):
+        self.reset()
+        self.enable_game_actions(True)
+        mark("first game ready")
+
+    def load_failed(self, p_error:Exception):
+        self.lgr.error(f"Could NOT load the words: {repr(p_error)}")
+        QMessageBox.critical(self, self.windowTitle(), str(p_error))
+        QApplication.exit(66)
 
     def reset(self, p_strict:bool=False):
         """Reset all the fields needed to start a new game."""
         self.ge.save_word_record()
+        self.cancel_hint()
         self.lgr.info("Starting a NEW Game!")
-        self.ge.start(p_strict)
+        self.ge.start(p_strict, p_adversarial=self.adversarial_mode, p_difficulty=self.difficulty)
         self.active = True
         self.current_guess = ""
         self.active_row = 0
@@ -120,11 +183,16 @@ class WordleUI(QMainWindow):
         self.main_layout.addLayout(self.create_button_section())
         # set the central widget
         self.setCentralWidget(self.container)
-        self.info_box.setText(("Strict" if p_strict else "Regular") + " Mode")
+        self.info_box.setText(self.get_mode_text())
         self.msg_box.setText(f"Have  {(len(self.ge.current_words)):,}  {self.ge.word_length}-letter  words.")
+        if self.difficulty is not None and self.ge.difficulty is None and not self.ge.adversarial:
+            # the engine ignores a difficulty it has NO ratings for
+            self.msg_box.setText(f"NO  difficulty  ratings  for  {self.ge.word_length}-letter  words:"
+                                 f"  {self.difficulty.name.capitalize()}  is  ignored.")
         self.input_box.setFocus()
 
     def close(self, /):
+        self.cancel_hint()
         self.ge.save_word_record()
         super().close()
 
@@ -142,7 +210,13 @@ class WordleUI(QMainWindow):
         quit_action.setShortcut("Ctrl+Q")
         quit_action.setStatusTip("Quit the application")
         quit_action.triggered.connect(self.exit_inquiry)
+        hint_action = QAction("&Hint", self)
+        hint_action.setShortcut("Ctrl+H")
+        hint_action.setStatusTip("Suggest the most informative next guess")
+        hint_action.triggered.connect(self.show_hint)
         game_menu.addAction(new_action)
+        game_menu.addAction(hint_action)
+        self.game_actions = [new_action, hint_action]
         # game_menu.addSeparator()
         game_menu.addAction(quit_action)
 
@@ -162,10 +236,73 @@ class WordleUI(QMainWindow):
         mode_action.setStatusTip("Choose STRICT or REGULAR mode")
         mode_action.triggered.connect(self.mode_inquiry)
         settings_menu.addAction(mode_action)
+        absurdle_action = QAction("&Absurdle Mode", self)
+        absurdle_action.setShortcut("Ctrl+B")
+        absurdle_action.setCheckable(True)
+        absurdle_action.setStatusTip("NO secret word up front: each guess gets the feedback that leaves the most possible words")
+        absurdle_action.toggled.connect(self.set_adversarial_mode)
+        settings_menu.addAction(absurdle_action)
+        difficulty_menu = settings_menu.addMenu("&Difficulty")
+        difficulty_group = QActionGroup(self)
+        for difficulty in (None, *Difficulty):
+            difficulty_action = QAction(difficulty.name.capitalize() if difficulty is not None else "&Any", self)
+            difficulty_action.setCheckable(True)
+            difficulty_action.setChecked(difficulty is None)
+            difficulty_action.setStatusTip("Pick the secret words from this tier of the prebuilt difficulty ratings")
+            difficulty_action.triggered.connect(lambda _, d=difficulty: self.set_difficulty(d))
+            difficulty_group.addAction(difficulty_action)
+            difficulty_menu.addAction(difficulty_action)
+
+        self.settings_menu = settings_menu
 
         # see status tips at the bottom of the window
         self.statusBar()
 
+    def enable_game_actions(self, p_enabled:bool):
+        """The menu actions that change the game, and the UI that reset() builds, only work once a game has started."""
+        for action in self.game_actions:
+            action.setEnabled(p_enabled)
+        self.settings_menu.setEnabled(p_enabled)
+
+    def show_hint(self):
+        """Start looking for the best next guess, unless already looking."""
+        if not self.active or self.hint_search:
+            return
+        self.lgr.info("Look for a hint.")
+        self.hint_search = HintSearch(self.ge.get_hint_search())
+        self.hint_search.progress.connect(self.hint_progress)
+        self.hint_search.found.connect(self.hint_found)
+        self.hint_search.failed.connect(self.hint_failed)
+        self.msg_box.setText("Looking  for  a  hint...")
+        self.hint_search.start()
+
+    def cancel_hint(self):
+        """Stop looking for a hint, e.g. when the game changes."""
+        if self.hint_search:
+            self.hint_search.cancel()
+            self.hint_search = None
+
+    def hint_progress(self, p_done:int, p_total:int):
+        if self.sender() is self.hint_search and p_total:
+            self.msg_box.setText(f"Looking  for  a  hint...  {p_done * 100 // p_total}%")
+
+    def hint_found(self, p_hint):
+        if self.sender() is not self.hint_search:
+            return
+        self.hint_search = None
+        if p_hint is None:
+            self.msg_box.setText("NO  hint  available!")
+            return
+        self.lgr.info(f"Hint = {p_hint}")
+        self.msg_box.setText(f"Hint:  try  '{p_hint.guess}'  (about  {p_hint.expected_left:,.1f}  words  left)")
+
+    def hint_failed(self, p_error:Exception):
+        if self.sender() is not self.hint_search:
+            return
+        self.hint_search = None
+        self.lgr.error(f"Hint search failed: {repr(p_error)}")
+        self.msg_box.setText("Could NOT find a hint... :(")
+
     def copyrite(self):
         QMessageBox.information(self, "Copyright", "Copyright (c) 2026 Mark Sattolo <epistemik@gmail.com>")
 
@@ -200,6 +337,13 @@ class WordleUI(QMainWindow):
         self.numrows_combobox.setEditable(False)
         self.numrows_combobox.activated.connect(self.set_num_rows)
 
+        self.numboards_combobox = QComboBox(self)
+        self.numboards_combobox.insertItems(0, [str(t) for t in NUM_BOARDS])
+        self.numboards_combobox.setCurrentText(str(self.ge.num_boards))
+        self.numboards_combobox.setFrame(True)
+        self.numboards_combobox.setEditable(False)
+        self.numboards_combobox.activated.connect(self.set_num_boards)
+
         self.clock = QLabel()
         self.clock.setAlignment(Qt.AlignmentFlag.AlignCenter)
         cfont = self.font()
@@ -217,6 +361,9 @@ class WordleUI(QMainWindow):
         qhb_layout.addWidget(QLabel("number of rows:"))
         qhb_layout.addWidget(self.numrows_combobox)
         qhb_layout.setStretchFactor(self.numrows_combobox, 2)
+        qhb_layout.addWidget(QLabel("boards:"))
+        qhb_layout.addWidget(self.numboards_combobox)
+        qhb_layout.setStretchFactor(self.numboards_combobox, 2)
         right_spacer = QLabel()
         qhb_layout.addWidget(right_spacer)
         qhb_layout.setStretchFactor(right_spacer, 1)
@@ -238,6 +385,13 @@ class WordleUI(QMainWindow):
             self.ge.num_rows = new_num_rows
             self.reset(self.ge.strict_mode)
 
+    def set_num_boards(self):
+        new_num_boards = int(self.numboards_combobox.currentText())
+        if new_num_boards != self.ge.num_boards:
+            self.lgr.info(f"Setting number of boards to {new_num_boards}.")
+            self.ge.num_boards = new_num_boards
+            self.reset(self.ge.strict_mode)
+
     @staticmethod
     def create_guess_box(p_sidelen:int):
         guess_box = QLabel()
@@ -247,35 +401,48 @@ class WordleUI(QMainWindow):
         return guess_box
 
     def create_guess_section(self):
-        qvb_layout = QVBoxLayout()
-        self.guess_boxes = [[self.create_guess_box(75) for _ in range(self.ge.word_length)] for _ in range(self.ge.num_rows)]
-
-        layout_rows = []
-        for j in range(self.ge.num_rows):
-            self.lgr.debug(f"Setting guess row #{j}")
-            layout_rows.append(QHBoxLayout())
-            left_spacer = QLabel()
-            layout_rows[j].addWidget(left_spacer)
-            layout_rows[j].setStretchFactor(left_spacer, 2)
-            for k in range(self.ge.word_length):
-                self.lgr.debug(f"Setting guess box #{j}-{k}")
-                layout_rows[j].addWidget(self.guess_boxes[j][k])
-                layout_rows[j].setStretchFactor(self.guess_boxes[j][k], 1)
-            right_spacer = QLabel()
-            layout_rows[j].addWidget(right_spacer)
-            layout_rows[j].setStretchFactor(right_spacer, 2)
-            qvb_layout.addItem(layout_rows[j])
-        return qvb_layout
-
-    def reset_guesses(self, p_style:str=GUESS_BASIC_STYLESHEET):
-        for i in range(self.ge.num_rows):
-            self.clear_guess_row(i)
-            for j in range(self.ge.word_length):
-                self.guess_boxes[i][j].setStyleSheet(p_style)
-
-    def clear_guess_row(self, p_row:int):
-        for i in range(self.ge.word_length):
-            self.guess_boxes[p_row][i].clear()
+        """A grid of guess boxes for each board, BOARD_COLUMNS boards side by side: guess_boxes[board][row][column]."""
+        sidelen = 75 if self.ge.num_boards == 1 else 40
+        self.guess_boxes = [[[self.create_guess_box(sidelen) for _ in range(self.ge.word_length)]
+                             for _ in range(self.ge.total_rows)] for _ in range(self.ge.num_boards)]
+        boards_layout = QGridLayout()
+        for i in range(self.ge.num_boards):
+            qvb_layout = QVBoxLayout()
+            layout_rows = []
+            for j in range(self.ge.total_rows):
+                self.lgr.debug(f"Setting guess row #{i}-{j}")
+                layout_rows.append(QHBoxLayout())
+                left_spacer = QLabel()
+                layout_rows[j].addWidget(left_spacer)
+                layout_rows[j].setStretchFactor(left_spacer, 2)
+                for k in range(self.ge.word_length):
+                    self.lgr.debug(f"Setting guess box #{i}-{j}-{k}")
+                    layout_rows[j].addWidget(self.guess_boxes[i][j][k])
+                    layout_rows[j].setStretchFactor(self.guess_boxes[i][j][k], 1)
+                right_spacer = QLabel()
+                layout_rows[j].addWidget(right_spacer)
+                layout_rows[j].setStretchFactor(right_spacer, 2)
+                qvb_layout.addItem(layout_rows[j])
+            boards_layout.addLayout(qvb_layout, i // BOARD_COLUMNS, i % BOARD_COLUMNS)
+        return boards_layout
+
+    def reset_guesses(self, p_style:str=None):
+        style = p_style if p_style else GUESS_BASIC_STYLESHEET if self.ge.num_boards == 1 else MULTI_BASIC_STYLESHEET
+        for board_boxes in self.guess_boxes:
+            for row_boxes in board_boxes:
+                for guess_box in row_boxes:
+                    guess_box.clear()
+                    guess_box.setStyleSheet(style)
+
+    def get_active_boxes(self) -> list:
+        """The guess boxes of the active row on each board NOT solved yet: the only ones a keystroke or a guess changes."""
+        return [board_boxes[self.active_row] for board, board_boxes in zip(self.ge.boards, self.guess_boxes)
+                if not board.solved or board.solved_at > self.active_row]
+
+    def clear_guess_row(self):
+        for row_boxes in self.get_active_boxes():
+            for guess_box in row_boxes:
+                guess_box.clear()
 
     def create_msg_box(self, p_style:str=MSGBOX_STYLESHEET):
         self.msg_box = QLabel()
@@ -312,8 +479,19 @@ class WordleUI(QMainWindow):
         return qvb_layout
 
     def reset_results(self):
-        for i in range(len(ORDERED_LETTERS)):
-            self.result_boxes[i].setStyleSheet(RESULT_BASIC_STYLESHEET)
+        for letter, result_box in zip(ORDERED_LETTERS, self.result_boxes):
+            result_box.setStyleSheet(RESULT_BASIC_STYLESHEET)
+            if self.ge.num_boards > 1:
+                result_box.setTextFormat(Qt.TextFormat.RichText)
+                result_box.setText(self.get_key_text(letter))
+
+    def get_key_text(self, p_letter:str) -> str:
+        """A result letter over one small square per board, colored by what that board has shown about the letter;
+           hollow once the board is solved."""
+        squares = "".join("&#9633;" if board.solved
+                          else f"<span style='color:{KEY_MARK_COLORS[board.get_letter_mark(p_letter)]}'>&#9632;</span>"
+                          for board in self.ge.boards)
+        return f"{p_letter}<br><span style='{SMALL_FONT}'>{squares}</span>"
 
     # prevent input box from stealing focus when cursor over a button
     def eventFilter(self, p_obj, p_event):
@@ -364,14 +542,13 @@ class WordleUI(QMainWindow):
         if not self.active:
             return
         self.lgr.info(f"Response changed to '{p_resp}'; Input box text = {self.input_box.text()}")
-        self.clear_guess_row(self.active_row)
+        self.clear_guess_row()
         self.msg_box.setText(f"Row {self.active_row+1} is active. Text = '{p_resp}'")
         if p_resp:
             self.current_guess = p_resp
-            current_box = 0
-            for letter in p_resp:
-                self.guess_boxes[self.active_row][current_box].setText(letter)
-                current_box += 1
+            for row_boxes in self.get_active_boxes():
+                for guess_box, letter in zip(row_boxes, p_resp):
+                    guess_box.setText(letter)
 
     def process_response(self):
         """'Enter' key was pressed so check if the current response is a valid word then mark the guess and result boxes."""
@@ -382,12 +559,18 @@ class WordleUI(QMainWindow):
         if not entry:
             return
         if self.ge.check_guess(entry, self.active_row):
+            self.cancel_hint()
             self.mark_current_guess()
             self.active_row += 1
             self.current_guess = ""
             self.input_box.clear()
-            if self.active and self.active_row == self.ge.num_rows:
+            if self.active and self.active_row == self.ge.total_rows:
                 self.success(False)
+            elif self.active and self.ge.num_boards == 1:
+                self.msg_box.setText(f"{self.ge.count_candidates():,}  possible  words  left.")
+            elif self.active:
+                self.msg_box.setText("Possible  words  left:  " + "  |  ".join("solved" if board.solved
+                                     else f"{board.candidates.bit_count():,}" for board in self.ge.boards))
         else:
             mesg = self.ge.info_mesg if self.ge.info_mesg else f"'{entry}' is NOT a valid word... :("
             self.lgr.info(mesg)
@@ -395,62 +578,36 @@ class WordleUI(QMainWindow):
         self.ge.info_mesg = ""
 
     def mark_current_guess(self):
-        """Mark the current guess boxes as green, yellow or grey & the result letters as green or red."""
+        """Mark the current guess boxes of each board still in play as green, yellow or grey
+           & the result letters as green if found on any of those boards, otherwise red;
+           with several boards each result letter also shows every board's own state of the letter."""
         # GUESS boxes
-        guess_idx = [ _ for _ in range(len(self.current_guess)) ]
-        self.lgr.debug(f"guess index list = {guess_idx}.")
-        targ = self.ge.current_target
-        for i in range(self.ge.word_length):
-            # EXACT match of letter position in guess and target
-            if self.current_guess[i] == self.ge.current_target[i]:
-                self.guess_boxes[self.active_row][i].setStyleSheet(GUESS_EXACT_STYLESHEET)
-                guess_idx.remove(i)
-                if i not in self.ge.green_index:
-                    self.ge.green_index.append(i)
-                    self.ge.green_index.sort()
-                    self.lgr.debug(f"self.ge.green_index = {self.ge.green_index}")
-                tdx = targ.index(self.ge.current_target[i])
-                targ = targ[:tdx] + targ[tdx+1:]
-                self.lgr.info(f"Exact @ [{i}] > '{self.current_guess[i]}'; targ = '{targ}'; "
-                              f"current target = '{self.ge.current_target}'")
-            # guessed letter is ABSENT from target
-            elif self.current_guess[i] not in self.ge.current_target:
-                self.guess_boxes[self.active_row][i].setStyleSheet(GUESS_ABSENT_STYLESHEET)
-                guess_idx.remove(i)
-                self.lgr.info(f"Absent @ [{i}] > '{self.current_guess[i]}'; current target = '{self.ge.current_target}'")
-            else:
-                self.lgr.info(f"Occurrence of '{self.current_guess[i]}' at [{i}].")
-        self.lgr.debug(f"guess = '{guess_idx}'; targ = '{targ}'")
-        # find target letters present in the guess but at a different position
-        for j in guess_idx:
-            if self.current_guess[j] in targ:
-                self.guess_boxes[self.active_row][j].setStyleSheet(GUESS_OCCUR_STYLESHEET)
-                self.lgr.debug(f"Index[{j}]: Mark occurrence of '{self.current_guess[j]}'")
-                if self.current_guess[j] not in self.ge.yellow_list:
-                    self.ge.yellow_list.append(self.current_guess[j])
-                    self.lgr.debug(f"self.ge.yellow_list = {self.ge.yellow_list}")
-                gdx = targ.index(self.current_guess[j])
-                targ = targ[:gdx] + targ[gdx+1:]
-                self.lgr.info(f"Occurrence @ [{j}] > '{self.current_guess[j]}'; targ = '{targ}'; "
-                              f"current target = '{self.ge.current_target}'")
-            else:
-                self.guess_boxes[self.active_row][j].setStyleSheet(GUESS_ABSENT_STYLESHEET)
-                self.lgr.info(f"Absent @ [{j}] > '{self.current_guess[j]}'; targ = '{targ}'")
-        # RESULT boxes
-        for j in range(len(self.result_boxes)):
-            check_letter = self.result_boxes[j].text()
-            if check_letter in self.current_guess:
-                if check_letter in self.ge.current_target:
-                    self.result_boxes[j].setStyleSheet(RESULT_OCCUR_STYLESHEET)
-                else:
-                    self.result_boxes[j].setStyleSheet(RESULT_ABSENT_STYLESHEET)
-        if self.current_guess == self.ge.current_target:
+        stylesheets = GUESS_MARK_STYLESHEETS if self.ge.num_boards == 1 else MULTI_MARK_STYLESHEETS
+        scores = [board.score for board in self.ge.boards if not board.solved or board.solved_at > self.active_row]
+        found = set()
+        for row_boxes, board_score in zip(self.get_active_boxes(), scores):
+            marks = decode_score(board_score, self.ge.word_length)
+            for guess_box, letter_mark in zip(row_boxes, marks):
+                guess_box.setStyleSheet(stylesheets[letter_mark])
+            found.update(lett for lett, letter_mark in zip(self.current_guess, marks) if letter_mark != Mark.ABSENT)
+        self.lgr.info(f"Marks for '{self.current_guess}' = "
+                      f"{[format_score(board_score, self.ge.word_length) for board_score in scores]}")
+        # RESULT boxes: the guess's letters, or all of them if a board was just solved as its squares all change
+        just_solved = any(board.solved_at == self.active_row + 1 for board in self.ge.boards)
+        for letter, result_box in zip(ORDERED_LETTERS, self.result_boxes):
+            if letter in self.current_guess:
+                result_box.setStyleSheet(RESULT_OCCUR_STYLESHEET if letter in found else RESULT_ABSENT_STYLESHEET)
+            if self.ge.num_boards > 1 and (just_solved or letter in self.current_guess):
+                result_box.setText(self.get_key_text(letter))
+        if self.ge.is_solved():
             self.success(True)
 
     def success(self, p_victory:bool):
         self.ge.outcome = "Victory!" if p_victory else "Failure."
         self.msg_box.setText(f"{self.ge.outcome}  :)" if p_victory
-                             else f"{self.ge.outcome}..  :(  The secret word was '{self.ge.current_target}'.")
+                             else f"{self.ge.outcome}..  :(  The secret word was '{self.ge.current_target}'."
+                             if self.ge.num_boards == 1
+                             else f"{self.ge.outcome}..  :(  The secret words were {', '.join(self.ge.get_targets())}.")
         self.info_box.setText(self.ge.outcome)
         self.lgr.info(self.ge.outcome)
         self.active = False
@@ -500,13 +657,31 @@ class WordleUI(QMainWindow):
         confirm_box.exec()
         if confirm_box.clickedButton() == strict_button:
             self.ge.strict_mode = True
-            self.info_box.setText("Strict Mode")
+            self.info_box.setText(self.get_mode_text())
             self.lgr.info("SET strict mode.")
         elif confirm_box.clickedButton() == regular_button:
             self.ge.strict_mode = False
-            self.info_box.setText("Regular Mode")
+            self.info_box.setText(self.get_mode_text())
             self.lgr.info("SET regular mode.")
 
+    def get_mode_text(self) -> str:
+        return ("Strict" if self.ge.strict_mode and self.ge.num_boards == 1 else "Regular") + " Mode" \
+               + (" (Absurdle)" if self.ge.adversarial else f" ({BOARD_NAMES[self.ge.num_boards]})" if self.ge.num_boards > 1 else "") \
+               + (f" [{self.ge.difficulty.name.capitalize()}]" if self.ge.difficulty is not None else "")
+
+    def set_adversarial_mode(self, p_checked:bool):
+        """Turning Absurdle mode on or off starts a NEW game."""
+        self.adversarial_mode = p_checked
+        self.lgr.info(f"SET Absurdle mode {"on" if p_checked else "off"}.")
+        self.reset(self.ge.strict_mode)
+
+    def set_difficulty(self, p_difficulty:Difficulty):
+        """Changing the difficulty starts a NEW game."""
+        if p_difficulty != self.difficulty:
+            self.difficulty = p_difficulty
+            self.lgr.info(f"SET difficulty to {p_difficulty.name if p_difficulty is not None else 'Any'}.")
+            self.reset(self.ge.strict_mode)
+
     def display_instructions(self):
         """Display 'How to play Wordle'."""
         infobox = QMessageBox()
@@ -556,106 +731,11 @@ class WordleUI(QMainWindow):
         return confirm_box, strict_button, regular_button
 # END class WordleUI
 
-# noinspection PyAttributeOutsideInit
-class WordleGameEngine:
-    """The Wordle game internal data and procedures."""
-    def __init__(self, p_lgr:logging.Logger, p_len:int=DEFAULT_WORD_LENGTH, p_rows:int=DEFAULT_NUM_ROWS):
-        self.lgr = p_lgr
-        if MIN_WORD_LENGTH <= p_len <= MAX_WORD_LENGTH:
-            self.word_length = p_len
-        if MIN_NUM_ROWS <= p_rows <= MAX_NUM_ROWS:
-            self.num_rows = p_rows
-        self.instructions = ("\tHow to Play Wordle:\n"
-                        "---------------------------------------------------------------------------------\n"
-                        f"1) Try to guess the secret {self.word_length}-letter word.\n\n"
-                        f"2) Type a {self.word_length}-letter word and press ENTER to evaluate it. "
-                        f" Your entry will be accepted if it is a VALID Wordle word.\n\n"
-                        "3) Each letter in the correct position will shade GREEN.\n\n"
-                        "4) Letters present in the secret word but in the WRONG POSITION in your guess will shade YELLOW.\n\n"
-                        "5) Any letter NOT present in the secret word will shade GREY.\n\n"
-                        "6) In STRICT mode any 'green' and 'yellow' letters found in a guess MUST be used in subsequent guesses.\n\n"
-                        f"7) You have {self.num_rows} attempts to find the secret word.\n\n"
-                        "8) >> Resetting the word length or number of rows will start a BRAND NEW game.\n\n"
-                        "9) If you Quit the app (Ctrl-Q) or start a New word (Ctrl-N) your current game results will be saved to a file.")
-        self.good_guesses = None
-        self.lgr.info(f"Initialized Game Engine >> Word length = {self.word_length}; Number of rows = {self.num_rows}.")
-
-    def start(self, p_strict:bool=False):
-        """Set starting values for a new game."""
-        self.previous_guesses = []
-        self.num_guesses = 0
-        self.good_guesses = []
-        self.bad_guesses = []
-        self.green_index = []
-        self.yellow_list = []
-        self.info_mesg = ""
-        self.strict_mode = p_strict
-        self.saved = False
-        self.outcome = ""
-        self.get_current_words()
-        self.current_target = DEBUG_TARGET if WORDLE_DEBUG else self.current_words[random.randrange(0, len(self.current_words))]
-        self.lgr.info(f"current target word = {self.current_target}; total number of words = {len(self.current_words)}")
-
-    def get_current_words(self):
-        """Get all words that match the current word length."""
-        self.current_words = []
-        for wd in wordle_words:
-            if len(wd) == self.word_length:
-                self.current_words.append(wd)
-
-    def check_guess(self, p_resp:str, p_current_row:int) -> bool:
-        """Check for a valid response."""
-        self.lgr.debug(f"check response '{p_resp}'.")
-        if p_resp == self.current_target:
-            self.lgr.info("Found the target word!")
-            result = True
-        elif p_resp not in self.current_words:
-            result = False
-        elif p_current_row > 0 and self.strict_mode:
-            result = self.checkguess_strict(p_resp)
-        else:
-            self.lgr.info(f"'{p_resp}' is a valid word.")
-            result = True
-        if result:
-            self.previous_guesses.append(p_resp)
-            self.num_guesses += 1
-            self.good_guesses.append(p_resp)
-            return True
-        self.bad_guesses.append(p_resp)
-        if check_plural(p_resp, wordle_words):
-            self.info_mesg = "Most simple plurals are just IGNORED..."
-        return False
-
-    def checkguess_strict(self, p_resp:str) -> bool:
-        """Make sure that previous green and yellow responses are carried over."""
-        self.lgr.debug(f"check response '{p_resp}' in STRICT mode.")
-        for gi in self.green_index:
-            if p_resp[gi] != self.current_target[gi]:
-                self.info_mesg = f"Missing green '{self.current_target[gi]}' at position {gi+1}."
-                self.lgr.info(self.info_mesg)
-                return False
-        for yl in self.yellow_list:
-            if yl not in p_resp:
-                self.info_mesg = f"Missing yellow '{yl}'."
-                self.lgr.info(self.info_mesg)
-                return False
-        return True
-
-    def save_word_record(self):
-        """Save all important information from the current game."""
-        if self.good_guesses and not self.saved:
-            game_record = {"Result":self.outcome, "Target Word":self.current_target,
-                           "Good Guesses":self.good_guesses, "Bad Guesses":self.bad_guesses}
-            grfile = save_to_json(f"WordleGameRecord_{self.current_target}", game_record)
-            self.saved = True
-            self.lgr.info(f"Saved game record as: {grfile}\n\n\n======================================\n")
-# END class WordleGameEngine
-
 
 log_control = MhsLogger(WordleUI.__name__, con_level = DEFAULT_LOG_LEVEL)
 
 def wordle_main():
-    usage_text = f"Usage: python3 {get_filename(argv[0])} [$word_length] [$num_rows]\n"
+    usage_text = f"Usage: python3 {get_filename(argv[0])} [$word_length] [$num_rows] [{PROFILE_OPTION}]\n"
     if len(argv) > 3:
         print(usage_text)
         log_control.debug("Usage instructions.")
@@ -664,25 +744,29 @@ def wordle_main():
     app = None
     code = 0
     try:
-        app = QApplication(argv)
+        with phase("create QApplication"):
+            app = QApplication(argv)
         if len(argv) > 2:
             if not argv[1].isdigit() or not argv[2].isdigit():
                 print(usage_text)
                 log_control.debug("Invalid arguments.")
                 raise Exception("Invalid arguments.")
-            window = WordleUI(int(argv[1]), int(argv[2]))
+            with phase("create main window"):
+                window = WordleUI(int(argv[1]), int(argv[2]))
             log_control.info(f"argv[1]: {argv[1]}, argv[2]: {argv[2]}")
         elif len(argv) > 1:
             if not argv[1].isdigit():
                 print(usage_text)
                 log_control.debug("Invalid argument.")
                 raise Exception("Invalid argument.")
-            window = WordleUI(int(argv[1]))
+            with phase("create main window"):
+                window = WordleUI(int(argv[1]))
             log_control.info(f"argv[1]: {argv[1]}, p_rows = {DEFAULT_NUM_ROWS}")
         else:
-            window = WordleUI()
+            with phase("create main window"):
+                window = WordleUI()
             log_control.debug("No command line arguments.")
-        app.exec()
+        code = app.exec()
     except KeyboardInterrupt as mki:
         log_control.exception(mki)
         code = 13
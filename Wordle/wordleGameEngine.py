@@ -10,15 +10,21 @@ __author_name__    = "Mark Sattolo"
 __author_email__   = "epistemik@gmail.com"
 __python_version__ = "3.11+"
 __created__ = "2026-03-05"
-__updated__ = "2026-07-05"
+__updated__ = "2026-10-18"
 
 import random
 from sys import path
 path.append("/home/marksa/git/Python/utils")
 from mhsUtils import *
 from mhsLogging import *
-path.append("/home/marksa/git/Python/Games/Wordle/input")
-from wordle_words import all_wordle_words as all_words
+path.append("/home/marksa/git/Python/Games/common")
+from wordCorpus import WordTag
+from corpusBuilder import load_game_words
+from wordIndex import get_word_index
+
+answer_index = get_word_index(load_game_words(WordTag.WORDLE_ANSWER))
+answer_index.load_length_buckets()
+all_words = load_game_words(WordTag.WORDLE_ALLOWED)
 
 MIN_WORD_LENGTH = 5
 MAX_WORD_LENGTH = 9
@@ -42,7 +48,8 @@ class GameEngine:
         self.num_guesses = 0
         self.saved = False
         self.good_guesses = []
-        self.current_target = all_words[random.randrange(0, len(all_words))]
+        targets = answer_index.length_bucket(self.word_length)
+        self.current_target = targets[random.randrange(0, len(targets))]
         self.lgr.info(f"current target word = {self.current_target}")
 
     def save_record(self):
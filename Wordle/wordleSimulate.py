@@ -0,0 +1,154 @@
+##############################################################################################################################
+# coding=utf-8
+#
+# wordleSimulate.py
+#   -- play the Wordle game engine headlessly for every target word of a length, in regular and strict mode,
+#      with a pluggable guessing strategy, spread over all the CPUs; e.g. to see the effect of a word list change
+#
+# Copyright (c) 2026 Mark Sattolo <epistemik@gmail.com>
+
+__author_name__    = "Mark Sattolo"
+__author_email__   = "epistemik@gmail.com"
+__python_version__ = "3.11+"
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+import importlib
+import logging
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from sys import argv
+from time import perf_counter
+import wordleEngine
+from wordleEngine import WordleGameEngine, load_word_data, DEFAULT_WORD_LENGTH, DEFAULT_NUM_ROWS, \
+                         MIN_WORD_LENGTH, MAX_WORD_LENGTH, MIN_NUM_ROWS, MAX_NUM_ROWS
+from patternIndex import get_bit_indexes
+
+DEFAULT_STRATEGY = "entropy"
+# games played by each task of the process pool
+GAMES_PER_TASK = 64
+RANDOM_SEED = 1
+HISTOGRAM_WIDTH = 50
+
+# name -> function(p_engine:WordleGameEngine, p_rng:random.Random) that returns the next guess
+STRATEGIES = {}
+
+def strategy(p_name:str):
+    """Register a guessing strategy under p_name. A strategy in another module can also be used without
+       registering it, by giving its name as 'module:function'."""
+    def register(p_function):
+        STRATEGIES[p_name] = p_function
+        return p_function
+    return register
+
+@strategy("first")
+def first_candidate(p_engine:WordleGameEngine, p_rng:random.Random) -> str:
+    """The first word, alphabetically, that still fits all the feedback."""
+    bits = p_engine.candidates
+    return p_engine.current_words[(bits & -bits).bit_length() - 1]
+
+@strategy("random")
+def random_candidate(p_engine:WordleGameEngine, p_rng:random.Random) -> str:
+    """Any word that still fits all the feedback."""
+    return p_engine.current_words[p_rng.choice(get_bit_indexes(p_engine.candidates))]
+
+@strategy("entropy")
+def best_hint(p_engine:WordleGameEngine, p_rng:random.Random) -> str:
+    """The guess the Hint action would suggest."""
+    return p_engine.get_hint_search()(None, None).guess
+
+def get_strategy(p_name:str):
+    if p_name in STRATEGIES:
+        return STRATEGIES[p_name]
+    module, _, function = p_name.partition(':')
+    if not function:
+        raise ValueError(f"Unknown strategy '{p_name}': use one of {sorted(STRATEGIES)} or 'module:function'")
+    return getattr(importlib.import_module(module), function)
+
+
+def play_games(p_length:int, p_rows:int, p_strict:bool, p_strategy:str, p_targets:list, p_seed:int) -> list:
+    """Process pool task: play one game for each target word.
+       >> return the number of guesses each game took, or 0 if NOT solved"""
+    load_word_data()
+    lgr = logging.getLogger("wordleSimulate")
+    lgr.setLevel(logging.WARNING)
+    engine = WordleGameEngine(lgr, p_length, p_rows)
+    choose = get_strategy(p_strategy)
+    rng = random.Random(p_seed)
+    results = []
+    for target in p_targets:
+        engine.start(p_strict, target)
+        solved = 0
+        for row in range(p_rows):
+            guess = choose(engine, rng)
+            if not engine.check_guess(guess, row):
+                raise ValueError(f"Strategy '{p_strategy}' guessed '{guess}' for '{target}', which is NOT accepted:"
+                                 f" {engine.info_mesg}")
+            if guess == target:
+                solved = row + 1
+                break
+        results.append(solved)
+    return results
+
+def simulate(p_length:int, p_rows:int, p_strict:bool, p_strategy:str, p_max_games:int=0, p_workers:int=None) -> list:
+    """Play every target word of p_length (or a random sample of p_max_games of them) over a pool of processes.
+       >> return the number of guesses of each game, 0 if NOT solved"""
+    get_strategy(p_strategy)
+    load_word_data()
+    targets = list(wordleEngine.wordle_index.length_bucket(p_length))
+    rng = random.Random(RANDOM_SEED)
+    if 0 < p_max_games < len(targets):
+        targets = rng.sample(targets, p_max_games)
+    tasks = [targets[start:start+GAMES_PER_TASK] for start in range(0, len(targets), GAMES_PER_TASK)]
+    # drawn from the sampling rng AFTER the sample, so NO task rng replays the sequence that picked its targets
+    seeds = [rng.getrandbits(64) for _ in tasks]
+    results = []
+    with ProcessPoolExecutor(p_workers) as pool:
+        for task_results in pool.map(play_games, repeat(p_length), repeat(p_rows), repeat(p_strict), repeat(p_strategy),
+                                     tasks, seeds):
+            results.extend(task_results)
+    return results
+
+def report(p_results:list, p_rows:int, p_title:str):
+    """Print the win rate, the mean number of guesses of the wins and a histogram of the guesses."""
+    counts = Counter(p_results)
+    wins = len(p_results) - counts[0]
+    print(f"\n{p_title}: {len(p_results):,} games")
+    if not p_results:
+        return
+    print(f"\tWin rate = {wins * 100 / len(p_results):.2f}%;"
+          f" mean guesses = {sum(p_results) / wins if wins else 0:.3f}")
+    most = max(counts.values())
+    for num_guesses in list(range(1, p_rows + 1)) + [0]:
+        count = counts[num_guesses]
+        print(f"\t{num_guesses if num_guesses else 'X':>2}: {count:7,} {'#' * round(count * HISTOGRAM_WIDTH / most)}")
+
+
+if __name__ == "__main__":
+    usage_text = f"Usage: python3 {argv[0].split('/')[-1]} [$word_length [$num_rows [$strategy [$max_games]]]]" \
+                 f"\n\tstrategy = {' | '.join(STRATEGIES)} | module:function (default = {DEFAULT_STRATEGY});" \
+                 f" max_games = 0 for all the words (the default)"
+    args = argv[1:]
+    if len(args) > 4 or any(not arg.isdigit() for i, arg in enumerate(args) if i != 2):
+        print(usage_text)
+        exit(0)
+    word_length = int(args[0]) if args else DEFAULT_WORD_LENGTH
+    num_rows = int(args[1]) if len(args) > 1 else DEFAULT_NUM_ROWS
+    strategy_name = args[2] if len(args) > 2 else DEFAULT_STRATEGY
+    max_games = int(args[3]) if len(args) > 3 else 0
+    if not MIN_WORD_LENGTH <= word_length <= MAX_WORD_LENGTH or not MIN_NUM_ROWS <= num_rows <= MAX_NUM_ROWS:
+        print(usage_text)
+        exit(0)
+    try:
+        get_strategy(strategy_name)
+    except (ValueError, ImportError, AttributeError) as gsx:
+        print(f"{gsx}\n{usage_text}")
+        exit(64)
+    for strict in (False, True):
+        start = perf_counter()
+        game_results = simulate(word_length, num_rows, strict, strategy_name, max_games)
+        report(game_results, num_rows, f"{'Strict' if strict else 'Regular'} mode, {word_length} letters,"
+                                       f" {num_rows} rows, strategy '{strategy_name}' ({perf_counter() - start:.1f} s)")
+    exit(0)
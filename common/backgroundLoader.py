@@ -0,0 +1,39 @@
+##############################################################################################################################
+# coding=utf-8
+#
+# backgroundLoader.py
+#   -- run a slow loading function in the Qt thread pool so that the main window can be shown first
+#
+# Copyright (c) 2026 Mark Sattolo <epistemik@gmail.com>
+
+__author_name__    = "Mark Sattolo"
+__author_email__   = "epistemik@gmail.com"
+__python_version__ = "3.10+"
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+from PySide6.QtCore import QObject, QThreadPool, Signal
+from startupProfile import phase
+
+class BackgroundLoader(QObject):
+    """Call p_load on a worker thread; loaded or failed(exception) is then emitted on the GUI thread."""
+    loaded = Signal()
+    failed = Signal(object)
+
+    def __init__(self, p_name:str, p_load, p_parent:QObject=None):
+        super().__init__(p_parent)
+        self.name = p_name
+        self.load = p_load
+
+    def start(self):
+        QThreadPool.globalInstance().start(self.run)
+
+    def run(self):
+        try:
+            with phase(self.name):
+                self.load()
+        except Exception as lex:
+            self.failed.emit(lex)
+            return
+        self.loaded.emit()
+# END class BackgroundLoader
@@ -0,0 +1,138 @@
+##############################################################################################################################
+# coding=utf-8
+#
+# corpusBuilder.py
+#   -- merge all the word list files into one deduplicated, normalized and tagged corpus file,
+#      reporting malformed entries such as a missing comma between two list items
+#
+# Copyright (c) 2026 Mark Sattolo <epistemik@gmail.com>
+
+__author_name__    = "Mark Sattolo"
+__author_email__   = "epistemik@gmail.com"
+__python_version__ = "3.10+"
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+import os.path as osp
+import re
+from sys import argv
+from wordCorpus import GAMES_FOLDER, GAMES_INPUT_FOLDER, CORPUS_SUFFIX, WordTag, WordCorpus, CorpusView, compile_corpus
+from indexCache import get_index_cache
+
+TAGGED_CORPUS_FILE = osp.join(GAMES_INPUT_FOLDER, "game_words" + CORPUS_SUFFIX)
+
+# every word list in the repo (relative to GAMES_FOLDER) and the tags given to each of its words;
+# a word found in several lists gets all of their tags
+CORPUS_SOURCES = {
+    "input/all_words.py"                  : WordTag.SB_ALLOWED | WordTag.WORDLE_ANSWER | WordTag.WORDLE_ALLOWED,
+    "input/all_words_alt.py"              : WordTag.WORDLE_ALLOWED,
+    "SpellingBee/input/all_words.py"      : WordTag.WORDLE_ALLOWED,
+    "SpellingBee/input/all_words-orig.py" : WordTag.WORDLE_ALLOWED,
+    "SpellingBee/input/spellingbee_words.py"   : WordTag.WORDLE_ALLOWED,
+    "SpellingBee/input/spellingbee_words.json" : WordTag.WORDLE_ALLOWED,
+    "SpellingBee/input/spellingbee_words.txt"  : WordTag.WORDLE_ALLOWED,
+    "SpellingBee/input/pangrams.py"       : WordTag.PANGRAM,
+    "SpellingBee/input/pangrams.json"     : WordTag.PANGRAM,
+    "SpellingBee/input/pangrams.txt"      : WordTag.PANGRAM,
+    "SpellingBee/input/sb_pangrams.py"    : WordTag.PANGRAM,
+    "Wordle/input/wordle_words.py"        : WordTag.WORDLE_ALLOWED,
+    "Wordle/input/wordle_words_long.py"   : WordTag.WORDLE_ALLOWED,
+    "Wordle/input/all_wordle_words.py"    : WordTag.WORDLE_ALLOWED,
+    "Wordle/input/all_wordle_words.json"  : WordTag.WORDLE_ALLOWED,
+}
+
+# a quoted list item and the comma (if any) after it
+ITEM_PATTERN = re.compile(r'"([^"\\]*)"\s*(,?)')
+# lines that are only list structure: 'name = [', '[', ']' or a comment
+STRUCTURE_PATTERN = re.compile(r'^\s*(\w+\s*=\s*\[|\[|\]|#.*)?\s*$')
+VALID_WORD = re.compile(r"^[A-Z]+$")
+
+def parse_word_lines(p_source:str, p_problems:list):
+    """Read a python, JSON or text word list one line at a time WITHOUT evaluating it.
+       Each item is yielded separately, so two items with no comma between them (which python would silently join
+       into one word) are both kept, and reported in p_problems along with any other malformed line.
+       >> yield each raw list item"""
+    name = osp.relpath(p_source, GAMES_FOLDER)
+    missing_comma = None
+    with open(p_source, encoding="utf-8") as src:
+        for line_num, line in enumerate(src, start=1):
+            items = ITEM_PATTERN.findall(line)
+            if not items:
+                if not STRUCTURE_PATTERN.match(line):
+                    p_problems.append(f"{name}:{line_num}: unrecognized line '{line.strip()}'")
+                if ']' in line:
+                    missing_comma = None
+                continue
+            for item, comma in items:
+                if missing_comma:
+                    p_problems.append(f"{name}:{missing_comma[0]}: missing comma after '{missing_comma[1]}'"
+                                      f" >> would be joined to '{item}'")
+                missing_comma = None if comma else (line_num, item)
+                yield line_num, item
+
+def build_tagged_corpus(p_sources:dict=None, p_outfile:str=TAGGED_CORPUS_FILE) -> tuple:
+    """Merge all the source word lists, in one pass over each file, into a single tagged corpus file.
+       Missing source files are skipped; invalid words are reported and left out.
+       >> return the hex content hash and the list of problems found"""
+    sources = CORPUS_SOURCES if p_sources is None else p_sources
+    problems = []
+    word_tags = {}
+    for rel_source, tags in sources.items():
+        source = osp.join(GAMES_FOLDER, rel_source)
+        if not osp.isfile(source):
+            problems.append(f"{rel_source}: file NOT found")
+            continue
+        seen = set()
+        for line_num, item in parse_word_lines(source, problems):
+            word = item.strip().upper()
+            if not VALID_WORD.match(word):
+                problems.append(f"{rel_source}:{line_num}: invalid word '{item}'")
+                continue
+            if word in seen:
+                problems.append(f"{rel_source}:{line_num}: duplicate word '{word}'")
+            seen.add(word)
+            word_tags[word] = word_tags.get(word, 0) | tags
+    return compile_corpus(word_tags, p_outfile), problems
+
+def is_stale(p_file:str=TAGGED_CORPUS_FILE, p_sources:dict=None) -> bool:
+    if not osp.exists(p_file):
+        return True
+    corpus_time = osp.getmtime(p_file)
+    sources = (osp.join(GAMES_FOLDER, src) for src in (CORPUS_SOURCES if p_sources is None else p_sources))
+    return any(osp.isfile(src) and osp.getmtime(src) > corpus_time for src in sources)
+
+
+# the tagged corpus and its views, mapped once in each process
+_tagged_corpus = None
+_views = {}
+
+def load_tagged_corpus() -> WordCorpus:
+    """Map the tagged corpus, (re)building it first if missing or older than any of the source word lists."""
+    global _tagged_corpus
+    if _tagged_corpus is None:
+        if is_stale():
+            build_tagged_corpus()
+        _tagged_corpus = WordCorpus(TAGGED_CORPUS_FILE)
+    return _tagged_corpus
+
+def load_game_words(p_tags:WordTag) -> CorpusView:
+    """The sorted words of the tagged corpus that have all of p_tags, with their shared index cache."""
+    if p_tags not in _views:
+        tagged_corpus = load_tagged_corpus()
+        _views[p_tags] = CorpusView(tagged_corpus, p_tags, get_index_cache(tagged_corpus, p_tags))
+    return _views[p_tags]
+
+
+if __name__ == "__main__":
+    if len(argv) > 1:
+        print(f"Usage: python3 {osp.basename(argv[0])}\nBuild '{TAGGED_CORPUS_FILE}' from all the word lists"
+              f" and report any malformed entries.")
+        exit(0)
+    content_hash, errors = build_tagged_corpus()
+    for err in errors:
+        print(err)
+    tagged_corpus = WordCorpus(TAGGED_CORPUS_FILE)
+    print(f"{TAGGED_CORPUS_FILE}: {len(tagged_corpus):,} words; hash = {content_hash}; {len(errors)} problems")
+    for tag in WordTag:
+        print(f"\t{tag.name}: {len(CorpusView(tagged_corpus, tag)):,} words")
+    exit(0)
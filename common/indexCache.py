@@ -0,0 +1,147 @@
+##############################################################################################################################
+# coding=utf-8
+#
+# indexCache.py
+#   -- memory-mapped cache file of the derived indexes of a tagged corpus view: word positions, a hash table for
+#      membership, length buckets and letter-mask groups, shared read-only by every game process
+#
+# Copyright (c) 2026 Mark Sattolo <epistemik@gmail.com>
+
+__author_name__    = "Mark Sattolo"
+__author_email__   = "epistemik@gmail.com"
+__python_version__ = "3.10+"
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+import mmap
+import os
+import os.path as osp
+import struct
+from array import array
+from bisect import bisect_left
+from zlib import crc32
+from letterMasks import letter_mask
+from wordCorpus import WORD_ENCODING, WordCorpus, WordTag, get_array_view, get_content_hash, get_tmp_file, get_view_file, write_array
+
+CACHE_SUFFIX = ".wdx"
+CACHE_MAGIC = b"WDIX"
+CACHE_VERSION = 1
+# magic, version, view tags, number of words, hash table size, maximum word length, number of mask groups,
+# sha256 of the tagged corpus, sha256 of the view words
+HEADER_FORMAT = "<4sHHIIII32s32s"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+EMPTY_SLOT = -1
+
+def get_cache_file(p_corpus:WordCorpus, p_tags:WordTag) -> str:
+    return osp.splitext(get_view_file(p_corpus, p_tags))[0] + CACHE_SUFFIX
+
+def build_index_cache(p_corpus:WordCorpus, p_tags:WordTag, p_outfile:str):
+    """Compute every index of the view in one pass over its words and save them as little-endian arrays:
+         positions[N]: corpus position of each view word
+         slots[S]: open-addressing (linear probe) hash table of view indices keyed by crc32 of the word, S >= 2N
+         bucket_order[N] + bucket_starts[L+2]: view indices ordered by word length, then by index
+         masks[N]: letter mask of each view word
+         group_masks[G] + group_starts[G+1] + group_members[N]: view indices grouped by letter mask, masks ascending"""
+    positions = [pos for pos, tag in enumerate(p_corpus.tags) if tag & p_tags == p_tags]
+    keys = [p_corpus.get_bytes(pos) for pos in positions]
+    count = len(keys)
+    digest = get_content_hash([key.decode(WORD_ENCODING) for key in keys])
+
+    table_size = 1 << max(4, (2 * count - 1).bit_length())
+    slots = array('i', [EMPTY_SLOT]) * table_size
+    for idx, key in enumerate(keys):
+        slot = crc32(key) & (table_size - 1)
+        while slots[slot] != EMPTY_SLOT:
+            slot = (slot + 1) & (table_size - 1)
+        slots[slot] = idx
+
+    max_length = max((len(key) for key in keys), default=0)
+    bucket_order = sorted(range(count), key=lambda i: (len(keys[i]), i))
+    bucket_lengths = [len(keys[i]) for i in bucket_order]
+    bucket_starts = [bisect_left(bucket_lengths, wlen) for wlen in range(max_length + 2)]
+
+    masks = [letter_mask(key.decode(WORD_ENCODING)) for key in keys]
+    group_members = sorted(range(count), key=lambda i: (masks[i], i))
+    member_masks = [masks[i] for i in group_members]
+    group_masks = sorted(set(masks))
+    group_starts = [bisect_left(member_masks, mask) for mask in group_masks] + [count]
+
+    tmp_file = get_tmp_file(p_outfile)
+    with open(tmp_file, "wb") as outf:
+        outf.write(struct.pack(HEADER_FORMAT, CACHE_MAGIC, CACHE_VERSION, p_tags, count, table_size, max_length,
+                               len(group_masks), bytes.fromhex(p_corpus.digest), digest))
+        write_array(outf, 'I', positions)
+        write_array(outf, 'i', slots)
+        write_array(outf, 'I', bucket_order)
+        write_array(outf, 'I', bucket_starts)
+        write_array(outf, 'I', masks)
+        write_array(outf, 'I', group_masks)
+        write_array(outf, 'I', group_starts)
+        write_array(outf, 'I', group_members)
+    os.replace(tmp_file, p_outfile)
+
+
+class IndexCache:
+    """Read-only view of an index cache file; all the arrays are zero-copy views of the shared mapping."""
+    def __init__(self, p_file:str):
+        self.file = p_file
+        with open(p_file, "rb") as xfile:
+            self._map = mmap.mmap(xfile.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.tags, count, table_size, self.max_length, num_groups, corpus_digest, digest = \
+            struct.unpack_from(HEADER_FORMAT, self._map)
+        if magic != CACHE_MAGIC or version != CACHE_VERSION:
+            self._map.close()
+            raise ValueError(f"'{p_file}' is NOT a version {CACHE_VERSION} index cache file!")
+        self.corpus_digest = corpus_digest.hex()
+        self.digest = digest.hex()
+        self._table_mask = table_size - 1
+        self.positions, pos = get_array_view(self._map, HEADER_SIZE, 'I', count)
+        self.slots, pos = get_array_view(self._map, pos, 'i', table_size)
+        self.bucket_order, pos = get_array_view(self._map, pos, 'I', count)
+        self.bucket_starts, pos = get_array_view(self._map, pos, 'I', self.max_length + 2)
+        self.masks, pos = get_array_view(self._map, pos, 'I', count)
+        self.group_masks, pos = get_array_view(self._map, pos, 'I', num_groups)
+        self.group_starts, pos = get_array_view(self._map, pos, 'I', num_groups + 1)
+        self.group_members, pos = get_array_view(self._map, pos, 'I', count)
+
+    def find(self, p_word:str, p_words) -> int:
+        """Index of p_word in p_words (the view this cache was built from) >> -1 if NOT there."""
+        try:
+            key = p_word.encode(WORD_ENCODING)
+        except (UnicodeEncodeError, AttributeError):
+            return -1
+        slot = crc32(key) & self._table_mask
+        while (idx := self.slots[slot]) != EMPTY_SLOT:
+            if p_words.get_bytes(idx) == key:
+                return idx
+            slot = (slot + 1) & self._table_mask
+        return -1
+
+    def get_bucket(self, p_len:int):
+        """View indices, ascending, of all the words with length p_len."""
+        if not 0 <= p_len <= self.max_length:
+            return self.bucket_order[0:0]
+        return self.bucket_order[self.bucket_starts[p_len]:self.bucket_starts[p_len+1]]
+
+    def get_group(self, p_mask:int):
+        """View indices, ascending, of all the words using exactly the letters in p_mask."""
+        grp = bisect_left(self.group_masks, p_mask)
+        if grp == len(self.group_masks) or self.group_masks[grp] != p_mask:
+            return self.group_members[0:0]
+        return self.group_members[self.group_starts[grp]:self.group_starts[grp+1]]
+# END class IndexCache
+
+
+def get_index_cache(p_corpus:WordCorpus, p_tags:WordTag) -> IndexCache:
+    """Map the index cache of a tagged corpus view: the first process to need it builds and publishes the file,
+       every later process just maps it. Rebuilt if made from a different corpus."""
+    xfile = get_cache_file(p_corpus, p_tags)
+    if osp.exists(xfile):
+        try:
+            cache = IndexCache(xfile)
+            if cache.corpus_digest == p_corpus.digest and cache.tags == p_tags:
+                return cache
+        except (ValueError, struct.error):
+            pass
+    build_index_cache(p_corpus, p_tags, xfile)
+    return IndexCache(xfile)
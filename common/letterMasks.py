@@ -0,0 +1,96 @@
+##############################################################################################################################
+# coding=utf-8
+#
+# letterMasks.py
+#   -- 26-bit letter-set masks for every corpus word, for instant SpellingBee answer lookup
+#
+# Copyright (c) 2026 Mark Sattolo <epistemik@gmail.com>
+
+__author_name__    = "Mark Sattolo"
+__author_email__   = "epistemik@gmail.com"
+__python_version__ = "3.10+"
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+from array import array
+from collections.abc import Sequence
+from wordCorpus import WordSubset
+
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+LETTER_BITS = {lett: 1 << i for i, lett in enumerate(LETTERS)}
+# set for any character that is NOT A-Z so that such words never fit a puzzle
+OTHER_BIT = 1 << len(LETTERS)
+
+def letter_mask(p_word:str) -> int:
+    """The set of letters used in p_word as a bit mask: bit 0 = 'A' ... bit 25 = 'Z'."""
+    mask = 0
+    for lett in p_word:
+        mask |= LETTER_BITS.get(lett, OTHER_BIT)
+    return mask
+
+def mask_letters(p_mask:int) -> str:
+    return "".join(lett for lett in LETTERS if p_mask & LETTER_BITS[lett])
+
+def submasks(p_mask:int):
+    """Every non-empty subset of the bits in p_mask."""
+    sub = p_mask
+    while sub:
+        yield sub
+        sub = (sub - 1) & p_mask
+
+
+class LetterMaskIndex:
+    """Letter-set mask of every corpus word in a compact uint32 array, plus the corpus positions grouped by mask.
+       The answers for a puzzle are the groups of every subset of the puzzle letters that contains the required letter,
+       i.e. 2^(n-1) dictionary lookups instead of a scan of the whole corpus.
+       A corpus view with an index cache supplies the masks and groups from the shared cache file instead."""
+    def __init__(self, p_corpus:Sequence):
+        self.corpus = p_corpus
+        self.digest = getattr(p_corpus, "digest", "")
+        self._cache = getattr(p_corpus, "cache", None)
+        if self._cache:
+            self.masks = self._cache.masks
+            self.group_masks = self._cache.group_masks
+            self._groups = None
+            return
+        self.masks = array('I', (letter_mask(wd) for wd in p_corpus))
+        self._groups = {}
+        for idx, mask in enumerate(self.masks):
+            self._groups.setdefault(mask, []).append(idx)
+        # every distinct mask, ascending
+        self.group_masks = sorted(self._groups)
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+    def get_group(self, p_mask:int) -> list:
+        """Corpus positions of the words using exactly the letters in p_mask."""
+        if self._cache:
+            return self._cache.get_group(p_mask)
+        return self._groups.get(p_mask, [])
+
+    def find_answers(self, p_required:str, p_outers) -> list:
+        """Corpus positions, in corpus order, of all words that use the required letter and only the puzzle letters."""
+        required_bit = letter_mask(p_required)
+        puzzle_mask = required_bit | letter_mask("".join(p_outers))
+        results = []
+        for sub in submasks(puzzle_mask):
+            if sub & required_bit:
+                results.extend(self.get_group(sub))
+        results.sort()
+        return results
+
+    def get_answers(self, p_required:str, p_outers) -> WordSubset:
+        return WordSubset(self.corpus, array('I', self.find_answers(p_required, p_outers)))
+# END class LetterMaskIndex
+
+
+# one index per corpus in each process
+_mask_indexes = {}
+
+def get_mask_index(p_corpus:Sequence) -> LetterMaskIndex:
+    """Build the mask index for a corpus the first time it is requested, then share it."""
+    key = getattr(p_corpus, "digest", None) or id(p_corpus)
+    if key not in _mask_indexes:
+        _mask_indexes[key] = LetterMaskIndex(p_corpus)
+    return _mask_indexes[key]
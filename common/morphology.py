@@ -0,0 +1,150 @@
+##############################################################################################################################
+# coding=utf-8
+#
+# morphology.py
+#   -- base form and inflection class (plural S/ES, ING, ED) of every corpus word, cached on disk
+#
+# Copyright (c) 2026 Mark Sattolo <epistemik@gmail.com>
+
+__author_name__    = "Mark Sattolo"
+__author_email__   = "epistemik@gmail.com"
+__python_version__ = "3.10+"
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+import mmap
+import os
+import os.path as osp
+import struct
+from enum import IntEnum
+from wordCorpus import get_array_view, get_tmp_file, write_array
+from wordIndex import WordIndex
+
+MORPHOLOGY_SUFFIX = ".wdm"
+MORPHOLOGY_MAGIC = b"WDMO"
+MORPHOLOGY_VERSION = 1
+# magic, version, flags, number of words, sha256 of the corpus
+HEADER_FORMAT = "<4sHHI32s"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+class Inflection(IntEnum):
+    NONE      = 0
+    PLURAL_S  = 1
+    PLURAL_ES = 2
+    ING       = 3
+    ED        = 4
+
+
+PLURALS = (Inflection.PLURAL_S, Inflection.PLURAL_ES)
+
+def find_inflection(p_word:str, p_words) -> tuple:
+    """Find the base form of p_word in p_words, if p_word is a simple plural, ING or ED form of it.
+       >> return the base form and the inflection class, or "" and NONE"""
+    if len(p_word) > 2 and p_word[-1] == 'S':
+        if p_word[-2] != 'S' and p_word[:-1] in p_words:
+            return p_word[:-1], Inflection.PLURAL_S
+        if p_word[-2:] == "ES" and p_word[:-2] in p_words:
+            return p_word[:-2], Inflection.PLURAL_ES
+        if p_word[-3:] == "IES" and p_word[:-3] + 'Y' in p_words:
+            return p_word[:-3] + 'Y', Inflection.PLURAL_ES
+    if len(p_word) > 4 and p_word[-3:] == "ING":
+        stem = p_word[:-3]
+        # JUMPING, BAKING, RUNNING
+        for base in (stem, stem + 'E', stem[:-1] if stem[-1] == stem[-2] else ""):
+            if base in p_words:
+                return base, Inflection.ING
+    if len(p_word) > 3 and p_word[-2:] == "ED":
+        stem = p_word[:-2]
+        # JUMPED, CARRIED, BAKED, STOPPED
+        for base in (stem, stem[:-1] + 'Y' if stem[-1] == 'I' else "", p_word[:-1],
+                     stem[:-1] if stem[-1] == stem[-2] else ""):
+            if base in p_words:
+                return base, Inflection.ED
+    return "", Inflection.NONE
+
+
+class MorphologyTable:
+    """Base form (as a corpus position, -1 = none) and inflection class of each corpus word.
+       Corpus words are answered from the table; any other word is checked against the corpus by the same rules."""
+    def __init__(self, p_index:WordIndex, p_bases, p_classes, p_map=None):
+        self.index = p_index
+        self.digest = p_index.digest
+        self.bases = p_bases
+        self.classes = p_classes
+        self._map = p_map
+
+    @classmethod
+    def build(cls, p_index:WordIndex):
+        corpus = p_index.corpus
+        bases, classes = [], []
+        for wd in corpus:
+            base, inflection = find_inflection(wd, p_index)
+            bases.append(p_index.position(base) if base else -1)
+            classes.append(inflection)
+        return cls(p_index, bases, classes)
+
+    @classmethod
+    def load(cls, p_file:str, p_index:WordIndex):
+        with open(p_file, "rb") as mfile:
+            mmap_file = mmap.mmap(mfile.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, count, digest = struct.unpack_from(HEADER_FORMAT, mmap_file)
+        if magic != MORPHOLOGY_MAGIC or version != MORPHOLOGY_VERSION:
+            mmap_file.close()
+            raise ValueError(f"'{p_file}' is NOT a version {MORPHOLOGY_VERSION} morphology file!")
+        if digest.hex() != p_index.digest or count != len(p_index.corpus):
+            mmap_file.close()
+            raise ValueError(f"'{p_file}' was made from a different corpus!")
+        bases, pos = get_array_view(mmap_file, HEADER_SIZE, 'i', count)
+        classes, pos = get_array_view(mmap_file, pos, 'B', count)
+        return cls(p_index, bases, classes, mmap_file)
+
+    def save(self, p_file:str):
+        tmp_file = get_tmp_file(p_file)
+        with open(tmp_file, "wb") as outf:
+            outf.write(struct.pack(HEADER_FORMAT, MORPHOLOGY_MAGIC, MORPHOLOGY_VERSION, 0, len(self.bases),
+                                   bytes.fromhex(self.digest)))
+            write_array(outf, 'i', self.bases)
+            write_array(outf, 'B', self.classes)
+        os.replace(tmp_file, p_file)
+
+    def get_inflection(self, p_word:str) -> tuple:
+        """>> return the base form and inflection class of p_word, or "" and NONE"""
+        pos = self.index.position(p_word)
+        if pos < 0:
+            return find_inflection(p_word, self.index)
+        base = self.bases[pos]
+        return (self.index.corpus[base] if base >= 0 else ""), Inflection(self.classes[pos])
+
+    def get_class(self, p_word:str) -> Inflection:
+        pos = self.index.position(p_word)
+        return Inflection(self.classes[pos]) if pos >= 0 else find_inflection(p_word, self.index)[1]
+
+    def is_plural(self, p_word:str) -> bool:
+        return self.get_class(p_word) in PLURALS
+# END class MorphologyTable
+
+
+def get_morphology_file(p_index:WordIndex) -> str:
+    corpus_file = getattr(p_index.corpus, "file", "")
+    return osp.splitext(corpus_file)[0] + MORPHOLOGY_SUFFIX if corpus_file else ""
+
+# one table per corpus in each process
+_tables = {}
+
+def get_morphology(p_index:WordIndex) -> MorphologyTable:
+    """Map the cached morphology table for the corpus, or build it (and save it next to the corpus) if missing or stale."""
+    key = p_index.digest or id(p_index)
+    if key not in _tables:
+        table = None
+        mfile = get_morphology_file(p_index)
+        if mfile and osp.exists(mfile):
+            try:
+                table = MorphologyTable.load(mfile, p_index)
+            except (ValueError, struct.error):
+                table = None
+        if table is None:
+            table = MorphologyTable.build(p_index)
+            if mfile:
+                table.save(mfile)
+        _tables[key] = table
+    return _tables[key]
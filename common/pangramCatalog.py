@@ -0,0 +1,116 @@
+##############################################################################################################################
+# coding=utf-8
+#
+# pangramCatalog.py
+#   -- catalog of SpellingBee pangrams grouped by letter set, cached on disk next to the corpus
+#
+# Copyright (c) 2026 Mark Sattolo <epistemik@gmail.com>
+
+__author_name__    = "Mark Sattolo"
+__author_email__   = "epistemik@gmail.com"
+__python_version__ = "3.10+"
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+import json
+import os
+import os.path as osp
+from array import array
+from bisect import bisect_left
+from letterMasks import LetterMaskIndex, OTHER_BIT, letter_mask, mask_letters
+from wordCorpus import WordTable, get_tmp_file
+from morphology import Inflection, get_morphology
+from wordIndex import get_word_index
+
+DEFAULT_PANGRAM_LENGTH = 7
+# bump when the selection rules change so that existing catalog (and puzzle index) files are rebuilt
+CATALOG_VERSION = 2
+CATALOG_SUFFIX = ".pangrams.json"
+# don't use ING or ED forms
+EXCLUDED_INFLECTIONS = (Inflection.ING, Inflection.ED)
+
+
+class PangramCatalog:
+    """All the pangrams of a corpus, grouped by their set of letters: the letter-set masks in ascending order
+       and the words of every set, in order, in one compact WordTable."""
+    def __init__(self, p_digest:str, p_length:int, p_letter_sets:dict):
+        self.digest = p_digest
+        self.length = p_length
+        groups = sorted((letter_mask(letters), sorted(words)) for letters, words in p_letter_sets.items())
+        self.set_masks = array('I', (mask for mask, _ in groups))
+        self._set_starts = array('I', [0])
+        for _, words in groups:
+            self._set_starts.append(self._set_starts[-1] + len(words))
+        self.words = WordTable(wd for _, words in groups for wd in words)
+
+    def __len__(self) -> int:
+        return len(self.set_masks)
+
+    def get_pangrams(self, p_mask:int) -> list:
+        """The pangrams that use exactly the letters in p_mask >> an empty list if none."""
+        grp = bisect_left(self.set_masks, p_mask)
+        if grp == len(self.set_masks) or self.set_masks[grp] != p_mask:
+            return []
+        return self.words[self._set_starts[grp]:self._set_starts[grp+1]]
+
+    @classmethod
+    def build(cls, p_masks:LetterMaskIndex, p_length:int=DEFAULT_PANGRAM_LENGTH):
+        morphology = get_morphology(get_word_index(p_masks.corpus))
+        letter_sets = {}
+        for mask in p_masks.group_masks:
+            if mask.bit_count() != p_length or mask & OTHER_BIT:
+                continue
+            words = [p_masks.corpus[idx] for idx in p_masks.get_group(mask)
+                     if morphology.classes[idx] not in EXCLUDED_INFLECTIONS]
+            if words:
+                letter_sets[mask_letters(mask)] = words
+        return cls(p_masks.digest, p_length, letter_sets)
+
+    @classmethod
+    def read(cls, p_file:str):
+        with open(p_file, encoding="utf-8") as cfile:
+            data = json.load(cfile)
+        return data, cls(data["CORPUS HASH"], data["PANGRAM LENGTH"], data["LETTER SETS"])
+
+    def save(self, p_file:str):
+        letter_sets = {mask_letters(mask): self.get_pangrams(mask) for mask in self.set_masks}
+        data = {"VERSION":CATALOG_VERSION, "CORPUS HASH":self.digest, "PANGRAM LENGTH":self.length,
+                "LETTER SETS":letter_sets}
+        tmp_file = get_tmp_file(p_file)
+        with open(tmp_file, "w", encoding="utf-8") as cfile:
+            json.dump(data, cfile, indent=1)
+        os.replace(tmp_file, p_file)
+# END class PangramCatalog
+
+
+def get_catalog_file(p_masks:LetterMaskIndex, p_length:int=DEFAULT_PANGRAM_LENGTH) -> str:
+    """The catalog lives next to the corpus file, or nowhere if the corpus is not a file."""
+    corpus_file = getattr(p_masks.corpus, "file", "")
+    if not corpus_file:
+        return ""
+    suffix = CATALOG_SUFFIX if p_length == DEFAULT_PANGRAM_LENGTH else f".pangrams{p_length}.json"
+    return osp.splitext(corpus_file)[0] + suffix
+
+# one catalog per (corpus, pangram length) in each process
+_catalogs = {}
+
+def get_pangram_catalog(p_masks:LetterMaskIndex, p_length:int=DEFAULT_PANGRAM_LENGTH) -> PangramCatalog:
+    """Use the cached catalog if it was made from the same corpus content, otherwise rebuild and save it."""
+    key = (p_masks.digest or id(p_masks), p_length)
+    if key in _catalogs:
+        return _catalogs[key]
+    catalog = None
+    cfile = get_catalog_file(p_masks, p_length)
+    if cfile and osp.exists(cfile):
+        try:
+            data, catalog = PangramCatalog.read(cfile)
+            if data.get("VERSION") != CATALOG_VERSION or catalog.digest != p_masks.digest or catalog.length != p_length:
+                catalog = None
+        except (ValueError, KeyError, OSError):
+            catalog = None
+    if catalog is None:
+        catalog = PangramCatalog.build(p_masks, p_length)
+        if cfile:
+            catalog.save(cfile)
+    _catalogs[key] = catalog
+    return catalog
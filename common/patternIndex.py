@@ -0,0 +1,198 @@
+##############################################################################################################################
+# coding=utf-8
+#
+# patternIndex.py
+#   -- positional letter bitsets over the words of one length, for instant pattern queries,
+#      e.g. 5-letter words with A at position 2, containing E and R, without S, T or N
+#
+# Copyright (c) 2026 Mark Sattolo <epistemik@gmail.com>
+
+__author_name__    = "Mark Sattolo"
+__author_email__   = "epistemik@gmail.com"
+__python_version__ = "3.10+"
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+import os.path as osp
+from collections.abc import Sequence
+from sys import argv
+from wordCorpus import WordTag, get_word_blob
+from wordIndex import WordIndex, get_word_index
+from wordleScore import Mark
+
+WILDCARD = '.'
+
+class Pattern:
+    """Letter constraints on a word of a given length: exact letters by position, letters that are in the word
+       but NOT at a given position, and letters that must or must NOT be in the word."""
+    def __init__(self, p_length:int):
+        self.length = p_length
+        self.exact = [""] * p_length
+        self.misplaced = [set() for _ in range(p_length)]
+        self.required = set()
+        self.excluded = set()
+
+    @classmethod
+    def parse(cls, p_pattern:str, p_include:str="", p_exclude:str=""):
+        """'.' = any letter; an UPPER case letter is at that position;
+           a lower case letter is in the word but NOT at that position."""
+        pattern = cls(len(p_pattern))
+        for pos, lett in enumerate(p_pattern):
+            if lett == WILDCARD:
+                continue
+            if not lett.isalpha():
+                raise ValueError(f"Use letters or '{WILDCARD}' in a pattern, NOT '{lett}'!")
+            if lett.isupper():
+                pattern.exact[pos] = lett
+            else:
+                pattern.misplaced[pos].add(lett.upper())
+            pattern.required.add(lett.upper())
+        pattern.required.update(p_include.upper())
+        pattern.excluded.update(p_exclude.upper())
+        return pattern
+
+    def add_feedback(self, p_guess:str, p_marks:Sequence):
+        """Add what the marks for a guess tell about the target word.
+           A letter marked ABSENT that is also marked EXACT or PRESENT elsewhere in the guess is only NOT at that position."""
+        found = {lett for lett, mark in zip(p_guess, p_marks) if mark != Mark.ABSENT}
+        for pos, (lett, mark) in enumerate(zip(p_guess, p_marks)):
+            if mark == Mark.EXACT:
+                self.exact[pos] = lett
+            elif mark == Mark.PRESENT or lett in found:
+                self.misplaced[pos].add(lett)
+            else:
+                self.excluded.add(lett)
+        self.required.update(found)
+
+    def get_hard(self):
+        """Only the exact and required letters: what Wordle 'hard' mode makes every later guess use."""
+        hard = Pattern(self.length)
+        hard.exact = list(self.exact)
+        hard.required = set(self.required)
+        return hard
+
+    def check(self, p_word:str, p_hard:bool=False) -> str:
+        """See if p_word fits; with p_hard only check the exact and required letters (Wordle 'hard' mode).
+           >> return "" if it does, otherwise the reason it does NOT"""
+        for pos, lett in enumerate(self.exact):
+            if lett and p_word[pos] != lett:
+                return f"Missing green '{lett}' at position {pos+1}."
+        for lett in sorted(self.required):
+            if lett not in p_word:
+                return f"Missing yellow '{lett}'."
+        if p_hard:
+            return ""
+        for pos, letters in enumerate(self.misplaced):
+            if p_word[pos] in letters:
+                return f"'{p_word[pos]}' is NOT at position {pos+1}."
+        for lett in p_word:
+            if lett in self.excluded:
+                return f"'{lett}' is NOT in the word."
+        return ""
+# END class Pattern
+
+
+def get_bit_indexes(p_bits:int) -> list:
+    """Word indexes of the set bits of a bitset, in ascending order."""
+    digits = bin(p_bits)[:1:-1]
+    indexes = []
+    idx = digits.find('1')
+    while idx >= 0:
+        indexes.append(idx)
+        idx = digits.find('1', idx + 1)
+    return indexes
+
+def narrow_bits(p_bits:int, p_row, p_code:int) -> int:
+    """Keep only the words of a bitset whose entry in p_row (e.g. a row of score codes) is p_code;
+       only the words still in the bitset are looked at, so each narrowing is quicker than the one before."""
+    bits = 0
+    for idx in get_bit_indexes(p_bits):
+        if p_row[idx] == p_code:
+            bits |= 1 << idx
+    return bits
+
+def _bit_table(p_letter:str) -> bytes:
+    """Translation table that turns a column of letters into a string of binary digits: '1' where p_letter is."""
+    table = bytearray(b'0' * 256)
+    table[ord(p_letter)] = ord('1')
+    return bytes(table)
+
+_BIT_TABLES = {}
+
+class PatternIndex:
+    """For the words of one length: a bitset (a python int, bit i = word i) for every letter at every position,
+       and one for every letter anywhere in the word. A pattern query is then a few big-int ANDs, NOT a word scan."""
+    def __init__(self, p_words:Sequence, p_length:int):
+        self.words = p_words
+        self.length = p_length
+        count = len(p_words)
+        self.all_bits = (1 << count) - 1
+        blob = get_word_blob(p_words, p_length)
+        self.position_bits = []
+        self.letter_bits = {}
+        for pos in range(p_length):
+            column = blob[pos::p_length]
+            bits = {}
+            for code in set(column):
+                lett = chr(code)
+                if lett not in _BIT_TABLES:
+                    _BIT_TABLES[lett] = _bit_table(lett)
+                # reversed so that word 0 is the lowest bit
+                bits[lett] = int(column.translate(_BIT_TABLES[lett])[::-1], 2)
+                self.letter_bits[lett] = self.letter_bits.get(lett, 0) | bits[lett]
+            self.position_bits.append(bits)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def match(self, p_pattern:Pattern) -> int:
+        """>> return the bitset of the words that fit the pattern"""
+        bits = self.all_bits
+        for pos, lett in enumerate(p_pattern.exact):
+            if lett:
+                bits &= self.position_bits[pos].get(lett, 0)
+        for lett in p_pattern.required:
+            bits &= self.letter_bits.get(lett, 0)
+        for pos, letters in enumerate(p_pattern.misplaced):
+            for lett in letters:
+                bits &= ~self.position_bits[pos].get(lett, 0)
+        for lett in p_pattern.excluded:
+            bits &= ~self.letter_bits.get(lett, 0)
+        return bits
+
+    def count(self, p_pattern:Pattern) -> int:
+        return self.match(p_pattern).bit_count()
+
+    def get_words(self, p_bits:int) -> list:
+        return [self.words[idx] for idx in get_bit_indexes(p_bits)]
+
+    def find(self, p_pattern:Pattern) -> list:
+        return self.get_words(self.match(p_pattern))
+# END class PatternIndex
+
+
+# one index per (corpus, word length) in each process
+_pattern_indexes = {}
+
+def get_pattern_index(p_index:WordIndex, p_length:int) -> PatternIndex:
+    """Build the pattern index for the words of one length of a corpus the first time it is requested, then share it."""
+    key = (p_index.digest or id(p_index), p_length)
+    if key not in _pattern_indexes:
+        _pattern_indexes[key] = PatternIndex(p_index.length_bucket(p_length), p_length)
+    return _pattern_indexes[key]
+
+
+if __name__ == "__main__":
+    if len(argv) < 2 or len(argv) > 4:
+        print(f"Usage: python3 {osp.basename(argv[0])} <pattern> [$include_letters [$exclude_letters]]"
+              f"\nFind the words that fit a pattern, e.g. '.A.e.' = A in position 2 and E in the word but NOT in position 4."
+              f"\n  '{WILDCARD}' = any letter; UPPER case = letter at this position;"
+              f" lower case = letter in the word but NOT at this position.")
+        exit(0)
+    from corpusBuilder import load_game_words
+    query = Pattern.parse(*argv[1:])
+    finder = get_pattern_index(get_word_index(load_game_words(WordTag.WORDLE_ANSWER)), query.length)
+    results = finder.find(query)
+    print("\n".join(results))
+    print(f"{len(results):,} of {len(finder):,} {query.length}-letter words fit '{argv[1]}'.")
+    exit(0)
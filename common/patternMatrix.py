@@ -0,0 +1,156 @@
+##############################################################################################################################
+# coding=utf-8
+#
+# patternMatrix.py
+#   -- offline builder and memory-mapped reader of the Wordle guess x answer score matrix of each word length,
+#      so that every feedback pattern a solver, hint or rating needs is a table lookup
+#
+# Copyright (c) 2026 Mark Sattolo <epistemik@gmail.com>
+
+__author_name__    = "Mark Sattolo"
+__author_email__   = "epistemik@gmail.com"
+__python_version__ = "3.10+"
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+import ast
+import glob
+import hashlib
+import mmap
+import os
+import os.path as osp
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from sys import argv, byteorder
+from time import perf_counter
+from wordCorpus import GAMES_INPUT_FOLDER, WORD_ENCODING, WordTag, get_array_view, get_tmp_file, get_word_blob
+from wordIndex import WordIndex, get_word_index
+from wordleScore import get_score_typecode, score_batch
+
+MATRIX_PREFIX = "wordle_patterns"
+MATRIX_SUFFIX = ".npy"
+MATRIX_LENGTHS = range(4, 14)
+# built by default: the longer words get their rows on demand from a patternRowCache instead
+DENSE_LENGTHS = range(4, 8)
+# guesses scored by each task of the process pool
+ROWS_PER_TASK = 256
+
+# the files use the NumPy .npy format (version 1.0), so numpy.load(file, mmap_mode='r') can also read them
+NPY_MAGIC = b"\x93NUMPY\x01\x00"
+NPY_ALIGN = 64
+NPY_DESCR = {'B':"|u1", 'H':"<u2", 'I':"<u4"}
+
+def get_matrix_key(p_guesses:WordIndex, p_answers:WordIndex, p_length:int) -> str:
+    """Short hash of the guess and answer word lists a matrix is made from."""
+    return hashlib.sha256(f"{p_guesses.digest}:{p_answers.digest}:{p_length}".encode()).hexdigest()[:16]
+
+def get_matrix_file(p_key:str, p_length:int) -> str:
+    return osp.join(GAMES_INPUT_FOLDER, f"{MATRIX_PREFIX}.{p_length}.{p_key}{MATRIX_SUFFIX}")
+
+def get_npy_header(p_typecode:str, p_rows:int, p_cols:int) -> bytes:
+    header = f"{{'descr': '{NPY_DESCR[p_typecode]}', 'fortran_order': False, 'shape': ({p_rows}, {p_cols}), }}"
+    # magic + header size + header + padding + newline, so the data starts on an aligned offset
+    padding = -(len(NPY_MAGIC) + 2 + len(header) + 1) % NPY_ALIGN
+    header = (header + ' ' * padding + '\n').encode("latin1")
+    return NPY_MAGIC + len(header).to_bytes(2, "little") + header
+
+def read_npy_header(p_buffer) -> tuple:
+    """>> return the typecode, the shape and the offset of the data of a version 1.0 .npy file"""
+    if bytes(p_buffer[:len(NPY_MAGIC)]) != NPY_MAGIC:
+        raise ValueError("NOT a version 1.0 .npy file!")
+    start = len(NPY_MAGIC) + 2
+    end = start + int.from_bytes(p_buffer[len(NPY_MAGIC):start], "little")
+    header = ast.literal_eval(bytes(p_buffer[start:end]).decode("latin1"))
+    typecodes = {descr: code for code, descr in NPY_DESCR.items()}
+    if header["fortran_order"] or header["descr"] not in typecodes or len(header["shape"]) != 2:
+        raise ValueError(f"Unexpected .npy header: {header}")
+    return typecodes[header["descr"]], header["shape"], end
+
+def _score_rows(p_guesses:bytes, p_answers:bytes, p_length:int) -> bytes:
+    """Process pool task: the little-endian score rows of the packed guesses against all the packed answers."""
+    rows = array(get_score_typecode(p_length))
+    for start in range(0, len(p_guesses), p_length):
+        rows.extend(score_batch(p_guesses[start:start+p_length].decode(WORD_ENCODING), None, p_answers))
+    if byteorder != "little":
+        rows.byteswap()
+    return rows.tobytes()
+
+def build_pattern_matrix(p_guesses, p_answers, p_length:int, p_outfile:str, p_workers:int=None):
+    """Score every guess against every answer, ROWS_PER_TASK guesses per task over a pool of processes,
+       and write the rows in guess order as a (guesses x answers) .npy matrix."""
+    guess_blob = get_word_blob(p_guesses, p_length)
+    answer_blob = get_word_blob(p_answers, p_length)
+    chunk = ROWS_PER_TASK * p_length
+    tasks = [guess_blob[start:start+chunk] for start in range(0, len(guess_blob), chunk)]
+    tmp_file = get_tmp_file(p_outfile)
+    with open(tmp_file, "wb") as outf, ProcessPoolExecutor(p_workers) as pool:
+        outf.write(get_npy_header(get_score_typecode(p_length), len(p_guesses), len(p_answers)))
+        for rows in pool.map(_score_rows, tasks, repeat(answer_blob), repeat(p_length)):
+            outf.write(rows)
+    os.replace(tmp_file, p_outfile)
+
+
+class PatternMatrix:
+    """Read-only, memory-mapped score matrix of one word length: row = allowed guess, column = answer,
+       in the (sorted) order of the length buckets it was built from."""
+    def __init__(self, p_file:str, p_guesses, p_answers):
+        self.file = p_file
+        self.guesses = p_guesses
+        self.answers = p_answers
+        with open(p_file, "rb") as mfile:
+            self._map = mmap.mmap(mfile.fileno(), 0, access=mmap.ACCESS_READ)
+        typecode, (rows, self._cols), start = read_npy_header(self._map)
+        if rows != len(p_guesses) or self._cols != len(p_answers):
+            self._map.close()
+            raise ValueError(f"'{p_file}' does NOT match its word lists!")
+        self.scores, _ = get_array_view(self._map, start, typecode, rows * self._cols)
+
+    def get_row(self, p_guess:str):
+        """Score codes of p_guess against every answer >> None if p_guess is NOT an allowed guess."""
+        row = self.guesses.find(p_guess)
+        return self.get_row_at(row) if row >= 0 else None
+
+    def get_row_at(self, p_row:int):
+        """Score codes of the guess in row p_row against every answer."""
+        return self.scores[p_row * self._cols:(p_row + 1) * self._cols]
+# END class PatternMatrix
+
+
+# the mapped matrices (or None if NOT built) in each process
+_matrices = {}
+
+def get_pattern_matrix(p_guesses:WordIndex, p_answers:WordIndex, p_length:int):
+    """Map the prebuilt matrix for this word length on first use >> None if it has NOT been built
+       for these word lists; run this module to build them."""
+    key = get_matrix_key(p_guesses, p_answers, p_length)
+    if key not in _matrices:
+        mfile = get_matrix_file(key, p_length)
+        _matrices[key] = PatternMatrix(mfile, p_guesses.length_bucket(p_length), p_answers.length_bucket(p_length)) \
+                         if osp.exists(mfile) else None
+    return _matrices[key]
+
+def build_pattern_matrices(p_lengths=DENSE_LENGTHS, p_workers:int=None):
+    """Build the matrix of each word length for the current Wordle word lists, replacing any older ones."""
+    from corpusBuilder import load_game_words
+    guesses = get_word_index(load_game_words(WordTag.WORDLE_ALLOWED))
+    answers = get_word_index(load_game_words(WordTag.WORDLE_ANSWER))
+    for length in p_lengths:
+        mfile = get_matrix_file(get_matrix_key(guesses, answers, length), length)
+        start = perf_counter()
+        build_pattern_matrix(guesses.length_bucket(length), answers.length_bucket(length), length, mfile, p_workers)
+        for old_file in glob.glob(get_matrix_file('*', length)):
+            if old_file != mfile:
+                os.remove(old_file)
+        print(f"{osp.basename(mfile)}: {len(guesses.length_bucket(length)):,} x {len(answers.length_bucket(length)):,}"
+              f" = {osp.getsize(mfile) / 1e6:.1f} MB in {perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    if any(not arg.isdigit() or int(arg) not in MATRIX_LENGTHS for arg in argv[1:]):
+        print(f"Usage: python3 {osp.basename(argv[0])} [$word_length ...]\nBuild the Wordle pattern matrix of each word length"
+              f" ({MATRIX_LENGTHS.start}..{MATRIX_LENGTHS.stop - 1}, default = {DENSE_LENGTHS.start}..{DENSE_LENGTHS.stop - 1})"
+              f" using all the CPUs.")
+        exit(0)
+    build_pattern_matrices([int(arg) for arg in argv[1:]] or DENSE_LENGTHS)
+    exit(0)
@@ -0,0 +1,132 @@
+##############################################################################################################################
+# coding=utf-8
+#
+# patternRowCache.py
+#   -- Wordle score rows computed on demand for the word lengths with NO prebuilt pattern matrix:
+#      an LRU of rows in memory, within a byte budget, with the often used rows kept in a disk store
+#
+# Copyright (c) 2026 Mark Sattolo <epistemik@gmail.com>
+
+__author_name__    = "Mark Sattolo"
+__author_email__   = "epistemik@gmail.com"
+__python_version__ = "3.10+"
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+import atexit
+import dbm
+import os.path as osp
+from array import array
+from collections import OrderedDict
+from sys import byteorder
+from threading import Lock
+from wordCorpus import WORD_ENCODING, get_word_blob
+from wordIndex import WordIndex
+from wordleScore import get_score_typecode, score_batch
+from patternMatrix import get_matrix_file, get_matrix_key, get_pattern_matrix
+
+ROWS_SUFFIX = ".rows"
+# memory for the rows of each word length
+DEFAULT_BUDGET_BYTES = 16 * 1024 * 1024
+# an evicted row used at least this often is saved to the disk store
+SPILL_MIN_HITS = 2
+
+class PatternRowCache:
+    """The score row of a guess against every answer of one word length, computed the first time it is needed.
+       Rows use the narrowest typecode for the word length; the least recently used are dropped when the rows
+       exceed p_budget bytes, after saving the ones used SPILL_MIN_HITS times or more to the disk store,
+       from which they are read back, instead of scored again, by this and every later game."""
+    def __init__(self, p_answers, p_length:int, p_spill_file:str=None, p_budget:int=DEFAULT_BUDGET_BYTES):
+        self.answers = p_answers
+        self.length = p_length
+        self.spill_file = p_spill_file
+        self.budget = p_budget
+        self.typecode = get_score_typecode(p_length)
+        self.row_bytes = array(self.typecode).itemsize * len(p_answers)
+        self._blob = get_word_blob(p_answers, p_length)
+        self._rows = OrderedDict() # guess -> [row, hits]
+        self._store = None
+        self._lock = Lock()
+        self.num_bytes = 0
+        self.computed = 0
+        self.loaded = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _open_store(self):
+        if self._store is None and self.spill_file:
+            self._store = dbm.open(self.spill_file, 'c')
+            atexit.register(self.close)
+        return self._store
+
+    def _load_row(self, p_key:bytes):
+        store = self._open_store()
+        data = store.get(p_key) if store is not None else None
+        if data is None or len(data) != self.row_bytes:
+            return None
+        row = array(self.typecode, data)
+        if byteorder != "little":
+            row.byteswap()
+        self.loaded += 1
+        return row
+
+    def _spill(self, p_guess:str, p_row:array):
+        store = self._open_store()
+        if store is None:
+            return
+        key = p_guess.encode(WORD_ENCODING)
+        if key not in store:
+            data = array(self.typecode, p_row)
+            if byteorder != "little":
+                data.byteswap()
+            store[key] = data.tobytes()
+
+    def get_row(self, p_guess:str) -> array:
+        """Score codes of p_guess against every answer, in answer order."""
+        with self._lock:
+            entry = self._rows.get(p_guess)
+            if entry:
+                entry[1] += 1
+                self._rows.move_to_end(p_guess)
+                return entry[0]
+            row = self._load_row(p_guess.encode(WORD_ENCODING))
+            if row is None:
+                row = score_batch(p_guess, None, self._blob)
+                self.computed += 1
+            self._rows[p_guess] = [row, 1]
+            self.num_bytes += self.row_bytes
+            while self.num_bytes > self.budget and len(self._rows) > 1:
+                guess, (old_row, hits) = self._rows.popitem(last=False)
+                self.num_bytes -= self.row_bytes
+                if hits >= SPILL_MIN_HITS:
+                    self._spill(guess, old_row)
+            return row
+
+    def close(self):
+        """Save the often used rows still in memory and close the disk store."""
+        with self._lock:
+            for guess, (row, hits) in self._rows.items():
+                if hits >= SPILL_MIN_HITS:
+                    self._spill(guess, row)
+            if self._store is not None:
+                self._store.close()
+                self._store = None
+# END class PatternRowCache
+
+
+# one row source per (word lists, word length) in each process
+_row_sources = {}
+
+def get_pattern_rows(p_guesses:WordIndex, p_answers:WordIndex, p_length:int):
+    """Where to get the score rows of a word length: the prebuilt pattern matrix if there is one,
+       otherwise a row cache that fills as the guesses are made. Either has get_row(guess)."""
+    key = get_matrix_key(p_guesses, p_answers, p_length)
+    if key not in _row_sources:
+        matrix = get_pattern_matrix(p_guesses, p_answers, p_length)
+        if matrix:
+            _row_sources[key] = matrix
+        else:
+            spill_file = osp.splitext(get_matrix_file(key, p_length))[0] + ROWS_SUFFIX
+            _row_sources[key] = PatternRowCache(p_answers.length_bucket(p_length), p_length, spill_file)
+    return _row_sources[key]
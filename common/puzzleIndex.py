@@ -0,0 +1,187 @@
+##############################################################################################################################
+# coding=utf-8
+#
+# puzzleIndex.py
+#   -- precomputed index of every SpellingBee puzzle (pangram letter set x required letter) in a memory-mapped file
+#
+# Copyright (c) 2026 Mark Sattolo <epistemik@gmail.com>
+
+__author_name__    = "Mark Sattolo"
+__author_email__   = "epistemik@gmail.com"
+__python_version__ = "3.10+"
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+import mmap
+import os
+import os.path as osp
+import random
+import struct
+from bisect import bisect_left, bisect_right
+from sys import argv
+from letterMasks import LetterMaskIndex, get_mask_index, letter_mask, mask_letters, submasks
+from pangramCatalog import CATALOG_VERSION, DEFAULT_PANGRAM_LENGTH, get_pangram_catalog
+from wordCorpus import WordSubset, WordTag, get_array_view, get_tmp_file, write_array
+from corpusBuilder import load_game_words
+
+MIN_WORD_LENGTH = 4
+PUZZLE_SUFFIX = ".wdp"
+PUZZLE_MAGIC = b"WDPZ"
+PUZZLE_VERSION = 4
+# magic, version, pangram length, pangram catalog version, (reserved),
+# number of puzzles, total number of answer offsets, sha256 of the corpus
+HEADER_FORMAT = "<4sHHHHII32s"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+def get_word_points(p_word:str, p_pangram:bool) -> int:
+    """1 point for a minimum length word, otherwise 1 point per letter, plus the PANGRAM BONUS."""
+    points = 1 if len(p_word) == MIN_WORD_LENGTH else len(p_word)
+    return points + len(p_word) if p_pangram else points
+
+def get_puzzle_file(p_masks:LetterMaskIndex, p_length:int=DEFAULT_PANGRAM_LENGTH) -> str:
+    return osp.splitext(p_masks.corpus.file)[0] + f".puzzles{p_length}{PUZZLE_SUFFIX}"
+
+def build_puzzle_index(p_masks:LetterMaskIndex, p_outfile:str, p_length:int=DEFAULT_PANGRAM_LENGTH) -> int:
+    """Enumerate every pangram letter set x each of its letters as the required letter and save
+       the answers (as corpus positions), answer count, maximum points and pangram count of each puzzle.
+       Puzzles are stored in order of their number of answers so that selection by answer count is a bisect.
+       >> return the number of puzzles"""
+    catalog = get_pangram_catalog(p_masks, p_length)
+    corpus = p_masks.corpus
+    puzzles = []
+    for set_mask in catalog.set_masks:
+        letters = mask_letters(set_mask)
+        # every word made only from these letters
+        set_answers = sorted(idx for sub in submasks(set_mask) for idx in p_masks.get_group(sub))
+        for lett_num, lett in enumerate(letters):
+            required_bit = letter_mask(lett)
+            puzzle_answers = [idx for idx in set_answers if p_masks.masks[idx] & required_bit]
+            pangrams = sum(1 for idx in puzzle_answers if p_masks.masks[idx] == set_mask)
+            points = sum(get_word_points(corpus[idx], p_masks.masks[idx] == set_mask) for idx in puzzle_answers)
+            puzzles.append((len(puzzle_answers), set_mask, lett_num, points, pangrams, puzzle_answers))
+    puzzles.sort(key=lambda pz: pz[0])
+    answer_starts, answers = [0], []
+    for pz in puzzles:
+        answers.extend(pz[5])
+        answer_starts.append(len(answers))
+    puzzle_masks = [pz[1] for pz in puzzles]
+    required = [pz[2] for pz in puzzles]
+    max_points = [pz[3] for pz in puzzles]
+    num_pangrams = [pz[4] for pz in puzzles]
+    tmp_file = get_tmp_file(p_outfile)
+    with open(tmp_file, "wb") as outf:
+        outf.write(struct.pack(HEADER_FORMAT, PUZZLE_MAGIC, PUZZLE_VERSION, p_length, CATALOG_VERSION, 0,
+                               len(puzzle_masks), len(answers), bytes.fromhex(p_masks.digest)))
+        # 4-byte arrays first, then 2-byte, then 1-byte, to keep every array aligned
+        write_array(outf, 'I', puzzle_masks)
+        write_array(outf, 'I', answer_starts)
+        write_array(outf, 'I', answers)
+        write_array(outf, 'I', max_points)
+        write_array(outf, 'H', num_pangrams)
+        write_array(outf, 'B', required)
+    os.replace(tmp_file, p_outfile)
+    return len(puzzle_masks)
+
+
+class PuzzleIndex:
+    """Read-only view of a puzzle index file: puzzle N is letter set puzzle_masks[N] with the required_letters[N]-th
+       letter of that set required, and has maximum points puzzle_points[N] and puzzle_pangrams[N] pangrams."""
+    def __init__(self, p_file:str, p_corpus=None):
+        self.file = p_file
+        self.corpus = p_corpus
+        with open(p_file, "rb") as pfile:
+            self._map = mmap.mmap(pfile.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.length, self.catalog_version, _, count, num_answers, digest = \
+            struct.unpack_from(HEADER_FORMAT, self._map)
+        if magic != PUZZLE_MAGIC or version != PUZZLE_VERSION:
+            self._map.close()
+            raise ValueError(f"'{p_file}' is NOT a version {PUZZLE_VERSION} puzzle index file!")
+        self.digest = digest.hex()
+        self._count = count
+        self.puzzle_masks, pos = get_array_view(self._map, HEADER_SIZE, 'I', count)
+        self._answer_starts, pos = get_array_view(self._map, pos, 'I', count + 1)
+        self._answers, pos = get_array_view(self._map, pos, 'I', num_answers)
+        self.puzzle_points, pos = get_array_view(self._map, pos, 'I', count)
+        self.puzzle_pangrams, pos = get_array_view(self._map, pos, 'H', count)
+        self.required_letters, pos = get_array_view(self._map, pos, 'B', count)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def get_letters(self, p_id:int) -> tuple:
+        """>> return the required letter and the list of outer letters of a puzzle"""
+        letters = mask_letters(self.puzzle_masks[p_id])
+        required = letters[self.required_letters[p_id]]
+        return required, [lett for lett in letters if lett != required]
+
+    def num_answers(self, p_id:int) -> int:
+        return self._answer_starts[p_id+1] - self._answer_starts[p_id]
+
+    def get_answer_positions(self, p_id:int):
+        return self._answers[self._answer_starts[p_id]:self._answer_starts[p_id+1]]
+
+    def get_answers(self, p_id:int) -> WordSubset:
+        return WordSubset(self.corpus, self.get_answer_positions(p_id))
+
+    def find(self, min_answers:int=0, max_answers:int=0, min_points:int=0, max_points:int=0,
+             num_pangrams:int=0, excluded:str="") -> list:
+        """All the puzzles that meet the given constraints; a zero value or empty string means 'any'.
+           The answer count range is found by bisection, the other constraints only filter that range."""
+        ids = range(self._count)
+        start = bisect_left(ids, min_answers, key=self.num_answers) if min_answers else 0
+        stop = bisect_right(ids, max_answers, key=self.num_answers) if max_answers else self._count
+        excluded_mask = letter_mask(excluded.upper())
+        results = []
+        for pid in range(start, stop):
+            if min_points and self.puzzle_points[pid] < min_points:
+                continue
+            if max_points and self.puzzle_points[pid] > max_points:
+                continue
+            if num_pangrams and self.puzzle_pangrams[pid] != num_pangrams:
+                continue
+            if excluded_mask and self.puzzle_masks[pid] & excluded_mask:
+                continue
+            results.append(pid)
+        return results
+
+    def select(self, **p_constraints) -> int:
+        """A random puzzle that meets the constraints (see find()) >> return -1 if there is none."""
+        if not p_constraints:
+            return random.randrange(0, self._count)
+        matches = self.find(**p_constraints)
+        return random.choice(matches) if matches else -1
+# END class PuzzleIndex
+
+
+# one index per (corpus, pangram length) in each process
+_puzzle_indexes = {}
+
+def get_puzzle_index(p_masks:LetterMaskIndex, p_length:int=DEFAULT_PANGRAM_LENGTH) -> PuzzleIndex:
+    """Map the puzzle index built from this corpus, building it first if missing or made from a different corpus."""
+    key = (p_masks.digest, p_length)
+    if key not in _puzzle_indexes:
+        pfile = get_puzzle_file(p_masks, p_length)
+        index = None
+        if osp.exists(pfile):
+            try:
+                index = PuzzleIndex(pfile, p_masks.corpus)
+                if index.digest != p_masks.digest or index.length != p_length or index.catalog_version != CATALOG_VERSION:
+                    index = None
+            except (ValueError, struct.error):
+                index = None
+        if index is None:
+            build_puzzle_index(p_masks, pfile, p_length)
+            index = PuzzleIndex(pfile, p_masks.corpus)
+        _puzzle_indexes[key] = index
+    return _puzzle_indexes[key]
+
+
+if __name__ == "__main__":
+    if len(argv) > 1 and not argv[1].isdigit():
+        print(f"Usage: python3 {osp.basename(argv[0])} [$pangram_length ...]\nBuild the SpellingBee puzzle index files.")
+        exit(0)
+    mask_index = get_mask_index(load_game_words(WordTag.SB_ALLOWED))
+    for plen in ([int(arg) for arg in argv[1:]] or [DEFAULT_PANGRAM_LENGTH]):
+        puzzle_file = get_puzzle_file(mask_index, plen)
+        print(f"{puzzle_file}: {build_puzzle_index(mask_index, puzzle_file, plen):,} puzzles")
+    exit(0)
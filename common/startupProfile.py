@@ -0,0 +1,97 @@
+##############################################################################################################################
+# coding=utf-8
+#
+# startupProfile.py
+#   -- '--profile-startup' option for the game launchers: time each import and start-up phase up to first paint
+#
+# Copyright (c) 2026 Mark Sattolo <epistemik@gmail.com>
+
+__author_name__    = "Mark Sattolo"
+__author_email__   = "epistemik@gmail.com"
+__python_version__ = "3.10+"
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+import atexit
+import builtins
+import sys
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+
+PROFILE_OPTION = "--profile-startup"
+# only show imports nested this deep (0 = imported directly by the launcher) and at least this slow
+REPORT_IMPORT_DEPTH = 1
+REPORT_MIN_MSEC = 1.0
+
+profiling = PROFILE_OPTION in sys.argv
+if profiling:
+    # the launchers parse their own arguments without it
+    sys.argv.remove(PROFILE_OPTION)
+
+_start_time = perf_counter()
+# (msec since start, msec elapsed, name) of each phase and mark
+_phases = []
+# (depth, msec elapsed, module name) of each first import
+_imports = []
+_import_depth = 0
+_real_import = builtins.__import__
+
+def get_msec() -> float:
+    """Milliseconds since this module was imported, i.e. since the launcher started."""
+    return (perf_counter() - _start_time) * 1000.0
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    global _import_depth
+    if level or name in sys.modules or threading.current_thread() is not threading.main_thread():
+        return _real_import(name, globals, locals, fromlist, level)
+    depth = _import_depth
+    _import_depth += 1
+    start = perf_counter()
+    try:
+        return _real_import(name, globals, locals, fromlist, level)
+    finally:
+        _import_depth = depth
+        _imports.append((depth, (perf_counter() - start) * 1000.0, name))
+
+def profile_imports():
+    """Time every module imported from now on, if profiling."""
+    if profiling and builtins.__import__ is not _timed_import:
+        builtins.__import__ = _timed_import
+        atexit.register(report)
+
+@contextmanager
+def phase(p_name:str):
+    """Time a start-up phase, if profiling."""
+    if not profiling:
+        yield
+        return
+    start = get_msec()
+    try:
+        yield
+    finally:
+        end = get_msec()
+        _phases.append((end, end - start, p_name))
+        print(f"[startup] {end:9.1f} ms: {p_name} took {end - start:.1f} ms"
+              f" ({threading.current_thread().name})", file=sys.stderr)
+
+def mark(p_name:str):
+    """Record a start-up milestone, e.g. first paint, if profiling."""
+    if profiling:
+        now = get_msec()
+        _phases.append((now, 0.0, p_name))
+        print(f"[startup] {now:9.1f} ms: {p_name}", file=sys.stderr)
+
+def report(p_file=None):
+    """Print the import times and the start-up phases and milestones in time order."""
+    if not profiling:
+        return
+    out = p_file or sys.stderr
+    builtins.__import__ = _real_import
+    print("\nStartup profile\n===============\nImports (inclusive ms):", file=out)
+    for depth, msec, name in _imports:
+        if depth <= REPORT_IMPORT_DEPTH and msec >= REPORT_MIN_MSEC:
+            print(f"{'    ' * (depth + 1)}{name:<{36 - 4*depth}} {msec:9.1f}", file=out)
+    print("Phases and milestones (ms since start):", file=out)
+    for end, msec, name in sorted(_phases):
+        print(f"    {end:9.1f}  {name}" + (f" ({msec:.1f} ms)" if msec else ""), file=out)
@@ -0,0 +1,198 @@
+##############################################################################################################################
+# coding=utf-8
+#
+# targetPicker.py
+#   -- random game targets, weighted by how common they are, that do NOT repeat for a player
+#      until every target of the pool has been played
+#
+# Copyright (c) 2026 Mark Sattolo <epistemik@gmail.com>
+
+__author_name__    = "Mark Sattolo"
+__author_email__   = "epistemik@gmail.com"
+__python_version__ = "3.10+"
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+import fcntl
+import getpass
+import hashlib
+import math
+import os
+import os.path as osp
+import random
+import struct
+from array import array
+from collections.abc import Callable
+from sys import byteorder
+from wordCorpus import GAMES_INPUT_FOLDER
+
+# optional word frequency list, one 'WORD count' per line, e.g. from a published corpus
+FREQUENCY_FILE = osp.join(GAMES_INPUT_FOLDER, "word_frequencies.txt")
+BAG_SUFFIX = ".bag"
+BAG_MAGIC = b"BAG1"
+# magic, number of targets, position of the next draw; followed by the order of the targets
+BAG_HEADER = struct.Struct("<4sII")
+POSITION_OFFSET = 8
+PLAYER_VARIABLE = "WORD_GAMES_PLAYER"
+
+def get_player() -> str:
+    """Name of the current player: from the environment if set, otherwise the login name."""
+    return os.environ.get(PLAYER_VARIABLE) or getpass.getuser()
+
+# the frequency list, loaded on first use
+_frequencies = None
+
+def get_word_weights(p_words):
+    """Commonness weight of each word: 1 + log10(1 + count) from FREQUENCY_FILE, so rare words still come up
+       >> None if there is NO frequency list, i.e. all words weigh the same"""
+    global _frequencies
+    if _frequencies is None:
+        _frequencies = {}
+        if osp.exists(FREQUENCY_FILE):
+            with open(FREQUENCY_FILE, encoding="utf-8") as ffile:
+                for line in ffile:
+                    fields = line.split()
+                    if len(fields) == 2 and fields[1].isdigit():
+                        _frequencies[fields[0].upper()] = int(fields[1])
+    if not _frequencies:
+        return None
+    return array('d', (1.0 + math.log10(1 + _frequencies.get(word, 0)) for word in p_words))
+
+
+class AliasTable:
+    """Walker's alias method: after an O(n) setup every weighted draw is one randrange() and one random(),
+       whatever the number or spread of the weights."""
+    def __init__(self, p_weights):
+        count = len(p_weights)
+        total = sum(p_weights)
+        if not count or total <= 0:
+            raise ValueError("Need at least one positive weight!")
+        scaled = [weight * count / total for weight in p_weights]
+        self.prob = array('d', [1.0]) * count
+        self.alias = array('I', range(count))
+        small = [idx for idx, weight in enumerate(scaled) if weight < 1.0]
+        large = [idx for idx, weight in enumerate(scaled) if weight >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large[-1]
+            # the rest of the slot of 'less' goes to 'more'
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            if scaled[more] < 1.0:
+                small.append(large.pop())
+        # any slots left over are full, up to rounding
+
+    def __len__(self) -> int:
+        return len(self.prob)
+
+    def draw(self, p_rng=random) -> int:
+        idx = p_rng.randrange(len(self.prob))
+        return idx if p_rng.random() < self.prob[idx] else self.alias[idx]
+# END class AliasTable
+
+
+class ShuffleBag:
+    """A player's order of every target of a pool: a weighted shuffle, so the common targets tend to come first.
+       Each draw takes the next target, so none repeats until the bag is empty; then it is refilled in a new order.
+       The order and the position are kept in p_file, which every draw reads and updates under an exclusive lock,
+       so several games of the same player share one bag; a draw only reads one entry and rewrites the position."""
+    def __init__(self, p_file:str, p_weights):
+        self.file = p_file
+        self.weights = p_weights
+
+    def _refill(self, p_bfile):
+        """Efraimidis-Spirakis weighted shuffle: sort by random key^(1/weight), done here as log(key)/weight;
+           written in place, as the lock is held on this file."""
+        keys = [math.log(1.0 - random.random()) / weight for weight in self.weights]
+        order = array('I', sorted(range(len(keys)), key=keys.__getitem__, reverse=True))
+        if byteorder != "little":
+            order.byteswap()
+        p_bfile.seek(0)
+        p_bfile.truncate()
+        p_bfile.write(BAG_HEADER.pack(BAG_MAGIC, len(order), 0))
+        order.tofile(p_bfile)
+
+    def _read_header(self, p_bfile) -> int:
+        """>> return the position of the next draw, or -1 if the file is NOT a bag of these targets"""
+        p_bfile.seek(0)
+        header = p_bfile.read(BAG_HEADER.size)
+        if len(header) != BAG_HEADER.size:
+            return -1
+        magic, count, position = BAG_HEADER.unpack(header)
+        return position if magic == BAG_MAGIC and count == len(self.weights) else -1
+
+    def _open(self):
+        """Open the bag for reading and writing, creating it if missing (NOT in append mode, which ignores seeks)."""
+        return os.fdopen(os.open(self.file, os.O_RDWR | os.O_CREAT, 0o644), "r+b")
+
+    def remaining(self) -> int:
+        with self._open() as bfile:
+            fcntl.flock(bfile, fcntl.LOCK_SH)
+            position = self._read_header(bfile)
+        return len(self.weights) - position if 0 <= position <= len(self.weights) else 0
+
+    def draw(self) -> int:
+        with self._open() as bfile:
+            fcntl.flock(bfile, fcntl.LOCK_EX)
+            position = self._read_header(bfile)
+            if not 0 <= position < len(self.weights):
+                self._refill(bfile)
+                position = 0
+            bfile.seek(BAG_HEADER.size + position * 4)
+            idx = int.from_bytes(bfile.read(4), "little")
+            bfile.seek(POSITION_OFFSET)
+            bfile.write((position + 1).to_bytes(4, "little"))
+            bfile.flush()
+        return idx
+# END class ShuffleBag
+
+
+class TargetPicker:
+    """Draws target indexes from a pool of p_count targets: from the player's shuffle bag if there is a player,
+       otherwise straight from the alias table, i.e. with repeats; either way weighted by p_weights (None = all equal)."""
+    def __init__(self, p_count:int, p_weights=None, p_bag_file:str=None):
+        self.weights = p_weights if p_weights is not None else array('d', [1.0]) * p_count
+        self.alias = AliasTable(self.weights)
+        self.bag = ShuffleBag(p_bag_file, self.weights) if p_bag_file else None
+        # bag entries drawn as duplicates by draw_distinct, served by the next draws
+        self._held = []
+
+    def draw(self) -> int:
+        if self._held:
+            return self._held.pop(0)
+        return self.bag.draw() if self.bag else self.alias.draw()
+
+    def draw_distinct(self, p_count:int) -> list:
+        """p_count different targets, e.g. for a multi-board game; a bag entry that repeats one of them
+           (only possible across a refill) is held back for the next draw instead of being lost."""
+        picks = []
+        held = []
+        while len(picks) < min(p_count, len(self.weights)):
+            idx = self.draw()
+            if idx not in picks:
+                picks.append(idx)
+            elif self.bag:
+                held.append(idx)
+        self._held.extend(held)
+        return picks
+# END class TargetPicker
+
+
+def get_bag_file(p_pool:str, p_key:str, p_player:str) -> str:
+    """Bag of a player for a pool of targets; p_key identifies the word list the pool is made from."""
+    player = "".join(char if char.isalnum() else '_' for char in p_player)
+    return osp.join(GAMES_INPUT_FOLDER, f"{p_pool}.{hashlib.sha256(p_key.encode()).hexdigest()[:16]}.{player}{BAG_SUFFIX}")
+
+# one picker per (pool, word list, player) in each process
+_pickers = {}
+
+def get_target_picker(p_pool:str, p_key:str, p_count:int, p_get_weights:Callable=None, p_player:str=None) -> TargetPicker:
+    """The target picker of a pool for a player (the current player if None, NO bag if empty);
+       p_get_weights() is only called, for the weights of the targets, when the picker is made."""
+    player = get_player() if p_player is None else p_player
+    key = (p_pool, p_key, player)
+    if key not in _pickers:
+        _pickers[key] = TargetPicker(p_count, p_get_weights() if p_get_weights else None,
+                                     get_bag_file(p_pool, p_key, player) if player else None)
+    return _pickers[key]
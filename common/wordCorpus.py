@@ -0,0 +1,303 @@
+##############################################################################################################################
+# coding=utf-8
+#
+# wordCorpus.py
+#   -- compile the word list modules into a packed binary corpus file and load it read-only via mmap;
+#      a tagged corpus also stores per-game tags for each word and is used through tag subset views
+#
+# Copyright (c) 2026 Mark Sattolo <epistemik@gmail.com>
+
+__author_name__    = "Mark Sattolo"
+__author_email__   = "epistemik@gmail.com"
+__python_version__ = "3.10+"
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+import hashlib
+import mmap
+import os
+import os.path as osp
+import struct
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+from enum import IntFlag
+from sys import argv, byteorder
+from threading import get_ident
+
+GAMES_FOLDER = osp.dirname(osp.dirname(osp.abspath(__file__)))
+GAMES_INPUT_FOLDER = osp.join(GAMES_FOLDER, "input")
+
+CORPUS_SUFFIX = ".wdc"
+CORPUS_MAGIC = b"WDCP"
+CORPUS_VERSION = 1
+# magic, version, flags, number of words, size of letters blob, sha256 of the word list (and tags)
+HEADER_FORMAT = "<4sHHII32s"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+WORD_ENCODING = "ascii"
+# header flag: a tags byte array follows the letters blob
+FLAG_TAGS = 0x01
+
+class WordTag(IntFlag):
+    """Which games use a word, and how."""
+    WORDLE_ANSWER  = 0x01
+    WORDLE_ALLOWED = 0x02
+    SB_ALLOWED     = 0x04
+    PANGRAM        = 0x08
+
+
+def get_tmp_file(p_file:str) -> str:
+    """Temporary name to write p_file under before renaming it: unique per process AND thread,
+       as a game may build the same file on its loading thread and on the GUI thread."""
+    return f"{p_file}.{os.getpid()}.{get_ident()}.tmp"
+
+def get_content_hash(p_words:list, p_tags:bytes=b"") -> bytes:
+    """sha256 of the sorted, newline-separated word list, followed by the tag bytes of a tagged corpus."""
+    content = hashlib.sha256("\n".join(p_words).encode(WORD_ENCODING))
+    content.update(p_tags)
+    return content.digest()
+
+def compile_corpus(p_words, p_outfile:str) -> str:
+    """Write the words as a sorted, packed binary corpus: header + offsets array + letters blob,
+       plus a tags array if p_words is a dict of word -> WordTag.
+       The file is written to a temporary name and renamed so that a running game never maps a partial file.
+       >> return the hex content hash"""
+    if isinstance(p_words, dict):
+        words = sorted(p_words)
+        tags = bytes(p_words[wd] for wd in words)
+    else:
+        words = sorted({wd.strip().upper() for wd in p_words if wd.strip()})
+        tags = b""
+    blob = "".join(words).encode(WORD_ENCODING)
+    offsets = array('I', [0])
+    for wd in words:
+        offsets.append(offsets[-1] + len(wd))
+    digest = get_content_hash(words, tags)
+    tmp_file = get_tmp_file(p_outfile)
+    with open(tmp_file, "wb") as outf:
+        outf.write(struct.pack(HEADER_FORMAT, CORPUS_MAGIC, CORPUS_VERSION, FLAG_TAGS if tags else 0,
+                               len(words), len(blob), digest))
+        write_array(outf, 'I', offsets)
+        outf.write(blob)
+        outf.write(tags)
+    os.replace(tmp_file, p_outfile)
+    return digest.hex()
+
+def get_array_view(p_buffer, p_start:int, p_typecode:str, p_count:int):
+    """Zero-copy view of a little-endian array stored in p_buffer (copied only on a big-endian machine).
+       >> return the view and the buffer position just after the array"""
+    end = p_start + array(p_typecode).itemsize * p_count
+    if byteorder == "little":
+        return memoryview(p_buffer)[p_start:end].cast(p_typecode), end
+    values = array(p_typecode, p_buffer[p_start:end])
+    values.byteswap()
+    return values, end
+
+def write_array(p_file, p_typecode:str, p_values):
+    """Write the values to p_file as a little-endian array."""
+    values = array(p_typecode, p_values)
+    if byteorder != "little":
+        values.byteswap()
+    p_file.write(values.tobytes())
+
+def get_word_blob(p_words, p_length:int) -> bytes:
+    """All the words of p_words, which must each have p_length letters, packed end to end:
+       so blob[pos::p_length] is the column of letters at position pos."""
+    get_bytes = getattr(p_words, "get_bytes", None)
+    blob = b"".join(get_bytes(idx) if get_bytes else p_words[idx].encode(WORD_ENCODING) for idx in range(len(p_words)))
+    if len(blob) != len(p_words) * p_length:
+        raise ValueError(f"All the words must have {p_length} letters!")
+    return blob
+
+
+class WordCorpus(Sequence):
+    """Read-only, sorted sequence of words backed by a memory-mapped corpus file.
+       Words are decoded to str only when accessed, and every process mapping the file shares the same pages."""
+    def __init__(self, p_file:str):
+        self.file = p_file
+        with open(p_file, "rb") as cfile:
+            self._map = mmap.mmap(cfile.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, flags, self._count, blob_size, digest = struct.unpack_from(HEADER_FORMAT, self._map)
+        if magic != CORPUS_MAGIC or version != CORPUS_VERSION:
+            self._map.close()
+            raise ValueError(f"'{p_file}' is NOT a version {CORPUS_VERSION} word corpus file!")
+        self.digest = digest.hex()
+        self._offsets, offsets_end = get_array_view(self._map, HEADER_SIZE, 'I', self._count + 1)
+        self._blob = memoryview(self._map)[offsets_end:offsets_end + blob_size]
+        # WordTag value of each word, if a tagged corpus
+        self.tags = memoryview(self._map)[offsets_end + blob_size:offsets_end + blob_size + self._count] \
+            if flags & FLAG_TAGS else None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def get_bytes(self, p_idx:int) -> bytes:
+        return self._blob[self._offsets[p_idx]:self._offsets[p_idx+1]].tobytes()
+
+    def __getitem__(self, p_idx):
+        if isinstance(p_idx, slice):
+            return [self[i] for i in range(*p_idx.indices(self._count))]
+        if p_idx < 0:
+            p_idx += self._count
+        if not 0 <= p_idx < self._count:
+            raise IndexError("word corpus index out of range")
+        return self.get_bytes(p_idx).decode(WORD_ENCODING)
+
+    def find(self, p_word:str) -> int:
+        """Binary search for the word >> return its index or -1 if NOT in the corpus."""
+        try:
+            key = p_word.encode(WORD_ENCODING)
+        except UnicodeEncodeError:
+            return -1
+        idx = bisect_left(range(self._count), key, key=self.get_bytes)
+        return idx if idx < self._count and self.get_bytes(idx) == key else -1
+
+    def __contains__(self, p_word) -> bool:
+        return isinstance(p_word, str) and self.find(p_word) >= 0
+
+    def index(self, p_word, start:int=0, stop:int=None) -> int:
+        idx = self.find(p_word) if isinstance(p_word, str) else -1
+        if idx < start or (stop is not None and idx >= stop):
+            raise ValueError(f"'{p_word}' is NOT in the word corpus")
+        return idx
+
+    def count(self, p_word) -> int:
+        return 1 if p_word in self else 0
+
+    def close(self):
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        if self.tags is not None:
+            self.tags.release()
+        self._blob.release()
+        self._map.close()
+# END class WordCorpus
+
+
+class WordSubset(Sequence):
+    """Read-only, sorted sequence of the words at the given (ascending) positions of a corpus or view.
+       Words are decoded to str only when accessed."""
+    def __init__(self, p_corpus:Sequence, p_positions):
+        self.corpus = p_corpus
+        self._positions = p_positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __iter__(self):
+        for pos in self._positions:
+            yield self.corpus.get_bytes(pos).decode(WORD_ENCODING)
+
+    def get_bytes(self, p_idx:int) -> bytes:
+        return self.corpus.get_bytes(self._positions[p_idx])
+
+    def __getitem__(self, p_idx):
+        if isinstance(p_idx, slice):
+            return [self[i] for i in range(*p_idx.indices(len(self._positions)))]
+        return self.corpus[self._positions[p_idx]]
+
+    def find(self, p_word:str) -> int:
+        """Binary search for the word >> return its index in the subset or -1 if NOT in the subset."""
+        try:
+            key = p_word.encode(WORD_ENCODING)
+        except UnicodeEncodeError:
+            return -1
+        count = len(self._positions)
+        idx = bisect_left(range(count), key, key=self.get_bytes)
+        return idx if idx < count and self.get_bytes(idx) == key else -1
+
+    def __contains__(self, p_word) -> bool:
+        return isinstance(p_word, str) and self.find(p_word) >= 0
+
+    def index(self, p_word, start:int=0, stop:int=None) -> int:
+        idx = self.find(p_word) if isinstance(p_word, str) else -1
+        if idx < start or (stop is not None and idx >= stop):
+            raise ValueError(f"'{p_word}' is NOT in this word list")
+        return idx
+
+    def count(self, p_word) -> int:
+        return 1 if p_word in self else 0
+# END class WordSubset
+
+
+class WordTable(Sequence):
+    """Compact, read-only table of words kept as one ASCII blob plus an offsets array, with NO per-word str objects:
+       a str is made only when a word is accessed."""
+    def __init__(self, p_words=()):
+        keys = [wd.encode(WORD_ENCODING) if isinstance(wd, str) else bytes(wd) for wd in p_words]
+        self._blob = b"".join(keys)
+        self._offsets = array('I', [0])
+        for key in keys:
+            self._offsets.append(self._offsets[-1] + len(key))
+        self.is_sorted = all(keys[i] <= keys[i+1] for i in range(len(keys) - 1))
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def get_bytes(self, p_idx:int) -> bytes:
+        return self._blob[self._offsets[p_idx]:self._offsets[p_idx+1]]
+
+    def __getitem__(self, p_idx):
+        if isinstance(p_idx, slice):
+            return [self[i] for i in range(*p_idx.indices(len(self)))]
+        if p_idx < 0:
+            p_idx += len(self)
+        if not 0 <= p_idx < len(self):
+            raise IndexError("word table index out of range")
+        return self.get_bytes(p_idx).decode(WORD_ENCODING)
+
+    def find(self, p_word:str) -> int:
+        """Binary search if sorted, otherwise a scan of the blob >> return the index of the word or -1 if NOT there."""
+        try:
+            key = p_word.encode(WORD_ENCODING)
+        except UnicodeEncodeError:
+            return -1
+        count = len(self)
+        if self.is_sorted:
+            idx = bisect_left(range(count), key, key=self.get_bytes)
+            return idx if idx < count and self.get_bytes(idx) == key else -1
+        return next((idx for idx in range(count) if self.get_bytes(idx) == key), -1)
+
+    def __contains__(self, p_word) -> bool:
+        return isinstance(p_word, str) and self.find(p_word) >= 0
+
+    def get_nbytes(self) -> int:
+        return len(self._blob) + self._offsets.itemsize * len(self._offsets)
+# END class WordTable
+
+
+def get_view_file(p_corpus:WordCorpus, p_tags:WordTag) -> str:
+    """(Virtual) file name of a tagged corpus view, which names the cache files derived from the view."""
+    tag_name = (p_tags.name or str(int(p_tags))).lower().replace('|', '+')
+    return osp.splitext(p_corpus.file)[0] + f".{tag_name}{CORPUS_SUFFIX}"
+
+
+class CorpusView(WordSubset):
+    """The words in a tagged corpus that have all the given tags, with their own content hash.
+       Derived cache files are named after the (virtual) file name of the view.
+       With an index cache (see indexCache.py) the positions and hash come from the mapped cache file,
+       and the word and mask indexes of the view use the cache instead of building their own tables."""
+    def __init__(self, p_corpus:WordCorpus, p_tags:WordTag, p_cache=None):
+        if p_corpus.tags is None:
+            raise ValueError(f"'{p_corpus.file}' is NOT a tagged word corpus!")
+        self.tags = p_tags
+        self.cache = p_cache
+        if p_cache:
+            super().__init__(p_corpus, p_cache.positions)
+            self.digest = p_cache.digest
+        else:
+            super().__init__(p_corpus, array('I', (pos for pos, tag in enumerate(p_corpus.tags) if tag & p_tags == p_tags)))
+            self.digest = get_content_hash(list(self)).hex()
+        self.file = get_view_file(p_corpus, p_tags)
+# END class CorpusView
+
+
+if __name__ == "__main__":
+    # the games share ONE tagged corpus of all the word lists, so compile it the same way the games do
+    from corpusBuilder import TAGGED_CORPUS_FILE, build_tagged_corpus
+    if len(argv) > 1:
+        print(f"Usage: python3 {osp.basename(argv[0])}\nCompile all the word lists into '{TAGGED_CORPUS_FILE}'.")
+        exit(0)
+    content_hash, errors = build_tagged_corpus()
+    print(f"{TAGGED_CORPUS_FILE}: {len(WordCorpus(TAGGED_CORPUS_FILE)):,} words; hash = {content_hash}; {len(errors)} problems")
+    exit(0)
@@ -0,0 +1,69 @@
+##############################################################################################################################
+# coding=utf-8
+#
+# wordIndex.py
+#   -- hashed lookups over a word corpus: membership, corpus positions and length buckets
+#
+# Copyright (c) 2026 Mark Sattolo <epistemik@gmail.com>
+
+__author_name__    = "Mark Sattolo"
+__author_email__   = "epistemik@gmail.com"
+__python_version__ = "3.10+"
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+from array import array
+from collections.abc import Sequence
+from wordCorpus import WordSubset
+
+class WordIndex:
+    """O(1) membership and corpus position lookups plus length-bucket views, built once per corpus.
+       A corpus view with an index cache supplies the hash table and buckets from the shared cache file,
+       so nothing is built in this process. Plural and inflection lookups are in morphology.py."""
+    def __init__(self, p_corpus:Sequence):
+        self.corpus = p_corpus
+        self.digest = getattr(p_corpus, "digest", "")
+        self._cache = getattr(p_corpus, "cache", None)
+        self._words = None if self._cache else {wd: pos for pos, wd in enumerate(p_corpus)}
+        self._buckets = None
+
+    def __contains__(self, p_word) -> bool:
+        return self.position(p_word) >= 0
+
+    def __len__(self) -> int:
+        return len(self.corpus)
+
+    def position(self, p_word:str) -> int:
+        """Position of p_word in the corpus, or -1 if NOT in the corpus."""
+        if self._cache:
+            return self._cache.find(p_word, self.corpus)
+        return self._words.get(p_word, -1)
+
+    def load_length_buckets(self):
+        """Split the corpus by word length in a single pass; each bucket keeps the (sorted) corpus order."""
+        if self._cache:
+            return
+        buckets = {}
+        for pos, wd in enumerate(self.corpus):
+            buckets.setdefault(len(wd), array('I')).append(pos)
+        self._buckets = {wlen: WordSubset(self.corpus, positions) for wlen, positions in buckets.items()}
+
+    def length_bucket(self, p_len:int) -> Sequence:
+        """Shared, immutable view of all the corpus words with the given length."""
+        if self._cache:
+            return WordSubset(self.corpus, self._cache.get_bucket(p_len))
+        if self._buckets is None:
+            self.load_length_buckets()
+        return self._buckets.get(p_len, WordSubset(self.corpus, array('I')))
+# END class WordIndex
+
+
+# one index per corpus in each process
+_indexes = {}
+
+def get_word_index(p_corpus:Sequence) -> WordIndex:
+    """Build the index for a corpus the first time it is requested, then share it."""
+    key = getattr(p_corpus, "digest", None) or id(p_corpus)
+    if key not in _indexes:
+        _indexes[key] = WordIndex(p_corpus)
+    return _indexes[key]
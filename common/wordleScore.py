@@ -0,0 +1,122 @@
+##############################################################################################################################
+# coding=utf-8
+#
+# wordleScore.py
+#   -- Wordle feedback for a guess as one ternary score code, for a single target
+#      or for thousands of targets at once
+#
+# Copyright (c) 2026 Mark Sattolo <epistemik@gmail.com>
+
+__author_name__    = "Mark Sattolo"
+__author_email__   = "epistemik@gmail.com"
+__python_version__ = "3.10+"
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+from array import array
+from enum import IntEnum
+from sys import byteorder
+from wordCorpus import WORD_ENCODING, get_word_blob
+
+class Mark(IntEnum):
+    """Feedback for each letter of a guess; also the ternary digit of that position in a score code."""
+    ABSENT  = 0 # grey
+    PRESENT = 1 # yellow
+    EXACT   = 2 # green
+
+MARK_SYMBOLS = {Mark.ABSENT:'.', Mark.PRESENT:'+', Mark.EXACT:'*'}
+
+def get_score_typecode(p_length:int) -> str:
+    """Smallest unsigned array typecode that holds every score code of words with p_length letters."""
+    num_codes = 3 ** p_length
+    return 'B' if num_codes <= 0x100 else 'H' if num_codes <= 0x10000 else 'I'
+
+def get_solved_score(p_length:int) -> int:
+    """Score code of a guess that IS the target, i.e. all letters exact."""
+    return 3 ** p_length - 1
+
+def score(p_guess:str, p_target:str) -> int:
+    """Wordle feedback for a guess as a code with one ternary digit (a Mark) per letter, position 0 the lowest.
+       Exact letters are marked first, then each remaining target letter marks at most one other occurrence
+       of it in the guess, from the left; so repeated letters are only marked as often as the target has them."""
+    remaining = [tlett for glett, tlett in zip(p_guess, p_target) if glett != tlett]
+    code = 0
+    weight = 1
+    for glett, tlett in zip(p_guess, p_target):
+        if glett == tlett:
+            code += Mark.EXACT * weight
+        elif glett in remaining:
+            code += Mark.PRESENT * weight
+            remaining.remove(glett)
+        weight *= 3
+    return code
+
+def decode_score(p_code:int, p_length:int) -> list:
+    """>> return the Mark of each position of a score code"""
+    marks = []
+    for _ in range(p_length):
+        p_code, digit = divmod(p_code, 3)
+        marks.append(Mark(digit))
+    return marks
+
+def format_score(p_code:int, p_length:int) -> str:
+    return "".join(MARK_SYMBOLS[mark] for mark in decode_score(p_code, p_length))
+
+def get_marks(p_guess:str, p_target:str) -> list:
+    return decode_score(score(p_guess, p_target), len(p_guess))
+
+
+# translation tables that turn a column of letters into a 0/1 flag byte per word
+_flag_tables = {}
+
+def _get_flag_table(p_code:int) -> bytes:
+    if p_code not in _flag_tables:
+        table = bytearray(256)
+        table[p_code] = 1
+        _flag_tables[p_code] = bytes(table)
+    return _flag_tables[p_code]
+
+def _to_lanes(p_flags:bytes, p_width:int) -> int:
+    """One small value per word, from p_flags, each in its own little-endian lane of p_width bytes of a python int;
+       lanes can then be added, compared and masked for ALL the words with a few big-int operations."""
+    if p_width > 1:
+        lanes = bytearray(len(p_flags) * p_width)
+        lanes[::p_width] = p_flags
+        p_flags = lanes
+    return int.from_bytes(p_flags, "little")
+
+def score_batch(p_guess:str, p_targets, p_blob:bytes=None) -> array:
+    """Score one guess against every word of p_targets, which must all have the length of the guess
+       (or against the words packed in p_blob, if given).
+       The same rules as score(), worked one letter position at a time across all the targets at once:
+       every word gets a lane of a big int wide enough for a score code, and the per-position flags are
+       made from columns of the packed targets with bytes.translate, so there is no python loop over the targets.
+       >> return an array of the score codes, in the order of p_targets"""
+    length = len(p_guess)
+    blob = get_word_blob(p_targets, length) if p_blob is None else p_blob
+    count = len(blob) // length
+    typecode = get_score_typecode(length)
+    width = array(typecode).itemsize
+    guess = p_guess.encode(WORD_ENCODING)
+    columns = [blob[pos::length] for pos in range(length)]
+    ones = _to_lanes(b"\x01" * count, width)
+    exact = [_to_lanes(columns[pos].translate(_get_flag_table(guess[pos])), width) for pos in range(length)]
+    total = sum(flags * (Mark.EXACT * 3**pos) for pos, flags in enumerate(exact))
+    for code in set(guess):
+        places = [pos for pos in range(length) if guess[pos] == code]
+        table = _get_flag_table(code)
+        # how many of this letter each target has that are NOT matched exactly
+        remaining = sum(_to_lanes(column.translate(table), width) for column in columns) \
+                    - sum(exact[pos] for pos in places)
+        before = 0 # earlier NON-exact occurrences of the letter in the guess
+        for pos in places:
+            inexact = ones ^ exact[pos]
+            # lane >= 16, i.e. bit 4 set, exactly when remaining > before; all lanes stay in 2..28 so NO borrows
+            present = ((remaining + 15 * ones - before) >> 4) & ones & inexact
+            total += present * (Mark.PRESENT * 3**pos)
+            before += inexact
+    scores = array(typecode)
+    scores.frombytes(total.to_bytes(count * width, "little"))
+    if byteorder != "little":
+        scores.byteswap()
+    return scores
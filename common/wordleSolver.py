@@ -0,0 +1,90 @@
+##############################################################################################################################
+# coding=utf-8
+#
+# wordleSolver.py
+#   -- find the Wordle guess that is expected to tell the most about the target,
+#      given the candidate words that still fit the feedback so far
+#
+# Copyright (c) 2026 Mark Sattolo <epistemik@gmail.com>
+
+__author_name__    = "Mark Sattolo"
+__author_email__   = "epistemik@gmail.com"
+__python_version__ = "3.10+"
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+from collections import Counter
+from collections.abc import Callable, Sequence
+from math import log2
+from operator import itemgetter
+from typing import NamedTuple
+from patternIndex import get_bit_indexes
+from wordCorpus import get_word_blob
+from wordleScore import score_batch
+
+# guesses scored between progress reports and checks for cancellation
+PROGRESS_STEP = 256
+
+class Hint(NamedTuple):
+    guess: str
+    info_bits: float       # expected information from the feedback, in bits
+    expected_left: float   # expected number of candidates left after the guess
+    is_candidate: bool     # the guess could be the target
+
+
+def get_expected_info(p_codes) -> tuple:
+    """Split the candidates by the score code each gives for one guess.
+       >> return the entropy of the split in bits and the expected size of the part the target is in"""
+    count = len(p_codes)
+    sizes = Counter(p_codes).values()
+    return log2(count) - sum(map(_get_xlogx(count).__getitem__, sizes)) / count, sum(size * size for size in sizes) / count
+
+# size * log2(size) for every possible part size
+_xlogx = [0.0]
+
+def _get_xlogx(p_count:int) -> list:
+    while len(_xlogx) <= p_count:
+        _xlogx.append(len(_xlogx) * log2(len(_xlogx)))
+    return _xlogx
+
+def find_best_guess(p_guesses:Sequence, p_answers:Sequence, p_candidates:int, p_get_row:Callable=None,
+                    p_progress:Callable=None, p_cancelled:Callable=None):
+    """Try every guess in p_guesses against the candidates (a bitset over p_answers) and pick the most informative;
+       a guess that could itself be the target wins a tie. Each guess is one batched lookup: the candidates' entries
+       of its row from p_get_row(index of the guess in p_guesses), e.g. a pattern matrix row, or else the batch scorer
+       run on just the candidates.
+       p_progress(done, total) is called and p_cancelled() checked every PROGRESS_STEP guesses.
+       >> return the best Hint, or None if cancelled or there are NO candidates"""
+    candidates = get_bit_indexes(p_candidates)
+    if not candidates:
+        return None
+    candidate_words = [p_answers[idx] for idx in candidates]
+    if len(candidates) <= 2:
+        # just guess one of them
+        return Hint(candidate_words[0], float(len(candidates) - 1), 1.0 if len(candidates) > 1 else 0.0, True)
+    all_answers = len(candidates) == len(p_answers)
+    pick = itemgetter(*candidates)
+    blob = None if p_get_row else get_word_blob(candidate_words, len(candidate_words[0]))
+    candidate_set = set(candidate_words)
+    best = None
+    total = len(p_guesses)
+    for done, guess in enumerate(p_guesses):
+        if done % PROGRESS_STEP == 0:
+            if p_cancelled and p_cancelled():
+                return None
+            if p_progress:
+                p_progress(done, total)
+        if blob is None:
+            row = p_get_row(done)
+            if row is None:
+                continue
+            codes = row if all_answers else pick(row)
+        else:
+            codes = score_batch(guess, None, blob)
+        info, left = get_expected_info(codes)
+        hint = Hint(guess, info, left, guess in candidate_set)
+        if best is None or (hint.info_bits, hint.is_candidate) > (best.info_bits, best.is_candidate):
+            best = hint
+    if p_progress:
+        p_progress(total, total)
+    return best
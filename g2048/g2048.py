@@ -13,11 +13,14 @@ __author_name__    = "Mark Sattolo"
 __author_email__   = "epistemik@gmail.com"
 __python_version__ = "3.10+"
 __created__ = "2026-03-09"
-__updated__ = "2026-04-01"
+__updated__ = "2026-10-18"
 
+from sys import path
+path.append("/home/marksa/git/Python/Games/common")
+from startupProfile import mark, phase, profile_imports
+profile_imports()
 import pygame
 import random
-from sys import path
 path.append("/home/marksa/git/Python/utils")
 from mhsLogging import *
 
@@ -140,6 +143,7 @@ def run():
     won = False
     lost = False
     running = True
+    first_frame = True
     while running:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -190,6 +194,9 @@ def run():
             frame.blit(lostext, ltext_rect)
 
         pygame.display.flip()
+        if first_frame:
+            mark("first paint")
+            first_frame = False
 
     pygame.quit()
 
@@ -200,8 +207,10 @@ if __name__ == "__main__":
     code = 0
     try:
         lgr = log_control.get_logger()
-        pygame.init()
-        gfont = pygame.font.SysFont('arial', 40)
+        with phase("init pygame"):
+            pygame.init()
+        with phase("load font"):
+            gfont = pygame.font.SysFont('arial', 40)
         run()
     except KeyboardInterrupt as mki:
         log_control.exception(mki)